@@ -0,0 +1,132 @@
+"""Count per-glyph allocations of the legacy and the buffer-reusing render path.
+
+Each glyph is rendered, cleaned, skeletonized and pruned twice: once the way
+the pipeline worked before worker scratch buffers (a fresh ``Image.new``
+canvas, a full-canvas ``np.array`` copy, a thresholded copy and copying
+cleanup, reproduced below as :func:`legacy_render`) and once the way workers
+run it now (reused per-thread canvas and mask, in-place cleanup).  Between
+tracemalloc snapshots taken before and after each stage the outputs are kept
+alive, so the table lists the memory blocks and KiB each stage allocated and
+still held at its end, averaged per glyph after a warm-up glyph.  Temporaries
+freed inside a stage show up in the peak column instead: the traced peak
+above the level at the stage start.  Pillow's native canvas buffer is not
+traced.  Times come from a separate pass without tracing.
+
+    python benchmarks/bench_allocations.py --font /path/to/font.otf --canvas-px 2200
+"""
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from font_length.morph import skeletonize_clean
+from font_length.raster import _center_position, _glyph_bbox, _load_font, _trim_margin, render_glyph_to_binary
+
+_STAGES = ("render", "skeleton")
+
+
+def legacy_render(char: str, font_path: str | Path, point_px: int, canvas_px: int, margin_px: int) -> np.ndarray:
+    """Render ``char`` the way ``render_glyph_to_binary`` did before buffer reuse."""
+
+    from skimage.filters import threshold_otsu
+
+    font = _load_font(font_path, point_px)
+    image = Image.new("L", (canvas_px, canvas_px), 0)
+    draw = ImageDraw.Draw(image)
+    x, y = _center_position(canvas_px, _glyph_bbox(font, char))
+    draw.text((x, y), char, fill=255, font=font)
+    arr = np.array(image, dtype=np.uint8)
+    threshold = threshold_otsu(arr) if arr.any() else 0
+    mask = _trim_margin(arr > threshold, margin_px)
+    return mask.astype(bool)
+
+
+def _glyph(ch: str, args: argparse.Namespace, reuse: bool) -> tuple[np.ndarray, np.ndarray]:
+    if reuse:
+        bw = render_glyph_to_binary(ch, args.font, args.point_px, args.canvas_px, args.margin_px, reuse_buffers=True)
+    else:
+        bw = legacy_render(ch, args.font, args.point_px, args.canvas_px, args.margin_px)
+    return bw, skeletonize_clean(bw, 48, 8, in_place=reuse)
+
+
+def _allocated(before: tracemalloc.Snapshot, after: tracemalloc.Snapshot) -> tuple[int, int]:
+    diff = after.compare_to(before, "lineno")
+    return sum(max(d.count_diff, 0) for d in diff), sum(max(d.size_diff, 0) for d in diff)
+
+
+def _snapshot(ignore: list[tracemalloc.Filter]) -> tuple[tracemalloc.Snapshot, int]:
+    snapshot = tracemalloc.take_snapshot().filter_traces(ignore)
+    tracemalloc.reset_peak()
+    return snapshot, tracemalloc.get_traced_memory()[0]
+
+
+def _count(chars: str, args: argparse.Namespace, reuse: bool) -> dict[str, tuple[float, float, float]]:
+    """Return mean ``(blocks, bytes, peak bytes)`` allocated per glyph and stage."""
+
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    totals = {stage: [0, 0, 0] for stage in _STAGES}
+    tracemalloc.start()
+    try:
+        for i, ch in enumerate(chars):
+            snap0, level0 = _snapshot(ignore)
+            if reuse:
+                bw = render_glyph_to_binary(
+                    ch, args.font, args.point_px, args.canvas_px, args.margin_px, reuse_buffers=True
+                )
+            else:
+                bw = legacy_render(ch, args.font, args.point_px, args.canvas_px, args.margin_px)
+            peak0 = tracemalloc.get_traced_memory()[1] - level0
+            snap1, level1 = _snapshot(ignore)
+            skel = skeletonize_clean(bw, 48, 8, in_place=reuse)
+            peak1 = tracemalloc.get_traced_memory()[1] - level1
+            snap2, _ = _snapshot(ignore)
+            del bw, skel
+            if i == 0:
+                continue  # warm-up: font loading and scratch buffer creation
+            for stage, before, after, peak in zip(_STAGES, (snap0, snap1), (snap1, snap2), (peak0, peak1)):
+                blocks, size = _allocated(before, after)
+                totals[stage][0] += blocks
+                totals[stage][1] += size
+                totals[stage][2] += peak
+    finally:
+        tracemalloc.stop()
+    n = max(len(chars) - 1, 1)
+    return {stage: (blocks / n, size / n, peak / n) for stage, (blocks, size, peak) in totals.items()}
+
+
+def _time(chars: str, args: argparse.Namespace, reuse: bool) -> float:
+    _glyph(chars[0], args, reuse)  # warm-up
+    start = time.perf_counter()
+    for ch in chars[1:]:
+        _glyph(ch, args, reuse)
+    return (time.perf_counter() - start) / max(len(chars) - 1, 1)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--font", required=True)
+    parser.add_argument("--chars", default="永鬱識驚議護響鑑騰曜競躍顧艦臓")
+    parser.add_argument("--point-px", type=int, default=1800)
+    parser.add_argument("--canvas-px", type=int, default=2200)
+    parser.add_argument("--margin-px", type=int, default=128)
+    args = parser.parse_args(argv)
+
+    header = " ".join(f"{stage + ' blocks':>15} {stage + ' KiB':>13} {'peak KiB':>9}" for stage in _STAGES)
+    print(f"{'mode':8} {header} {'ms/glyph':>9}")
+    for label, reuse in (("legacy", False), ("reuse", True)):
+        counts = _count(args.chars, args, reuse)
+        seconds = _time(args.chars, args, reuse)
+        cells = " ".join(
+            f"{blocks:15.1f} {size / 1024:13.1f} {peak / 1024:9.1f}" for blocks, size, peak in map(counts.get, _STAGES)
+        )
+        print(f"{label:8} {cells} {1000 * seconds:9.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,56 @@
+"""Compare the process and thread executors at several worker counts.
+
+Glyphs are measured in memory through :func:`font_length.measure_chars`, so
+only the compute path and the executor overhead are timed.  Peak RSS covers
+the benchmark process and, for the process executor, its largest worker.
+
+    python benchmarks/bench_executors.py --font /path/to/font.otf --workers 1 2 4 8
+"""
+from __future__ import annotations
+
+import argparse
+import resource
+import sys
+import time
+
+from font_length import Config, measure_chars
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--font", required=True)
+    parser.add_argument("--chars", default="永鬱識驚議護響鑑騰曜競躍顧艦臓")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--point-px", type=int, default=900)
+    parser.add_argument("--canvas-px", type=int, default=1100)
+    parser.add_argument("--margin-px", type=int, default=64)
+    args = parser.parse_args(argv)
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]} (GIL {'enabled' if gil else 'disabled'})")
+    print(f"{'executor':8} {'workers':>7} {'seconds':>8} {'glyphs/s':>9} {'self MiB':>9} {'child MiB':>10}")
+    for executor in ("process", "thread"):
+        for workers in args.workers:
+            cfg = Config(
+                font_path=args.font,
+                point_px=args.point_px,
+                canvas_px=args.canvas_px,
+                margin_px=args.margin_px,
+                executor=executor,
+                schedule="input",
+            )
+            start = time.perf_counter()
+            result = measure_chars(args.chars, cfg, workers=workers)
+            elapsed = time.perf_counter() - start
+            self_peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            child_peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+            done = len(result.records)
+            print(
+                f"{executor:8} {workers:7d} {elapsed:8.2f} {done / elapsed:9.1f} "
+                f"{self_peak:9.0f} {child_peak:10.0f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,78 @@
+"""Startup-time regression benchmark based on ``python -X importtime``.
+
+Each target is imported in a fresh interpreter; the cumulative import time of
+the target module is reported together with any heavy dependency that was
+pulled in.  The script exits with status 1 when a target exceeds its budget or
+imports a module it must not load, so it can gate CI.
+
+    python benchmarks/bench_import_time.py --repeat 5
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ("numpy", "skimage", "scipy", "PIL", "tqdm", "requests", "pydantic")
+
+# target module -> (budget in milliseconds, modules that must stay unloaded)
+TARGETS: dict[str, tuple[float, tuple[str, ...]]] = {
+    "font_length": (50.0, HEAVY_MODULES),
+    "font_length.cli": (50.0, HEAVY_MODULES),
+    "font_length.backends": (50.0, HEAVY_MODULES),
+    "font_length.config": (400.0, ("numpy", "skimage", "scipy", "PIL", "tqdm", "requests")),
+    "font_length.pipeline": (3000.0, ("tqdm", "requests", "pydantic")),
+}
+
+
+def _measure(module: str) -> tuple[float, set[str]]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative_us = 0
+    loaded: set[str] = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        name = name.strip()
+        if not cumulative.strip().isdigit():
+            continue
+        loaded.add(name.split(".")[0])
+        if name == module:
+            cumulative_us = int(cumulative)
+    return cumulative_us / 1000.0, loaded
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreters per target")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every budget (slow machines)")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for module, (budget_ms, forbidden) in TARGETS.items():
+        samples = []
+        loaded: set[str] = set()
+        for _ in range(max(args.repeat, 1)):
+            elapsed, loaded = _measure(module)
+            samples.append(elapsed)
+        median = statistics.median(samples)
+        leaked = sorted(m for m in forbidden if m in loaded)
+        heavy = sorted(m for m in HEAVY_MODULES if m in loaded)
+        over = median > budget_ms * args.scale
+        status = "FAIL" if over or leaked else "ok"
+        failed |= status == "FAIL"
+        print(
+            f"{status:4} {module:24} median={median:8.1f}ms budget={budget_ms * args.scale:7.1f}ms "
+            f"heavy={','.join(heavy) or '-'}" + (f" leaked={','.join(leaked)}" if leaked else "")
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
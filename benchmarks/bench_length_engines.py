@@ -0,0 +1,63 @@
+"""Compare the distance-transform length estimate with the skeleton engine.
+
+Every character is measured by both engines in this process after a warm-up.
+The report lists the time per glyph and speedup, the relative error of the
+estimate against the traced length and the Spearman rank correlation, which
+is what matters when the estimate is used to rank glyph complexity.
+
+    python benchmarks/bench_length_engines.py --font /path/to/font.otf --canvas-px 2200
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+from scipy.stats import spearmanr
+
+from font_length.config import Config
+from font_length.pipeline import _process_char, _worker_config
+
+
+def _measure(chars: str, cfg) -> tuple[dict[str, float], float]:
+    _process_char(chars[0], cfg)
+    lengths: dict[str, float] = {}
+    start = time.perf_counter()
+    for ch in chars:
+        _, metrics, _ = _process_char(ch, cfg)
+        if metrics is not None:
+            lengths[ch] = metrics["total_length"]
+    return lengths, (time.perf_counter() - start) / len(chars)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--font", required=True)
+    parser.add_argument("--chars", default="永鬱識驚議護響鑑騰曜競躍顧艦臓一二三人山川日月木水火土")
+    parser.add_argument("--point-px", type=int, default=1800)
+    parser.add_argument("--canvas-px", type=int, default=2200)
+    parser.add_argument("--margin-px", type=int, default=128)
+    args = parser.parse_args(argv)
+
+    base = Config(font_path=args.font, point_px=args.point_px, canvas_px=args.canvas_px, margin_px=args.margin_px)
+    traced, skeleton_s = _measure(args.chars, _worker_config(base))
+    estimated, distance_s = _measure(args.chars, _worker_config(base.model_copy(update={"engine": "distance"})))
+
+    common = [ch for ch in args.chars if ch in traced and ch in estimated]
+    reference = np.array([traced[ch] for ch in common])
+    estimate = np.array([estimated[ch] for ch in common])
+    error = (estimate - reference) / reference
+    print(f"{'engine':10} {'ms/glyph':>9}")
+    print(f"{'skeleton':10} {1000 * skeleton_s:9.1f}")
+    print(f"{'distance':10} {1000 * distance_s:9.1f}")
+    print(f"speedup {skeleton_s / distance_s:.2f}x over {len(common)} glyph(s)")
+    print(
+        f"relative error: mean {np.mean(error):+.3f}, mean abs {np.mean(np.abs(error)):.3f}, "
+        f"max abs {np.max(np.abs(error)):.3f}"
+    )
+    print(f"Spearman rank correlation {spearmanr(reference, estimate).statistic:.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
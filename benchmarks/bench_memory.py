@@ -0,0 +1,75 @@
+"""Report per-stage peak memory of the glyph pipeline.
+
+Glyphs are processed in this process with ``memory_profile`` enabled, so every
+stage reports its tracemalloc peak and peak-RSS growth.  ``--json`` writes the
+aggregated profile for comparison across commits; ``--baseline`` compares
+against such a file and exits non-zero when a stage's maximum peak grew by
+more than ``--tolerance``.
+
+    python benchmarks/bench_memory.py --font /path/to/font.otf --canvas-px 2200
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from font_length.config import Config
+from font_length.memprofile import MemoryProfile
+from font_length.pipeline import _process_char, _worker_config
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--font", required=True)
+    parser.add_argument("--chars", default="永鬱識驚議護響鑑騰曜競躍顧艦臓")
+    parser.add_argument("--point-px", type=int, default=1800)
+    parser.add_argument("--canvas-px", type=int, default=2200)
+    parser.add_argument("--margin-px", type=int, default=128)
+    parser.add_argument("--json", type=Path, help="Write the aggregated profile to this file")
+    parser.add_argument("--baseline", type=Path, help="Profile written by an earlier --json run")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Allowed relative growth per stage")
+    args = parser.parse_args(argv)
+
+    cfg = _worker_config(
+        Config(
+            font_path=args.font,
+            point_px=args.point_px,
+            canvas_px=args.canvas_px,
+            margin_px=args.margin_px,
+            memory_profile=True,
+        )
+    )
+    profile = MemoryProfile()
+    for ch in args.chars:
+        _, metrics, failure = _process_char(ch, cfg)
+        if metrics is not None:
+            profile.add(ch, metrics["memory"])
+        else:
+            print(f"{ch}: {failure.reason if failure else 'failed'}")
+    report = profile.to_dict()
+
+    print(f"{'stage':10} {'max MiB':>8} {'mean MiB':>9} {'max char':>8} {'RSS growth MiB':>15}")
+    for stage, row in report["stages"].items():
+        print(
+            f"{stage:10} {row['max_traced_peak_bytes'] / 2**20:8.2f} {row['mean_traced_peak_bytes'] / 2**20:9.2f} "
+            f"{row['max_char']:>8} {row['rss_growth_bytes'] / 2**20:15.2f}"
+        )
+    print("worst glyphs: " + ", ".join(f"{g['char']} ({g['stage']})" for g in report["worst_glyphs"]))
+
+    if args.json:
+        args.json.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    status = 0
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["stages"]
+        for stage, row in report["stages"].items():
+            before = baseline.get(stage, {}).get("max_traced_peak_bytes")
+            if before and row["max_traced_peak_bytes"] > before * (1 + args.tolerance):
+                print(f"REGRESSION {stage}: {before / 2**20:.2f} -> {row['max_traced_peak_bytes'] / 2**20:.2f} MiB")
+                status = 1
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
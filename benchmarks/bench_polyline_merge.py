@@ -0,0 +1,70 @@
+"""Compare raw skeleton polylines with junction-merged ones.
+
+Each glyph is rendered and skeletonized once; its polylines are then
+serialized as traced and after :func:`merge_polylines` with the same stroke
+width estimate the pipeline uses.  The table lists polyline counts (one RDP
+call and one ``M`` command each), path data size, serialization time and the
+change of the measured length.
+
+    python benchmarks/bench_polyline_merge.py --font /path/to/font.otf --canvas-px 2200
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from font_length.measure import total_length
+from font_length.morph import skeletonize_clean
+from font_length.raster import render_glyph_to_binary
+from font_length.svgout import polylines_to_svg_path_d
+from font_length.vectorize import merge_polylines, skeleton_to_polylines
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--font", required=True)
+    parser.add_argument("--chars", default="永鬱識驚議護響鑑騰曜競躍顧艦臓一二三人山川日月木水火土")
+    parser.add_argument("--point-px", type=int, default=1800)
+    parser.add_argument("--canvas-px", type=int, default=2200)
+    parser.add_argument("--margin-px", type=int, default=128)
+    parser.add_argument("--max-turn", type=float, default=30.0, help="merge_polylines max_turn_deg")
+    parser.add_argument("--simplify-eps", type=float, default=2.0)
+    args = parser.parse_args(argv)
+
+    totals = {"raw": [0, 0, 0.0, 0.0], "merged": [0, 0, 0.0, 0.0]}  # polylines, bytes, seconds, length
+    merge_seconds = 0.0
+    for ch in args.chars:
+        bw = render_glyph_to_binary(ch, args.font, args.point_px, args.canvas_px, args.margin_px)
+        ink = int(np.count_nonzero(bw))
+        skel = skeletonize_clean(bw, 48, 8, in_place=True)
+        if not skel.any():
+            continue
+        raw = skeleton_to_polylines(skel)
+        width = ink / int(np.count_nonzero(skel))
+        start = time.perf_counter()
+        merged = merge_polylines(raw, args.max_turn, micro_len=width, direction_len=2 * width)
+        merge_seconds += time.perf_counter() - start
+        for label, polylines in (("raw", raw), ("merged", merged)):
+            start = time.perf_counter()
+            path_d = polylines_to_svg_path_d(polylines, args.simplify_eps, implicit_lineto=True)
+            row = totals[label]
+            row[0] += len(polylines)
+            row[1] += len(path_d)
+            row[2] += time.perf_counter() - start
+            row[3] += total_length(polylines)
+
+    print(f"{'polylines':9} {'count':>7} {'path bytes':>11} {'serialize ms':>13} {'length':>12}")
+    for label, (count, size, seconds, length) in totals.items():
+        print(f"{label:9} {count:7d} {size:11d} {1000 * seconds:13.1f} {length:12.1f}")
+    raw, merged = totals["raw"], totals["merged"]
+    print(
+        f"merge {1000 * merge_seconds:.1f} ms; {merged[0] / max(raw[0], 1):.2f}x polylines, "
+        f"{merged[1] / max(raw[1], 1):.2f}x path bytes, length {100 * (merged[3] / max(raw[3], 1e-9) - 1):+.2f}%"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,69 @@
+"""Compare single-glyph rendering with atlas-batched rendering.
+
+Both paths render the same characters after a warm-up; the table lists the
+time per glyph, the speedup and whether every atlas mask equals its
+single-glyph counterpart.  Glyphs that a single render would clip are rendered
+on their own in atlas mode too and are counted as ``fallback``.
+
+    python benchmarks/bench_render_atlas.py --font /path/to/font.otf --sizes 600:800 1800:2200
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from font_length.raster import (
+    _center_position,
+    _glyph_bbox,
+    _load_font,
+    render_glyph_to_binary,
+    render_glyphs_to_binary,
+)
+
+
+def _fallbacks(chars: str, font_path: str, point_px: int, canvas_px: int) -> int:
+    font = _load_font(font_path, point_px)
+    count = 0
+    for ch in chars:
+        left, top, right, bottom = font.getbbox(ch)
+        x, y = _center_position(canvas_px, _glyph_bbox(font, ch))
+        count += x + left < 1 or y + top < 1 or x + right > canvas_px - 1 or y + bottom > canvas_px - 1
+    return count
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--font", required=True)
+    parser.add_argument("--chars", default="永鬱識驚議護響鑑騰曜競躍顧艦臓一二三人山川日月木水火土")
+    parser.add_argument("--sizes", nargs="+", default=["100:128", "400:512", "900:1100", "1800:2200"])
+    parser.add_argument("--margin-px", type=int, default=16)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    chars = args.chars * args.repeat
+    print(f"{'point:canvas':>13} {'single ms':>10} {'atlas ms':>9} {'speedup':>8} {'fallback':>9} {'equal':>6}")
+    for size in args.sizes:
+        point_px, canvas_px = map(int, size.split(":"))
+        render_glyph_to_binary(chars[0], args.font, point_px, canvas_px, args.margin_px)
+        render_glyphs_to_binary(chars[:2], args.font, point_px, canvas_px, args.margin_px)
+
+        start = time.perf_counter()
+        single = [render_glyph_to_binary(ch, args.font, point_px, canvas_px, args.margin_px) for ch in chars]
+        single_s = time.perf_counter() - start
+        start = time.perf_counter()
+        atlas = render_glyphs_to_binary(chars, args.font, point_px, canvas_px, args.margin_px)
+        atlas_s = time.perf_counter() - start
+
+        equal = all(a.shape == b.shape and np.array_equal(a, b) for a, b in zip(single, atlas))
+        fallback = _fallbacks(args.chars, args.font, point_px, canvas_px)
+        print(
+            f"{size:>13} {1000 * single_s / len(chars):10.2f} {1000 * atlas_s / len(chars):9.2f} "
+            f"{single_s / atlas_s:7.2f}x {fallback:4d}/{len(args.chars):<4d} {str(equal):>6}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,85 @@
+"""Compare skeletonization backends on identical glyph masks.
+
+Masks are rendered once from ``--font`` (or synthesised when no font is given)
+and every backend reported by :func:`available_skeleton_backends` is run on the
+same masks.  The table lists the median skeleton time per glyph and the total
+stroke length relative to the default ``skeletonize`` backend.
+
+    python benchmarks/bench_skeleton_backends.py --font /path/to/font.otf --chars 永鬱識
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+
+import numpy as np
+
+from font_length.measure import total_length
+from font_length.morph import available_skeleton_backends, skeletonize_clean
+from font_length.raster import render_glyph_to_binary
+from font_length.vectorize import skeleton_to_polylines
+
+
+def _synthetic_masks(size: int) -> list[np.ndarray]:
+    masks = []
+    stroke = max(size // 12, 3)
+    for k in range(3, 7):
+        mask = np.zeros((size, size), dtype=bool)
+        for i in range(1, k):
+            pos = i * size // k
+            mask[pos - stroke // 2 : pos + stroke // 2, size // 10 : -size // 10] = True
+            mask[size // 10 : -size // 10, pos - stroke // 2 : pos + stroke // 2] = True
+        masks.append(mask)
+    return masks
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--font", help="Font used to render real glyph masks")
+    parser.add_argument("--chars", default="永鬱識驚", help="Characters to render from --font")
+    parser.add_argument("--point-px", type=int, default=1800)
+    parser.add_argument("--canvas-px", type=int, default=2200)
+    parser.add_argument("--margin-px", type=int, default=128)
+    parser.add_argument("--min-obj-area", type=int, default=48)
+    parser.add_argument("--spur-prune", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    if args.font:
+        masks = [
+            render_glyph_to_binary(ch, args.font, args.point_px, args.canvas_px, args.margin_px) for ch in args.chars
+        ]
+    else:
+        masks = _synthetic_masks(args.point_px)
+
+    reference: list[float] | None = None
+    print(f"{'backend':12} {'skeleton ms':>12} {'total ms':>10} {'length':>12} {'vs skeletonize':>15}")
+    for backend in available_skeleton_backends():
+        # Warm up once so that JIT compilation is not part of the measurement.
+        skeletonize_clean(masks[0], args.min_obj_area, args.spur_prune, backend=backend)
+        skeleton_times: list[float] = []
+        total_times: list[float] = []
+        lengths: list[float] = []
+        for mask in masks:
+            samples: list[dict[str, float]] = []
+            for _ in range(max(args.repeat, 1)):
+                timings: dict[str, float] = {}
+                skel = skeletonize_clean(
+                    mask, args.min_obj_area, args.spur_prune, backend=backend, timings=timings
+                )
+                samples.append(timings)
+            skeleton_times.append(statistics.median(t["skeleton"] for t in samples))
+            total_times.append(statistics.median(sum(t.values()) for t in samples))
+            lengths.append(total_length(skeleton_to_polylines(skel)))
+        if reference is None:
+            reference = lengths
+        deviation = statistics.mean(abs(a - b) / b for a, b in zip(lengths, reference) if b) * 100.0
+        print(
+            f"{backend:12} {statistics.mean(skeleton_times) * 1000:12.1f} "
+            f"{statistics.mean(total_times) * 1000:10.1f} {sum(lengths):12.1f} {deviation:14.2f}%"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,71 @@
+"""Compare SVG path serialization speed and output size.
+
+The baseline reproduces the original per-point f-string serializer (absolute
+``L`` commands, fixed ``.3f`` precision); the other rows use
+:func:`polylines_to_svg_path_d` with bulk formatting options.
+
+    python benchmarks/bench_svg_serialization.py --polylines 40 --points 60
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+
+import numpy as np
+
+from font_length.svgout import polylines_to_svg_path_d
+
+
+def _legacy(polylines: list[list[tuple[float, float]]]) -> str:
+    commands = []
+    for pts in polylines:
+        segments = [f"L {pt[0]:.3f} {pt[1]:.3f}" for pt in pts[1:]]
+        commands.append(" ".join([f"M {pts[0][0]:.3f} {pts[0][1]:.3f}"] + segments))
+    return " ".join(commands)
+
+
+def _random_walks(count: int, points: int, seed: int = 0) -> list[list[tuple[float, float]]]:
+    rng = np.random.default_rng(seed)
+    walks = []
+    for _ in range(count):
+        start = rng.integers(0, 2000, size=2)
+        steps = rng.integers(-1, 2, size=(points, 2))
+        walk = np.cumsum(np.vstack([start, steps]), axis=0).astype(float)
+        walks.append([(float(x), float(y)) for x, y in walk])
+    return walks
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--polylines", type=int, default=40, help="Polylines per glyph")
+    parser.add_argument("--points", type=int, default=60, help="Points per polyline")
+    parser.add_argument("--number", type=int, default=200, help="Serializations per measurement")
+    args = parser.parse_args(argv)
+
+    polylines = _random_walks(args.polylines, args.points)
+    variants = {
+        "legacy .3f absolute": lambda: _legacy(polylines),
+        "precision=3 absolute": lambda: polylines_to_svg_path_d(polylines, 0),
+        "precision=0 absolute implicit": lambda: polylines_to_svg_path_d(
+            polylines, 0, precision=0, implicit_lineto=True
+        ),
+        "precision=0 relative implicit": lambda: polylines_to_svg_path_d(
+            polylines, 0, precision=0, relative=True, implicit_lineto=True
+        ),
+    }
+    baseline_time = baseline_size = None
+    print(f"{'variant':32} {'us/glyph':>10} {'bytes':>8} {'speedup':>8} {'size':>7}")
+    for name, func in variants.items():
+        elapsed = min(timeit.repeat(func, number=args.number, repeat=3)) / args.number
+        size = len(func().encode("utf-8"))
+        if baseline_time is None:
+            baseline_time, baseline_size = elapsed, size
+        print(
+            f"{name:32} {elapsed * 1e6:10.1f} {size:8d} {baseline_time / elapsed:7.2f}x "
+            f"{size / baseline_size:6.0%}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,6 +1,36 @@
 """Font length analysis package."""
+from __future__ import annotations
 
-from .config import Config
-from .runner import Summary, convert_font_to_singleline_svgs
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["Config", "Summary", "convert_font_to_singleline_svgs"]
+if TYPE_CHECKING:  # pragma: no cover
+    from .batch import BatchMeasurement, measure_chars
+    from .config import Config
+    from .runner import Summary, convert_font_to_singleline_svgs
+
+__all__ = ["BatchMeasurement", "Config", "Summary", "convert_font_to_singleline_svgs", "measure_chars"]
+
+# Public names are resolved on first access so that importing the package (for
+# instance from the CLI or a freshly spawned worker) stays cheap.
+_LAZY_EXPORTS = {
+    "BatchMeasurement": ".batch",
+    "measure_chars": ".batch",
+    "Config": ".config",
+    "Summary": ".runner",
+    "convert_font_to_singleline_svgs": ".runner",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,31 @@
+"""Names of the skeletonization backends.
+
+Configuration validation only needs the names, so they live here without the
+imaging stack; the implementations are registered in :mod:`font_length.morph`.
+"""
+from __future__ import annotations
+
+import sys
+from importlib.util import find_spec
+
+__all__ = ["BUILTIN_SKELETON_BACKENDS", "NUMBA_SKELETON_BACKENDS", "skeleton_backend_names"]
+
+BUILTIN_SKELETON_BACKENDS = ("skeletonize", "thin", "medial_axis", "zhang-suen", "guo-hall")
+NUMBA_SKELETON_BACKENDS = frozenset({"zhang-suen", "guo-hall"})
+
+
+def skeleton_backend_names() -> list[str]:
+    """Return the backends that can run in this environment.
+
+    Backends added with :func:`font_length.morph.register_skeleton_backend`
+    require :mod:`font_length.morph` to be imported, so the registry is only
+    consulted once it is; otherwise the built-in names are checked without
+    importing scikit-image or Numba.
+    """
+
+    morph = sys.modules.get(f"{__package__}.morph")
+    if morph is not None:
+        return morph.available_skeleton_backends()
+    if find_spec("numba") is None:
+        return [name for name in BUILTIN_SKELETON_BACKENDS if name not in NUMBA_SKELETON_BACKENDS]
+    return list(BUILTIN_SKELETON_BACKENDS)
@@ -0,0 +1,118 @@
+"""In-memory batch measurement without touching the output directory."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator
+
+import numpy as np
+
+from .config import Config
+from .pipeline import GlyphFailure, _worker_config
+from .rasterstore import RasterStore
+from .runner import _iter_process_chars, _plan_schedule
+
+__all__ = ["MEASUREMENT_DTYPE", "BatchMeasurement", "iter_measure_chars", "measure_chars"]
+
+Point = tuple[float, float]
+
+MEASUREMENT_DTYPE = np.dtype(
+    [
+        ("char", "U1"),
+        ("codepoint", np.uint32),
+        ("total_length", np.float64),
+        ("bounds", np.float64, (4,)),
+        ("polyline_count", np.int32),
+        ("skeleton_pixels", np.int64),
+    ]
+)
+
+
+@dataclass
+class BatchMeasurement:
+    """Result of :func:`measure_chars`.
+
+    ``records`` is a structured array using :data:`MEASUREMENT_DTYPE` ordered
+    like the input characters.  ``polylines`` is aligned with ``records`` when
+    requested and ``None`` otherwise.
+    """
+
+    records: np.ndarray
+    failures: list[GlyphFailure]
+    polylines: list[list[list[Point]]] | None = None
+
+
+def _records_to_array(rows: list[dict[str, Any]]) -> np.ndarray:
+    records = np.zeros(len(rows), dtype=MEASUREMENT_DTYPE)
+    for i, metrics in enumerate(rows):
+        records[i] = (
+            metrics["char"],
+            metrics["codepoint"],
+            metrics["total_length"],
+            metrics["bounds"],
+            metrics.get("polyline_count", 0),
+            metrics.get("skeleton_pixels", 0),
+        )
+    return records
+
+
+def iter_measure_chars(
+    chars: Iterable[str],
+    cfg: Config,
+    workers: int | None = None,
+    include_polylines: bool = False,
+) -> Iterator[tuple[str, dict[str, Any] | None, GlyphFailure | None]]:
+    """Yield ``(char, metrics, failure)`` tuples as glyphs complete.
+
+    Repeated characters are measured and yielded once.  Exactly one of
+    ``metrics`` and ``failure`` is set.  Completion order is
+    not guaranteed to match ``chars`` when more than one worker is used.  When
+    ``cfg.raster_store`` is set, newly rendered masks are written to the store
+    in batches as results arrive and the rest when the iterator is exhausted
+    or closed.
+    """
+
+    worker_cfg = _worker_config(cfg, emit_path=False, keep_polylines=include_polylines)
+    n_workers = cfg.resolved_workers() if workers is None else max(1, int(workers))
+    store = RasterStore(worker_cfg.raster_store) if worker_cfg.raster_store else None
+    chars = list(dict.fromkeys(chars))
+    chunks, _ = _plan_schedule(chars, cfg, n_workers, None)
+    try:
+        for char, metrics, failure in _iter_process_chars(
+            chars, worker_cfg, n_workers, chunks, memory_limit=cfg.max_memory
+        ):
+            if store is not None and metrics is not None:
+                store.absorb(metrics)
+            yield char, metrics, failure
+    finally:
+        if store is not None:
+            store.flush()
+
+
+def measure_chars(
+    chars: Iterable[str],
+    cfg: Config,
+    workers: int | None = None,
+    include_polylines: bool = False,
+) -> BatchMeasurement:
+    """Measure ``chars`` in memory and return a :class:`BatchMeasurement`.
+
+    The same worker engine as :func:`convert_font_to_singleline_svgs` is used,
+    but no SVG, CSV or summary files are written.  Each distinct character is
+    measured once; repeated characters get one record (or failure) per
+    occurrence.
+    """
+
+    chars = list(chars)
+    measured: dict[str, dict[str, Any]] = {}
+    failed: dict[str, GlyphFailure] = {}
+    for char, metrics, failure in iter_measure_chars(chars, cfg, workers, include_polylines):
+        if failure:
+            failed[char] = failure
+            continue
+        assert metrics is not None
+        measured[char] = metrics
+
+    rows = [measured[ch] for ch in chars if ch in measured]
+    failures = [failed[ch] for ch in chars if ch in failed]
+    polylines = [m["polylines"] for m in rows] if include_polylines else None
+    return BatchMeasurement(records=_records_to_array(rows), failures=failures, polylines=polylines)
@@ -3,14 +3,17 @@ from __future__ import annotations
 
 import argparse
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from .config import Config, load_config_file
-from .runner import convert_font_to_singleline_svgs
+if TYPE_CHECKING:  # pragma: no cover
+    from .config import Config
 
 
 def _build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description="Convert fonts to single-line SVGs for the Joyo kanji set")
+    parser = argparse.ArgumentParser(
+        description="Convert fonts to single-line SVGs for the Joyo kanji set",
+        epilog="Run 'joyo2svg report --help' to rebuild reports or compare runs without reprocessing.",
+    )
     parser.add_argument("--config", help="Optional YAML/JSON configuration file")
     parser.add_argument("--font", dest="font_path", help="Path to the font file (.otf/.ttf)")
     parser.add_argument("--out-dir", dest="out_dir", help="Output directory for generated assets")
@@ -23,16 +26,175 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument("--min-obj-area", type=int, dest="min_obj_area", help="Minimum object area to retain")
     parser.add_argument("--spur-prune", type=int, dest="spur_prune_len", help="Spur pruning length in pixels")
+    parser.add_argument(
+        "--raster-store", dest="raster_store", help="Directory of the persistent bit-packed glyph mask store"
+    )
+    parser.add_argument(
+        "--render-mode",
+        dest="render_mode",
+        choices=["single", "atlas"],
+        help="Render glyphs one by one or batched on shared atlas images",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["skeleton", "distance"],
+        help="Measure traced skeletons (default) or estimate lengths from a distance transform (fast, no SVG paths)",
+    )
+    parser.add_argument(
+        "--skeleton-backend",
+        dest="skeleton_backend",
+        help=(
+            "Skeletonization backend: skeletonize, thin, medial_axis, zhang-suen, guo-hall "
+            "(the last two require numba) or one added with register_skeleton_backend"
+        ),
+    )
+    parser.add_argument(
+        "--merge-polylines",
+        dest="merge_polylines",
+        action=argparse.BooleanOptionalAction,
+        help="Join polylines that continue smoothly through skeleton junctions",
+    )
+    parser.add_argument(
+        "--merge-max-turn",
+        type=float,
+        dest="merge_max_turn_deg",
+        help="Largest direction change in degrees at which --merge-polylines joins two strokes",
+    )
     parser.add_argument("--simplify-eps", type=float, dest="simplify_eps", help="RDP simplification epsilon")
+    parser.add_argument(
+        "--svg-precision", type=int, dest="svg_precision", help="Decimal places for SVG path coordinates"
+    )
+    parser.add_argument(
+        "--svg-relative",
+        dest="svg_relative",
+        action=argparse.BooleanOptionalAction,
+        help="Emit relative SVG path commands (default) or absolute ones",
+    )
     parser.add_argument("--workers", help="Number of worker processes or 'auto'")
+    parser.add_argument(
+        "--executor",
+        choices=["auto", "process", "thread"],
+        help="Run glyphs in worker processes or threads (auto: threads on free-threaded Python)",
+    )
+    parser.add_argument(
+        "--max-memory",
+        dest="max_memory",
+        help="Memory budget for all workers, e.g. 8G; sizes --workers auto and throttles at runtime",
+    )
+    parser.add_argument(
+        "--schedule",
+        choices=["cost", "input"],
+        help="Dispatch order: longest-first by estimated cost (default) or kanji list order",
+    )
+    parser.add_argument(
+        "--glyph-timeout", type=float, dest="glyph_timeout", help="Per-glyph time budget in seconds"
+    )
+    parser.add_argument(
+        "--retry-point-scale",
+        type=float,
+        dest="retry_point_scale",
+        help="Retry timed-out or crashed glyphs once at point_px scaled by this factor",
+    )
+    parser.add_argument(
+        "--memory-profile",
+        dest="memory_profile",
+        action="store_true",
+        default=None,
+        help="Trace per-stage peak allocations (slow) and report the worst glyphs in summary.json",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        dest="metrics_file",
+        help="Write live progress metrics here: Prometheus textfile for *.prom, JSON lines otherwise",
+    )
+    parser.add_argument(
+        "--metrics-interval", type=float, dest="metrics_interval", help="Seconds between metrics snapshots"
+    )
+    parser.add_argument(
+        "--columnar",
+        choices=["none", "auto", "arrow", "parquet", "npz"],
+        help="Also write typed per-glyph results as Arrow IPC, Parquet or .npz (auto: Arrow if pyarrow is installed)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        default=None,
+        help="Only process glyphs whose outline changed since the previous run in --out-dir (requires fontTools)",
+    )
     parser.add_argument("--joyo-url", dest="joyo_url", help="URL pointing to the kanji list")
     parser.add_argument("--joyo-cache", dest="joyo_cache", help="Path to the cached kanji list")
     parser.add_argument("--log-level", dest="log_level", help="Logging level (DEBUG/INFO/WARN/ERROR)")
     parser.add_argument("--stroke-width", dest="stroke_width", type=float, help="SVG stroke width")
+    parser.add_argument("--top-k", dest="top_k", type=int, help="Number of longest glyphs listed in summary.json")
+    return parser
+
+
+def _build_report_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="joyo2svg report",
+        description="Regenerate SVGs, CSV and summary.json from a previous run, or compare two runs",
+    )
+    parser.add_argument("run_dir", help="Output directory of a previous run (holds glyph_results.jsonl)")
+    parser.add_argument("--out-dir", dest="out_dir", help="Write regenerated reports here instead of RUN_DIR")
+    parser.add_argument("--stroke-width", dest="stroke_width", type=float, help="SVG stroke width")
+    parser.add_argument(
+        "--top-k", dest="top_k", type=int, help="Number of longest glyphs listed (default: the run's setting)"
+    )
+    parser.add_argument("--no-svg", dest="write_svgs", action="store_false", help="Only rewrite CSV and summary")
+    parser.add_argument(
+        "--compare",
+        metavar="BASELINE_DIR",
+        help="Instead of regenerating, write per-character length deltas of RUN_DIR against BASELINE_DIR",
+    )
+    parser.add_argument(
+        "--deltas-csv", dest="deltas_csv", help="Output path for --compare (default: RUN_DIR/length_deltas.csv)"
+    )
     return parser
 
 
+def _report_main(argv: list[str]) -> None:
+    args = _build_report_parser().parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    logger = logging.getLogger(__name__)
+
+    try:
+        _run_report(args, logger)
+    except FileNotFoundError as exc:
+        # Run directories from older versions have no glyph_results.jsonl.
+        raise SystemExit(f"joyo2svg report: {exc}") from None
+
+
+def _run_report(args: argparse.Namespace, logger: logging.Logger) -> None:
+    from pathlib import Path
+
+    from .report import compare_runs, regenerate_reports, write_length_deltas
+
+    if args.compare:
+        deltas = compare_runs(args.run_dir, args.compare)
+        out_path = write_length_deltas(deltas, args.deltas_csv or Path(args.run_dir) / "length_deltas.csv")
+        common = [d.delta for d in deltas if d.delta is not None]
+        logger.info(
+            "Compared %d common glyph(s), %d only in one run; mean delta %.3f px; wrote %s",
+            len(common),
+            len(deltas) - len(common),
+            sum(common) / len(common) if common else 0.0,
+            out_path,
+        )
+        return
+
+    summary = regenerate_reports(
+        args.run_dir,
+        out_dir=args.out_dir,
+        stroke_width=args.stroke_width,
+        top_k=args.top_k,
+        write_svgs=args.write_svgs,
+    )
+    logger.info("Regenerated reports for %d glyph(s) (failures=%d)", summary.processed, len(summary.failures))
+
+
 def _merge_config(cli_args: argparse.Namespace, base: Config | None) -> Config:
+    from .config import Config
+
     data: dict[str, Any]
     if base is None:
         data = {}
@@ -53,15 +215,29 @@ def _merge_config(cli_args: argparse.Namespace, base: Config | None) -> Config:
 
 
 def main(argv: list[str] | None = None) -> None:
+    if argv is None:
+        import sys
+
+        argv = sys.argv[1:]
+    if argv and argv[0] == "report":
+        _report_main(argv[1:])
+        return
+
     parser = _build_parser()
     args = parser.parse_args(argv)
 
+    from .config import load_config_file
+
     base_config = None
     if args.config:
         base_config = load_config_file(args.config)
 
     config = _merge_config(args, base_config)
 
+    # Imported here so that ``--help`` and configuration errors never pay for
+    # numpy, scikit-image, Pillow and friends.
+    from .runner import convert_font_to_singleline_svgs
+
     summary = convert_font_to_singleline_svgs(config)
     logging.getLogger(__name__).info(
         "Finished conversion: processed=%d failures=%d", summary.processed, len(summary.failures)
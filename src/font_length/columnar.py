@@ -0,0 +1,190 @@
+"""Columnar per-glyph results for large multi-font analyses.
+
+Rows are collected into record batches of typed columns as results stream in
+and written as Arrow IPC (Feather v2) or Parquet through the optional
+``pyarrow`` dependency.  Without ``pyarrow`` the ``.npz`` fallback stores the
+same columns as NumPy arrays; NumPy archives cannot be appended to, so that
+format is written once when the writer is closed.
+
+Failed glyphs are stored as rows too: ``status`` is ``"ok"`` for measured
+glyphs and the failure reason (``noskeleton``, ``timeout``, ...) otherwise,
+with NaN lengths and bounds.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+__all__ = ["COLUMNS", "TIMING_STAGES", "ColumnarWriter", "pyarrow_available", "read_columnar"]
+
+if TYPE_CHECKING:
+    from .pipeline import GlyphFailure
+
+TIMING_STAGES = ("render", "cleanup", "skeleton", "prune", "vectorize", "serialize", "estimate")
+
+COLUMNS: dict[str, np.dtype] = {
+    "char": np.dtype("U1"),
+    "codepoint": np.dtype(np.uint32),
+    "status": np.dtype("U16"),
+    "total_length": np.dtype(np.float64),
+    "bounds_x": np.dtype(np.float64),
+    "bounds_y": np.dtype(np.float64),
+    "bounds_w": np.dtype(np.float64),
+    "bounds_h": np.dtype(np.float64),
+    "polyline_count": np.dtype(np.int32),
+    "skeleton_pixels": np.dtype(np.int64),
+    **{f"time_{stage}": np.dtype(np.float64) for stage in TIMING_STAGES},
+}
+
+_SUFFIXES = {"arrow": ".arrow", "parquet": ".parquet", "npz": ".npz"}
+
+
+def pyarrow_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class ColumnarWriter:
+    """Stream result rows into ``<stem>.arrow``, ``.parquet`` or ``.npz``.
+
+    ``fmt="auto"`` picks Arrow IPC when ``pyarrow`` is installed and ``npz``
+    otherwise.  Every row carries ``config_hash``, ``font`` (the font path) and
+    ``font_sha256`` so that files from many runs can be concatenated and
+    filtered by parameter set and font revision.
+    """
+
+    def __init__(
+        self,
+        stem: str | Path,
+        fmt: str,
+        config_hash: str,
+        font: str = "",
+        font_sha256: str = "",
+        batch_size: int = 4096,
+    ) -> None:
+        if fmt == "auto":
+            fmt = "arrow" if pyarrow_available() else "npz"
+        if fmt not in _SUFFIXES:
+            raise ValueError(f"Unknown columnar format: {fmt}")
+        if fmt != "npz" and not pyarrow_available():
+            raise ImportError(
+                f"The {fmt!r} columnar format requires the optional 'pyarrow' package "
+                "(pip install 'font-length[columnar]')"
+            )
+        self.format = fmt
+        self.path = Path(stem).with_suffix(_SUFFIXES[fmt])
+        self.config_hash = config_hash
+        self.constants = {"config_hash": config_hash, "font": font, "font_sha256": font_sha256}
+        self.batch_size = max(int(batch_size), 1)
+        self.rows_written = 0
+        self._rows: list[dict[str, Any]] = []
+        self._batches: list[dict[str, np.ndarray]] = []
+        self._writer: Any = None
+
+    def __enter__(self) -> ColumnarWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def append(self, metrics: dict[str, Any]) -> None:
+        self._rows.append(metrics)
+        if len(self._rows) >= self.batch_size:
+            self._flush_batch()
+
+    def append_failure(self, failure: GlyphFailure) -> None:
+        self.append({"char": failure.char, "codepoint": failure.codepoint, "status": failure.reason})
+
+    def _columns(self, rows: list[dict[str, Any]]) -> dict[str, np.ndarray]:
+        n = len(rows)
+        missing = (np.nan,) * 4
+        bounds = np.array([row.get("bounds", missing) for row in rows], dtype=np.float64).reshape(n, 4)
+        columns = {
+            "char": np.array([row["char"] for row in rows], dtype=COLUMNS["char"]),
+            "codepoint": np.array([row["codepoint"] for row in rows], dtype=COLUMNS["codepoint"]),
+            "status": np.array([row.get("status", "ok") for row in rows], dtype=COLUMNS["status"]),
+            "total_length": np.array([row.get("total_length", np.nan) for row in rows], dtype=np.float64),
+            "bounds_x": bounds[:, 0],
+            "bounds_y": bounds[:, 1],
+            "bounds_w": bounds[:, 2],
+            "bounds_h": bounds[:, 3],
+            "polyline_count": np.array([row.get("polyline_count", 0) for row in rows], dtype=np.int32),
+            "skeleton_pixels": np.array([row.get("skeleton_pixels", 0) for row in rows], dtype=np.int64),
+        }
+        for stage in TIMING_STAGES:
+            columns[f"time_{stage}"] = np.array(
+                [row.get("timings", {}).get(stage, np.nan) for row in rows], dtype=np.float64
+            )
+        return columns
+
+    def _flush_batch(self) -> None:
+        if not self._rows:
+            return
+        columns = self._columns(self._rows)
+        self.rows_written += len(self._rows)
+        self._rows = []
+        if self.format == "npz":
+            self._batches.append(columns)
+            return
+
+        import pyarrow as pa
+
+        arrays = {name: pa.array(values) for name, values in columns.items()}
+        indices = pa.array(np.zeros(len(columns["char"]), dtype=np.int32))
+        for name, value in self.constants.items():
+            arrays[name] = pa.DictionaryArray.from_arrays(indices, pa.array([value]))
+        batch = pa.RecordBatch.from_pydict(arrays)
+        if self._writer is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self.format == "parquet":
+                import pyarrow.parquet as pq
+
+                self._writer = pq.ParquetWriter(str(self.path), batch.schema)
+            else:
+                self._writer = pa.ipc.new_file(str(self.path), batch.schema)
+        self._writer.write_batch(batch)
+
+    def close(self) -> Path:
+        """Flush the last batch, finalize the file and return its path."""
+
+        self._flush_batch()
+        if self.format == "npz":
+            merged = {
+                name: np.concatenate([batch[name] for batch in self._batches])
+                if self._batches
+                else np.zeros(0, dtype=dtype)
+                for name, dtype in COLUMNS.items()
+            }
+            for name, value in self.constants.items():
+                merged[name] = np.full(len(merged["char"]), value)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            np.savez(self.path, **merged)
+            self._batches = []
+        elif self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        return self.path
+
+
+def read_columnar(path: str | Path) -> dict[str, np.ndarray]:
+    """Load a file written by :class:`ColumnarWriter` into NumPy columns."""
+
+    path = Path(path)
+    if path.suffix == ".npz":
+        with np.load(path) as data:
+            return {name: data[name] for name in data.files}
+    import pyarrow as pa
+
+    if path.suffix == ".parquet":
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(str(path))
+    else:
+        with pa.memory_map(str(path)) as source:
+            table = pa.ipc.open_file(source).read_all()
+    return {name: table.column(name).to_numpy() for name in table.column_names}
@@ -1,14 +1,35 @@
 """Configuration objects and helpers."""
 from __future__ import annotations
 
+import hashlib
 import json
 from pathlib import Path
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 __all__ = ["Config", "load_config_file"]
 
+# Fields that change per-glyph measurements; everything else only affects
+# where results are written or how the work is scheduled.
+_RESULT_FIELDS = (
+    "font_path",
+    "point_px",
+    "canvas_px",
+    "margin_px",
+    "binarize",
+    "binary_threshold",
+    "min_obj_area",
+    "spur_prune_len",
+    "simplify_eps",
+    "skeleton_backend",
+    "engine",
+    "merge_polylines",
+    "merge_max_turn_deg",
+)
+# Fields that change the stored path data without changing measurements.
+_OUTPUT_FIELDS = ("svg_precision", "svg_relative")
+
 
 class Config(BaseModel):
     font_path: str
@@ -24,9 +45,36 @@ class Config(BaseModel):
     min_obj_area: int = Field(default=48, ge=0)
     spur_prune_len: int = Field(default=8, ge=0)
 
+    merge_polylines: bool = False
+    merge_max_turn_deg: float = Field(default=30.0, gt=0.0, le=90.0)
     simplify_eps: float = Field(default=2.0, ge=0.0)
+    svg_precision: int = Field(default=0, ge=0, le=6)
+    svg_relative: bool = True
+
+    raster_store: str | None = None
+
+    # Atlas rendering is off by default: benchmarks/bench_render_atlas.py measured
+    # 0.63x at 400-512 px canvases and only 1.05x at larger ones.  It can help
+    # with large canvases and fonts whose glyphs stay inside their cells (others
+    # fall back to single renders), and only batches with ``schedule="input"``
+    # or one worker, because cost-based chunks are too small.
+    render_mode: Literal["single", "atlas"] = "single"
+    engine: Literal["skeleton", "distance"] = "skeleton"
+    skeleton_backend: str = "skeletonize"
 
     workers: int | Literal["auto"] = "auto"
+    max_memory: int | None = Field(default=None, gt=0)
+    executor: Literal["auto", "process", "thread"] = "auto"
+    schedule: Literal["cost", "input"] = "cost"
+    glyph_timeout: float | None = Field(default=None, gt=0.0)
+    retry_point_scale: float | None = Field(default=None, gt=0.0, lt=1.0)
+
+    memory_profile: bool = False
+    metrics_file: str | None = None
+    metrics_interval: float = Field(default=5.0, gt=0.0)
+
+    columnar: Literal["none", "auto", "arrow", "parquet", "npz"] = "none"
+    incremental: bool = False
 
     joyo_url: str = Field(
         default="https://raw.githubusercontent.com/NHV33/joyo-kanji-compilation/master/kanji_string.txt"
@@ -35,6 +83,7 @@ class Config(BaseModel):
 
     log_level: str = Field(default="INFO")
     stroke_width: float = Field(default=1.0, gt=0.0)
+    top_k: int = Field(default=20, ge=0)
 
     class Config:
         validate_assignment = True
@@ -52,13 +101,80 @@ class Config(BaseModel):
             raise ValueError("workers must be positive or 'auto'")
         return value
 
-    def resolved_workers(self) -> int:
+    @field_validator("skeleton_backend")
+    @classmethod
+    def _validate_skeleton_backend(cls, value: str) -> str:
+        from .backends import skeleton_backend_names
+
+        available = skeleton_backend_names()
+        if value not in available:
+            raise ValueError(f"Unknown or unavailable skeleton backend {value!r}; available: {', '.join(available)}")
+        return value
+
+    @field_validator("max_memory", mode="before")
+    @classmethod
+    def _validate_max_memory(cls, value: Any) -> int | None:
+        if value is None or isinstance(value, int):
+            return value
+        from .resources import parse_memory_size
+
+        return parse_memory_size(str(value))
+
+    @model_validator(mode="after")
+    def _validate_memory_profile(self) -> Config:
+        # tracemalloc peaks are process-wide; concurrent threads would be
+        # attributed to whichever glyph stage happens to be measuring.
+        if self.memory_profile and self.resolved_executor() == "thread":
+            raise ValueError("memory_profile requires the process executor")
+        return self
+
+    def resolved_workers(self, measured_peaks: dict[int, int] | None = None) -> int:
+        """Return the worker count, sizing ``"auto"`` by CPUs and memory.
+
+        ``measured_peaks`` maps canvas sizes to per-worker peak bytes observed
+        in earlier runs (see :func:`font_length.resources.load_worker_peaks`).
+        """
+
         if self.workers == "auto":
-            import multiprocessing
+            from .resources import auto_workers
 
-            return max(1, min(8, multiprocessing.cpu_count()))
+            return auto_workers(self.canvas_px, self.max_memory, measured_peaks)
         return int(self.workers)
 
+    def resolved_executor(self) -> Literal["process", "thread"]:
+        """Return the executor, choosing threads for ``"auto"`` only without a GIL."""
+
+        if self.executor == "auto":
+            import sys
+
+            gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+            return "process" if gil_enabled else "thread"
+        return self.executor
+
+    def config_hash(self) -> str:
+        """Return a short hash of the fields that affect per-glyph results.
+
+        The font enters by the SHA-256 of its contents, so fonts or font
+        revisions that share a file name hash differently.
+        """
+
+        from .rasterstore import font_hash
+
+        data = {name: getattr(self, name) for name in _RESULT_FIELDS}
+        try:
+            data["font_path"] = font_hash(self.font_path)
+        except OSError:
+            data["font_path"] = str(self.font_path)
+        encoded = json.dumps(data, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()[:16]
+
+    def settings_hash(self) -> str:
+        """Return a hash of the settings stored results depend on, except the font."""
+
+        data = {name: getattr(self, name) for name in _RESULT_FIELDS + _OUTPUT_FIELDS if name != "font_path"}
+        encoded = json.dumps(data, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()[:16]
+
     def model_dump_config(self) -> dict[str, Any]:
         data = self.model_dump()
         return data
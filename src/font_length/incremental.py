@@ -0,0 +1,173 @@
+"""Per-glyph outline hashes for incremental reruns after font revisions.
+
+A font revision usually touches a few dozen glyphs.  :func:`glyph_outline_hashes`
+hashes what determines each glyph's raster: the decomposed outline reached
+through the cmap, its advance width and side bearing and, for TrueType, its
+hinting instructions.  Font-wide data that affects every glyph (units per em,
+vertical metrics, global hinting programs and substitutions) is hashed
+separately by :func:`font_wide_hash`.  A run saves these hashes in
+``glyph_manifest.json`` together with a hash of the result-affecting settings;
+the next run with ``incremental`` enabled only processes glyphs whose hash
+changed and carries the stored results of all others forward.
+
+Hashing requires the optional ``fontTools`` package.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable
+
+__all__ = [
+    "MANIFEST_FILENAME",
+    "GlyphManifest",
+    "font_wide_hash",
+    "fonttools_available",
+    "glyph_outline_hashes",
+    "load_manifest",
+    "save_manifest",
+]
+
+MANIFEST_FILENAME = "glyph_manifest.json"
+_MANIFEST_VERSION = 1
+
+# Raw tables whose content can change the raster of every glyph.
+_GLOBAL_TABLES = ("cvt ", "fpgm", "prep", "gasp", "GSUB", "avar", "fvar")
+
+
+def fonttools_available() -> bool:
+    try:
+        import fontTools  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _open_font(font_path: str | Path) -> Any:
+    try:
+        from fontTools.ttLib import TTFont
+    except ImportError as exc:  # pragma: no cover - exercised without fontTools
+        raise ImportError(
+            "Incremental runs require the optional 'fontTools' package (pip install 'font-length[incremental]')"
+        ) from exc
+    return TTFont(str(font_path), lazy=True, fontNumber=0)
+
+
+def font_wide_hash(font_path: str | Path) -> str:
+    """Return a hash of the font-level data that affects every glyph's raster."""
+
+    font = _open_font(font_path)
+    try:
+        data: dict[str, Any] = {"unitsPerEm": font["head"].unitsPerEm}
+        if "hhea" in font:
+            hhea = font["hhea"]
+            data["hhea"] = [hhea.ascent, hhea.descent, hhea.lineGap]
+        if "OS/2" in font:
+            os2 = font["OS/2"]
+            data["OS/2"] = [
+                os2.sTypoAscender,
+                os2.sTypoDescender,
+                os2.sTypoLineGap,
+                os2.usWinAscent,
+                os2.usWinDescent,
+                bool(os2.fsSelection & (1 << 7)),  # USE_TYPO_METRICS
+            ]
+        digest = hashlib.sha256(json.dumps(data, sort_keys=True).encode("utf-8"))
+        for tag in _GLOBAL_TABLES:
+            if tag in font.reader:
+                digest.update(tag.encode("ascii"))
+                digest.update(font.reader[tag])
+        return digest.hexdigest()[:16]
+    finally:
+        font.close()
+
+
+def glyph_outline_hashes(font_path: str | Path, chars: Iterable[str]) -> dict[str, str | None]:
+    """Return a hash per character of its outline and horizontal metrics.
+
+    Composite glyphs are decomposed, so editing a shared component changes the
+    hash of every glyph using it.  Characters missing from the cmap map to
+    ``None`` and are always processed.
+    """
+
+    from fontTools.pens.recordingPen import DecomposingRecordingPen
+
+    font = _open_font(font_path)
+    try:
+        cmap = font.getBestCmap() or {}
+        glyph_set = font.getGlyphSet()
+        hmtx = font["hmtx"] if "hmtx" in font else None
+        glyf = font["glyf"] if "glyf" in font else None
+        by_name: dict[str, str] = {}
+        hashes: dict[str, str | None] = {}
+        for ch in chars:
+            name = cmap.get(ord(ch))
+            if name is None or name not in glyph_set:
+                hashes[ch] = None
+                continue
+            if name not in by_name:
+                pen = DecomposingRecordingPen(glyph_set)
+                glyph_set[name].draw(pen)
+                digest = hashlib.sha256(repr(pen.value).encode("ascii"))
+                digest.update(repr(hmtx[name] if hmtx is not None else glyph_set[name].width).encode("ascii"))
+                program = getattr(glyf[name], "program", None) if glyf is not None else None
+                if program is not None:
+                    digest.update(program.getBytecode())
+                by_name[name] = digest.hexdigest()[:16]
+            hashes[ch] = by_name[name]
+        return hashes
+    finally:
+        font.close()
+
+
+class GlyphManifest:
+    """Glyph hashes of one run plus the keys that make them comparable."""
+
+    def __init__(self, settings_hash: str, font_hash: str, glyphs: dict[str, str] | None = None) -> None:
+        self.settings_hash = settings_hash
+        self.font_hash = font_hash
+        self.glyphs: dict[str, str] = dict(glyphs or {})
+
+    def unchanged(self, previous: GlyphManifest | None, hashes: dict[str, str | None]) -> set[str]:
+        """Return the characters whose hash equals the one in ``previous``."""
+
+        if (
+            previous is None
+            or previous.settings_hash != self.settings_hash
+            or previous.font_hash != self.font_hash
+        ):
+            return set()
+        return {ch for ch, value in hashes.items() if value is not None and previous.glyphs.get(ch) == value}
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": _MANIFEST_VERSION,
+            "settings_hash": self.settings_hash,
+            "font_hash": self.font_hash,
+            "glyphs": self.glyphs,
+        }
+
+
+def load_manifest(path: str | Path) -> GlyphManifest | None:
+    """Return the manifest saved at ``path`` or ``None`` if missing or unreadable."""
+
+    path = Path(path)
+    if not path.exists():
+        return None
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != _MANIFEST_VERSION:
+        return None
+    return GlyphManifest(str(data["settings_hash"]), str(data["font_hash"]), data.get("glyphs", {}))
+
+
+def save_manifest(path: str | Path, manifest: GlyphManifest) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps(manifest.to_dict(), ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_path, path)
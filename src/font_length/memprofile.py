@@ -0,0 +1,122 @@
+"""Opt-in per-stage memory profiling of the glyph pipeline.
+
+Two complementary signals are recorded for every stage of a glyph:
+
+* the peak of :mod:`tracemalloc`-traced memory above the level at the start of
+  the stage, which covers NumPy buffers and Python objects such as the
+  neighbour maps built during vectorization;
+* the growth of the process' current RSS during the stage, which also
+  catches native allocations that tracemalloc cannot see, for example Pillow
+  images (Linux only, ``0`` elsewhere).
+
+Tracing slows the pipeline down noticeably and is therefore only started when
+``Config.memory_profile`` is enabled, and stopped again by
+:meth:`StageMemory.close` if it was started for the profile.  The traced
+peak is process-wide, so the per-stage figures require that one glyph at a
+time is processed per process; ``Config`` rejects the thread executor.
+"""
+from __future__ import annotations
+
+import heapq
+import os
+import tracemalloc
+from typing import Any
+
+from .resources import process_rss_bytes
+
+__all__ = ["MemoryProfile", "StageMemory"]
+
+
+def _current_rss() -> int:
+    return process_rss_bytes(os.getpid()) or 0
+
+
+class StageMemory:
+    """Measure traced peak and RSS growth of consecutive stages.
+
+    Use it as a context manager or call :meth:`close` so that tracing does not
+    outlive the measurement.
+    """
+
+    def __init__(self) -> None:
+        self._started = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start()
+        self.traced_peak: dict[str, int] = {}
+        self.rss_growth: dict[str, int] = {}
+        self._base = 0
+        self._rss = 0
+
+    def begin(self) -> None:
+        tracemalloc.reset_peak()
+        self._base = tracemalloc.get_traced_memory()[0]
+        self._rss = _current_rss()
+
+    def end(self, stage: str) -> None:
+        self.traced_peak[stage] = max(tracemalloc.get_traced_memory()[1] - self._base, 0)
+        self.rss_growth[stage] = max(_current_rss() - self._rss, 0)
+        self.begin()
+
+    def close(self) -> None:
+        """Stop tracing if this instance started it."""
+
+        if self._started:
+            self._started = False
+            tracemalloc.stop()
+
+    def __enter__(self) -> StageMemory:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def to_dict(self) -> dict[str, dict[str, int]]:
+        return {"traced_peak": dict(self.traced_peak), "rss_growth": dict(self.rss_growth)}
+
+
+class MemoryProfile:
+    """Aggregate per-glyph stage memory into a summary section."""
+
+    def __init__(self, worst: int = 10) -> None:
+        self.worst = worst
+        self._max: dict[str, tuple[int, str]] = {}
+        self._total: dict[str, int] = {}
+        self._rss_growth: dict[str, int] = {}
+        self._count = 0
+        self._glyphs: list[tuple[int, str, str]] = []
+
+    def add(self, char: str, memory: dict[str, dict[str, int]]) -> None:
+        traced = memory.get("traced_peak", {})
+        if not traced:
+            return
+        self._count += 1
+        for stage, peak in traced.items():
+            self._total[stage] = self._total.get(stage, 0) + peak
+            if peak > self._max.get(stage, (-1, ""))[0]:
+                self._max[stage] = (peak, char)
+        for stage, growth in memory.get("rss_growth", {}).items():
+            self._rss_growth[stage] = self._rss_growth.get(stage, 0) + growth
+        stage, peak = max(traced.items(), key=lambda item: item[1])
+        entry = (peak, char, stage)
+        if len(self._glyphs) < self.worst:
+            heapq.heappush(self._glyphs, entry)
+        elif entry > self._glyphs[0]:
+            heapq.heapreplace(self._glyphs, entry)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "glyphs": self._count,
+            "stages": {
+                stage: {
+                    "max_traced_peak_bytes": peak,
+                    "mean_traced_peak_bytes": int(self._total[stage] / max(self._count, 1)),
+                    "max_char": char,
+                    "rss_growth_bytes": self._rss_growth.get(stage, 0),
+                }
+                for stage, (peak, char) in self._max.items()
+            },
+            "worst_glyphs": [
+                {"char": char, "traced_peak_bytes": peak, "stage": stage}
+                for peak, char, stage in sorted(self._glyphs, reverse=True)
+            ],
+        }
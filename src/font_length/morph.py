@@ -1,10 +1,31 @@
 """Morphological helpers for skeleton extraction."""
 from __future__ import annotations
 
+import inspect
+import time
+from typing import TYPE_CHECKING, Callable
+
 import numpy as np
-from skimage.morphology import remove_small_objects, skeletonize
+from skimage.morphology import medial_axis, remove_small_objects, skeletonize, thin
+
+from .backends import NUMBA_SKELETON_BACKENDS
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .memprofile import StageMemory
+
+__all__ = [
+    "SKELETON_BACKENDS",
+    "available_skeleton_backends",
+    "clean_mask",
+    "register_skeleton_backend",
+    "skeletonize_clean",
+]
+
+SkeletonBackend = Callable[[np.ndarray], np.ndarray]
 
-__all__ = ["skeletonize_clean"]
+# scikit-image 0.26 replaced ``min_size`` (removes smaller objects) with
+# ``max_size`` (removes objects of at most that size) and deprecated the old name.
+_HAS_MAX_SIZE = "max_size" in inspect.signature(remove_small_objects).parameters
 
 _NEIGHBORS = [
     (-1, -1),
@@ -44,11 +65,11 @@ def _compute_degree(skel: np.ndarray) -> np.ndarray:
     return degree
 
 
-def _prune_spurs(skel: np.ndarray, max_len: int) -> np.ndarray:
+def _prune_spurs(skel: np.ndarray, max_len: int, in_place: bool = False) -> np.ndarray:
     if max_len <= 0:
         return skel
 
-    work = skel.copy()
+    work = skel if in_place else skel.copy()
     degree = _compute_degree(work)
     endpoints = np.argwhere((work) & (degree == 1))
     to_clear: set[tuple[int, int]] = set()
@@ -115,14 +136,100 @@ def _prune_spurs(skel: np.ndarray, max_len: int) -> np.ndarray:
     return work
 
 
-def skeletonize_clean(bw: np.ndarray, min_obj_area: int, spur_prune_len: int) -> np.ndarray:
-    """Perform skeletonization after simple morphological cleanup."""
+def _zhang_suen(bw: np.ndarray) -> np.ndarray:
+    from .thinning import thin_mask
+
+    return thin_mask(bw, "zhang-suen")
+
+
+def _guo_hall(bw: np.ndarray) -> np.ndarray:
+    from .thinning import thin_mask
+
+    return thin_mask(bw, "guo-hall")
+
+
+SKELETON_BACKENDS: dict[str, SkeletonBackend] = {
+    "skeletonize": skeletonize,
+    "thin": thin,
+    "medial_axis": medial_axis,
+    "zhang-suen": _zhang_suen,
+    "guo-hall": _guo_hall,
+}
+
+
+def register_skeleton_backend(name: str, backend: SkeletonBackend) -> None:
+    """Register ``backend`` under ``name`` for use with :func:`skeletonize_clean`."""
+
+    SKELETON_BACKENDS[name] = backend
+
+
+def available_skeleton_backends() -> list[str]:
+    """Return the registered backends that can run in this environment."""
+
+    from .thinning import numba_available
+
+    names = list(SKELETON_BACKENDS)
+    if not numba_available():
+        names = [name for name in names if name not in NUMBA_SKELETON_BACKENDS]
+    return names
+
+
+def clean_mask(bw: np.ndarray, min_obj_area: int, in_place: bool = False) -> np.ndarray:
+    """Remove connected components smaller than ``min_obj_area`` pixels.
+
+    ``in_place`` overwrites ``bw`` instead of allocating a copy; masks that are
+    not boolean are always converted first.
+    """
 
     if bw.dtype != bool:
         bw = bw.astype(bool)
-
-    cleaned = remove_small_objects(bw, min_size=max(min_obj_area, 1))
-    skel = skeletonize(cleaned)
-    if not skel.any():
-        return skel
-    return _prune_spurs(skel, spur_prune_len)
+        in_place = True
+    out = bw if in_place else None
+    if _HAS_MAX_SIZE:
+        return remove_small_objects(bw, max_size=max(min_obj_area - 1, 0), out=out)
+    return remove_small_objects(bw, min_size=max(min_obj_area, 1), out=out)
+
+
+def skeletonize_clean(
+    bw: np.ndarray,
+    min_obj_area: int,
+    spur_prune_len: int,
+    backend: str = "skeletonize",
+    timings: dict[str, float] | None = None,
+    memory: StageMemory | None = None,
+    in_place: bool = False,
+) -> np.ndarray:
+    """Perform skeletonization after simple morphological cleanup.
+
+    ``backend`` selects an entry of :data:`SKELETON_BACKENDS`.  When
+    ``timings`` is given the seconds spent in the ``cleanup``, ``skeleton`` and
+    ``prune`` steps are stored in it; ``memory`` records their allocations.
+    ``in_place`` lets cleanup overwrite ``bw`` instead of allocating a copy.
+    """
+
+    try:
+        skeleton_fn = SKELETON_BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Unknown skeleton backend: {backend}") from None
+
+    t0 = time.perf_counter()
+    cleaned = clean_mask(bw, min_obj_area, in_place=in_place)
+    t1 = time.perf_counter()
+    if memory is not None:
+        memory.end("cleanup")
+    skel = skeleton_fn(cleaned)
+    t2 = time.perf_counter()
+    if memory is not None:
+        memory.end("skeleton")
+    if skel.any():
+        # ``skel`` is a fresh array or ``cleaned``, never the caller's mask
+        # unless ``in_place`` allowed it, so pruning needs no copy.
+        skel = _prune_spurs(skel, spur_prune_len, in_place=True)
+    t3 = time.perf_counter()
+    if memory is not None:
+        memory.end("prune")
+    if timings is not None:
+        timings["cleanup"] = t1 - t0
+        timings["skeleton"] = t2 - t1
+        timings["prune"] = t3 - t2
+    return skel
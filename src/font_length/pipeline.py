@@ -0,0 +1,303 @@
+"""Per-glyph compute path executed inside worker processes.
+
+Only the modules required to turn a character into metrics are imported here
+so that pool workers stay light to spawn.
+"""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable
+
+import numpy as np
+
+from .estimate import estimate_stroke_length
+from .measure import polylines_bounds, total_length
+from .memprofile import StageMemory
+from .morph import skeletonize_clean
+from .raster import render_glyph_to_binary, render_glyphs_to_binary
+from .rasterstore import _worker_store, raster_store_dir
+from .report import GlyphFailure
+from .resources import peak_rss_bytes
+from .svgout import polylines_to_svg_path_d
+from .vectorize import merge_polylines, skeleton_to_polylines
+
+if TYPE_CHECKING:  # pragma: no cover - the config model is only needed by the parent
+    from .config import Config
+
+__all__ = ["GlyphFailure"]
+
+
+@dataclass(frozen=True)
+class _WorkerConfig:
+    font_path: str
+    point_px: int
+    canvas_px: int
+    margin_px: int
+    binarize: str
+    binary_threshold: int
+    min_obj_area: int
+    spur_prune_len: int
+    simplify_eps: float
+    merge_polylines: bool = False
+    merge_max_turn_deg: float = 30.0
+    svg_precision: int = 0
+    svg_relative: bool = True
+    skeleton_backend: str = "skeletonize"
+    raster_store: str | None = None
+    glyph_timeout: float | None = None
+    retry_point_scale: float | None = None
+    output_scale: float = 1.0
+    executor: str = "process"
+    emit_path: bool = True
+    keep_polylines: bool = False
+    memory_profile: bool = False
+    render_mode: str = "single"
+    engine: str = "skeleton"
+
+
+def _worker_config(cfg: Config, *, emit_path: bool = True, keep_polylines: bool = False) -> _WorkerConfig:
+    store_dir = None
+    if cfg.raster_store:
+        store_dir = str(
+            raster_store_dir(
+                cfg.raster_store,
+                cfg.font_path,
+                cfg.point_px,
+                cfg.canvas_px,
+                cfg.margin_px,
+                cfg.binarize,
+                cfg.binary_threshold,
+            )
+        )
+    return _WorkerConfig(
+        font_path=cfg.font_path,
+        point_px=cfg.point_px,
+        canvas_px=cfg.canvas_px,
+        margin_px=cfg.margin_px,
+        binarize=cfg.binarize,
+        binary_threshold=cfg.binary_threshold,
+        min_obj_area=cfg.min_obj_area,
+        spur_prune_len=cfg.spur_prune_len,
+        simplify_eps=cfg.simplify_eps,
+        merge_polylines=cfg.merge_polylines,
+        merge_max_turn_deg=cfg.merge_max_turn_deg,
+        svg_precision=cfg.svg_precision,
+        svg_relative=cfg.svg_relative,
+        skeleton_backend=cfg.skeleton_backend,
+        raster_store=store_dir,
+        glyph_timeout=cfg.glyph_timeout,
+        retry_point_scale=cfg.retry_point_scale,
+        executor=cfg.resolved_executor(),
+        emit_path=emit_path,
+        keep_polylines=keep_polylines,
+        memory_profile=cfg.memory_profile,
+        render_mode=cfg.render_mode,
+        engine=cfg.engine,
+    )
+
+
+def _compute_metrics(polylines: list[list[tuple[float, float]]]) -> dict[str, Any]:
+    if not polylines:
+        return {"polyline_count": 0, "mean_segment_len": 0.0}
+    total = total_length(polylines)
+    count = len(polylines)
+    return {"polyline_count": count, "mean_segment_len": total / max(count, 1)}
+
+
+def _render_chunk(chars: list[str], cfg: _WorkerConfig) -> dict[str, tuple[np.ndarray, float]]:
+    """Pre-render ``chars`` on a shared atlas when ``render_mode`` is ``"atlas"``.
+
+    Returns masks with an equal share of the atlas time per glyph.  Glyphs held
+    by the raster store are skipped, and any error leaves the glyphs to be
+    rendered (and reported) individually by :func:`_process_char`.
+    """
+
+    if cfg.render_mode != "atlas":
+        return {}
+    store = _worker_store(cfg.raster_store) if cfg.raster_store else None
+    todo = [ch for ch in chars if store is None or ch not in store]
+    if not todo:
+        return {}
+    t0 = time.perf_counter()
+    try:
+        masks = render_glyphs_to_binary(
+            todo,
+            cfg.font_path,
+            cfg.point_px,
+            cfg.canvas_px,
+            cfg.margin_px,
+            binarize=cfg.binarize,
+            binary_threshold=cfg.binary_threshold,
+        )
+    except Exception:  # pragma: no cover - defensive
+        return {}
+    seconds = (time.perf_counter() - t0) / len(todo)
+    return {ch: (mask, seconds) for ch, mask in zip(todo, masks)}
+
+
+def _skeleton_metrics(
+    char: str,
+    bw: np.ndarray,
+    cfg: _WorkerConfig,
+    timings: dict[str, float],
+    memory: StageMemory | None,
+) -> tuple[dict[str, Any], list[list[tuple[float, float]]]] | GlyphFailure:
+    """Measure ``bw`` through skeleton, polylines and path data."""
+
+    codepoint = ord(char)
+    ink_pixels = int(np.count_nonzero(bw))
+    skel = skeletonize_clean(
+        bw,
+        cfg.min_obj_area,
+        cfg.spur_prune_len,
+        backend=cfg.skeleton_backend,
+        timings=timings,
+        memory=memory,
+        in_place=True,
+    )
+    if skel.size == 0 or not skel.any():
+        return GlyphFailure(char, codepoint, "noskeleton")
+
+    skeleton_pixels = int(np.count_nonzero(skel))
+    t0 = time.perf_counter()
+    polylines = skeleton_to_polylines(skel)
+    raw_polyline_count = len(polylines)
+    if cfg.merge_polylines and polylines:
+        # Ink per skeleton pixel approximates the stroke width, which is also
+        # the size of the junction artefacts the merge collapses.
+        stroke_width = ink_pixels / skeleton_pixels
+        polylines = merge_polylines(
+            polylines, cfg.merge_max_turn_deg, micro_len=stroke_width, direction_len=2 * stroke_width
+        )
+    timings["vectorize"] = time.perf_counter() - t0
+    if memory is not None:
+        memory.end("vectorize")
+    if not polylines:
+        return GlyphFailure(char, codepoint, "nopolyline")
+
+    if cfg.output_scale != 1.0:
+        # Retries render at a reduced size; report geometry at full scale.
+        polylines = [[(x * cfg.output_scale, y * cfg.output_scale) for x, y in poly] for poly in polylines]
+        skeleton_pixels = int(round(skeleton_pixels * cfg.output_scale))
+    length = total_length(polylines)
+    bounds = polylines_bounds(polylines)
+    t0 = time.perf_counter()
+    path_d = ""
+    if cfg.emit_path:
+        path_d = polylines_to_svg_path_d(
+            polylines,
+            cfg.simplify_eps,
+            scale=1.0,
+            precision=cfg.svg_precision,
+            relative=cfg.svg_relative,
+            implicit_lineto=True,
+        )
+    timings["serialize"] = time.perf_counter() - t0
+    if memory is not None:
+        memory.end("serialize")
+    metrics = _compute_metrics(polylines)
+    metrics.update(
+        {
+            "path_d": path_d,
+            "bounds": bounds,
+            "total_length": length,
+            "skeleton_pixels": skeleton_pixels,
+            "raw_polyline_count": raw_polyline_count,
+        }
+    )
+    return metrics, polylines
+
+
+def _process_char(
+    char: str, cfg: _WorkerConfig, rendered: tuple[np.ndarray, float] | None = None
+) -> tuple[str, dict[str, Any] | None, GlyphFailure | None]:
+    codepoint = ord(char)
+    timings: dict[str, float] = {}
+    memory = StageMemory() if cfg.memory_profile else None
+    try:
+        if memory is not None:
+            memory.begin()
+        t0 = time.perf_counter()
+        store = _worker_store(cfg.raster_store) if cfg.raster_store else None
+        packed_mask = None
+        render_seconds = 0.0
+        if rendered is not None:
+            bw, render_seconds = rendered
+            if store is not None:
+                packed_mask = (np.packbits(bw, axis=None).tobytes(), bw.shape)
+        else:
+            bw = store.get(char) if store is not None else None
+        if bw is None:
+            bw = render_glyph_to_binary(
+                char,
+                cfg.font_path,
+                cfg.point_px,
+                cfg.canvas_px,
+                cfg.margin_px,
+                binarize=cfg.binarize,
+                binary_threshold=cfg.binary_threshold,
+                reuse_buffers=True,
+            )
+            if store is not None:
+                packed_mask = (np.packbits(bw, axis=None).tobytes(), bw.shape)
+        timings["render"] = render_seconds + time.perf_counter() - t0
+        if memory is not None:
+            memory.end("render")
+        if bw.size == 0 or not bw.any():
+            return char, None, GlyphFailure(char, codepoint, "empty")
+
+        polylines: list[list[tuple[float, float]]] = []
+        if cfg.engine == "distance":
+            estimate = estimate_stroke_length(bw, cfg.min_obj_area, timings=timings, memory=memory, in_place=True)
+            if not estimate.ink_pixels:
+                return char, None, GlyphFailure(char, codepoint, "empty")
+            metrics = _compute_metrics(polylines)
+            metrics.update(
+                {
+                    "path_d": "",
+                    "bounds": tuple(value * cfg.output_scale for value in estimate.bounds),
+                    "total_length": estimate.length * cfg.output_scale,
+                    "stroke_width": estimate.stroke_width * cfg.output_scale,
+                    "skeleton_pixels": 0,
+                }
+            )
+        else:
+            measured = _skeleton_metrics(char, bw, cfg, timings, memory)
+            if isinstance(measured, GlyphFailure):
+                return char, None, measured
+            metrics, polylines = measured
+        metrics.update(
+            {
+                "char": char,
+                "codepoint": codepoint,
+                "timings": timings,
+                "peak_rss": peak_rss_bytes(),
+            }
+        )
+        if memory is not None:
+            metrics["memory"] = memory.to_dict()
+        if cfg.keep_polylines:
+            metrics["polylines"] = polylines
+        if packed_mask is not None:
+            metrics["packed_mask"] = packed_mask
+        return char, metrics, None
+    except Exception as exc:  # pragma: no cover - defensive
+        return char, None, GlyphFailure(char, codepoint, "error", message=str(exc))
+    finally:
+        if memory is not None:
+            memory.close()
+
+
+def _process_chunk(
+    chars: list[str], cfg: _WorkerConfig, on_glyph: Callable[[], None] | None = None
+) -> list[tuple[str, dict[str, Any] | None, GlyphFailure | None]]:
+    """Process ``chars`` in order, calling ``on_glyph`` after each glyph."""
+
+    rendered = _render_chunk(chars, cfg)
+    results = []
+    for ch in chars:
+        results.append(_process_char(ch, cfg, rendered.pop(ch, None)))
+        if on_glyph is not None:
+            on_glyph()
+    return results
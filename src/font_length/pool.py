@@ -0,0 +1,300 @@
+"""Process pool with per-glyph time budgets and crash isolation.
+
+:class:`concurrent.futures.ProcessPoolExecutor` cannot cancel a running task
+and turns a single crashed worker into :class:`BrokenProcessPool` for the whole
+run.  :class:`GlyphPool` instead talks to every worker over its own pipe: the
+worker announces each glyph before processing it, so the parent knows which
+glyph is running, can kill and replace a worker that exceeds the budget or
+dies, and records the glyph as a ``timeout``/``crash`` failure while the rest
+of its chunk is requeued.  The chunk's atlas render is announced as well and
+gets a budget of one glyph timeout per glyph; if it fails, no glyph is blamed
+and the chunk is requeued one glyph per task.
+
+With a memory limit the pool also samples the RSS of its workers and lowers
+the number of concurrently busy workers when the total approaches the limit,
+raising it again once memory pressure eases.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import time
+from collections import deque
+from dataclasses import dataclass, replace
+from multiprocessing.connection import Connection, wait
+from typing import Any, Iterator
+
+from .pipeline import GlyphFailure, _process_char, _render_chunk, _WorkerConfig
+from .resources import process_rss_bytes
+from .telemetry import LiveMetrics
+
+__all__ = ["GlyphPool", "retry_config"]
+
+Result = tuple[str, "dict[str, Any] | None", "GlyphFailure | None"]
+
+_RSS_SAMPLE_INTERVAL = 0.5
+_RSS_HIGH_WATER = 0.9
+_RSS_LOW_WATER = 0.6
+
+
+def _worker_main(conn: Connection) -> None:
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+        chars, cfg = task
+        conn.send(("render", None))
+        rendered = _render_chunk(chars, cfg)
+        for ch in chars:
+            conn.send(("start", ch))
+            conn.send(("result", _process_char(ch, cfg, rendered.pop(ch, None))))
+        conn.send(("done", None))
+    conn.close()
+
+
+def retry_config(cfg: _WorkerConfig) -> _WorkerConfig | None:
+    """Return the reduced-resolution config used to retry a failed glyph."""
+
+    scale = cfg.retry_point_scale
+    if scale is None:
+        return None
+    return replace(
+        cfg,
+        point_px=max(int(round(cfg.point_px * scale)), 1),
+        canvas_px=max(int(round(cfg.canvas_px * scale)), 1),
+        margin_px=int(round(cfg.margin_px * scale)),
+        min_obj_area=int(round(cfg.min_obj_area * scale * scale)),
+        spur_prune_len=int(round(cfg.spur_prune_len * scale)),
+        output_scale=cfg.output_scale / scale,
+        raster_store=None,
+        retry_point_scale=None,
+    )
+
+
+@dataclass
+class _Task:
+    chars: deque[str]
+    cfg: _WorkerConfig
+    retry_of: str | None = None
+
+
+@dataclass
+class _Slot:
+    process: Any
+    conn: Connection
+    task: _Task | None = None
+    current: str | None = None
+    rendering: bool = False
+    started: float = 0.0
+
+
+class GlyphPool:
+    """Run glyph chunks on ``workers`` processes with isolation and time budgets."""
+
+    def __init__(
+        self,
+        workers: int,
+        cfg: _WorkerConfig,
+        memory_limit: int | None = None,
+        telemetry: LiveMetrics | None = None,
+    ) -> None:
+        self.workers = max(int(workers), 1)
+        self.cfg = cfg
+        self.timeout = cfg.glyph_timeout
+        self.retry_cfg = retry_config(cfg)
+        self.memory_limit = memory_limit
+        self.telemetry = telemetry
+        self.active_limit = self.workers
+        self.restarts = 0
+        self.throttle_events = 0
+        self.peak_pool_rss = 0
+        self._last_sample = 0.0
+        self._ctx = multiprocessing.get_context()
+        self._slots: list[_Slot] = []
+
+    # -- worker management -------------------------------------------------
+    def _spawn(self) -> _Slot:
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        process.start()
+        child_conn.close()
+        return _Slot(process=process, conn=parent_conn)
+
+    def _replace(self, slot: _Slot) -> _Slot:
+        if slot.process.is_alive():
+            slot.process.kill()
+        slot.process.join()
+        slot.conn.close()
+        self.restarts += 1
+        new_slot = self._spawn()
+        self._slots[self._slots.index(slot)] = new_slot
+        return new_slot
+
+    def _shutdown(self) -> None:
+        for slot in self._slots:
+            try:
+                if slot.task is None:
+                    slot.conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        deadline = time.monotonic() + 5.0
+        for slot in self._slots:
+            if slot.task is not None:
+                slot.process.kill()
+            slot.process.join(max(deadline - time.monotonic(), 0.0))
+            if slot.process.is_alive():
+                slot.process.kill()
+                slot.process.join()
+            slot.conn.close()
+        self._slots = []
+
+    def _sample_memory(self) -> None:
+        now = time.monotonic()
+        if self.memory_limit is None or now - self._last_sample < _RSS_SAMPLE_INTERVAL:
+            return
+        self._last_sample = now
+        total = sum(process_rss_bytes(slot.process.pid) or 0 for slot in self._slots)
+        self.peak_pool_rss = max(self.peak_pool_rss, total)
+        if total > self.memory_limit * _RSS_HIGH_WATER and self.active_limit > 1:
+            self.active_limit -= 1
+            self.throttle_events += 1
+        elif total < self.memory_limit * _RSS_LOW_WATER and self.active_limit < len(self._slots):
+            self.active_limit += 1
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "restarts": self.restarts,
+            "throttle_events": self.throttle_events,
+            "active_limit": self.active_limit,
+            "peak_pool_rss": self.peak_pool_rss,
+        }
+
+    # -- failure handling --------------------------------------------------
+    def _deadline(self, slot: _Slot) -> float | None:
+        """Return when the glyph or chunk render running on ``slot`` runs out of time."""
+
+        if self.timeout is None or slot.task is None:
+            return None
+        if slot.current is not None:
+            return slot.started + self.timeout
+        if slot.rendering:
+            return slot.started + self.timeout * max(len(slot.task.chars), 1)
+        return None
+
+    def _fail(self, slot: _Slot, reason: str, pending: deque[_Task]) -> Iterator[Result]:
+        task = slot.task
+        assert task is not None
+        char = slot.current
+        if char is None and slot.rendering and len(task.chars) == 1:
+            char = task.chars[0]  # a one-glyph chunk renders only that glyph
+        if char is None:
+            # The worker failed outside any glyph, while rendering the chunk or
+            # between two glyphs.  Requeue without blaming a glyph; after a
+            # failed chunk render, one glyph per task isolates the culprit.
+            if slot.rendering:
+                pending.extendleft(_Task(deque([ch]), task.cfg, task.retry_of) for ch in reversed(task.chars))
+            elif task.chars:
+                pending.appendleft(_Task(task.chars, task.cfg, task.retry_of))
+            return
+        if task.chars and task.chars[0] == char:
+            task.chars.popleft()
+        if task.chars:
+            pending.appendleft(_Task(task.chars, task.cfg, task.retry_of))
+        if task.retry_of is None and self.retry_cfg is not None:
+            pending.appendleft(_Task(deque([char]), self.retry_cfg, retry_of=reason))
+            return
+        message = f"exceeded {self.timeout:g}s budget" if reason == "timeout" else "worker process died"
+        if task.retry_of is not None:
+            reason = task.retry_of
+            message = f"retry at point_px={task.cfg.point_px} also failed: {message}"
+        yield char, None, GlyphFailure(char, ord(char), reason, message=message)
+
+    def _finish_result(self, task: _Task, result: Result) -> Result:
+        char, metrics, failure = result
+        if task.chars and task.chars[0] == char:
+            task.chars.popleft()
+        if task.retry_of is None:
+            return result
+        if metrics is not None:
+            metrics.setdefault("warnings", []).append(
+                f"{task.retry_of}; retried at point_px={task.cfg.point_px}"
+            )
+        elif failure is not None:
+            failure = GlyphFailure(
+                char,
+                failure.codepoint,
+                task.retry_of,
+                message=f"retry at point_px={task.cfg.point_px} failed: {failure.reason}",
+            )
+        return char, metrics, failure
+
+    # -- main loop ---------------------------------------------------------
+    def run(self, chunks: list[list[str]]) -> Iterator[Result]:
+        pending: deque[_Task] = deque(_Task(deque(chunk), self.cfg) for chunk in chunks if chunk)
+        self._slots = [self._spawn() for _ in range(min(self.workers, max(len(pending), 1)))]
+        try:
+            while pending or any(slot.task is not None for slot in self._slots):
+                self._sample_memory()
+                n_busy = sum(slot.task is not None for slot in self._slots)
+                for slot in self._slots:
+                    if slot.task is None and pending and n_busy < self.active_limit:
+                        n_busy += 1
+                        slot.task = pending.popleft()
+                        slot.current = None
+                        slot.rendering = True
+                        slot.started = time.monotonic()
+                        slot.conn.send((list(slot.task.chars), slot.task.cfg))
+
+                busy = [slot for slot in self._slots if slot.task is not None]
+                if self.telemetry is not None:
+                    queued = sum(len(task.chars) for task in pending)
+                    queued += sum(max(len(slot.task.chars) - 1, 0) for slot in busy if slot.task is not None)
+                    self.telemetry.set_load(len(busy), queued)
+                    self.telemetry.tick()
+                wait_timeout = None
+                if self.timeout is not None:
+                    now = time.monotonic()
+                    deadlines = [d - now for d in map(self._deadline, busy) if d is not None]
+                    wait_timeout = max(min(deadlines), 0.0) if deadlines else self.timeout
+                for interval in (
+                    _RSS_SAMPLE_INTERVAL if self.memory_limit is not None else None,
+                    self.telemetry.interval if self.telemetry is not None else None,
+                ):
+                    if interval is not None:
+                        wait_timeout = interval if wait_timeout is None else min(wait_timeout, interval)
+                handles: list[Any] = [slot.conn for slot in busy] + [slot.process.sentinel for slot in busy]
+                ready = set(wait(handles, timeout=wait_timeout))
+
+                for slot in busy:
+                    if slot.conn in ready:
+                        try:
+                            while slot.conn.poll():
+                                kind, payload = slot.conn.recv()
+                                if kind == "render":
+                                    slot.started = time.monotonic()
+                                elif kind == "start":
+                                    slot.current = payload
+                                    slot.rendering = False
+                                    slot.started = time.monotonic()
+                                elif kind == "result":
+                                    assert slot.task is not None
+                                    slot.current = None
+                                    yield self._finish_result(slot.task, payload)
+                                else:
+                                    slot.task = None
+                                    slot.current = None
+                                    break
+                        except (EOFError, OSError):
+                            pass
+                    if slot.task is None:
+                        continue
+                    if slot.process.sentinel in ready or not slot.process.is_alive():
+                        yield from self._fail(slot, "crash", pending)
+                        self._replace(slot)
+                    elif (deadline := self._deadline(slot)) is not None and time.monotonic() > deadline:
+                        yield from self._fail(slot, "timeout", pending)
+                        self._replace(slot)
+        finally:
+            self._shutdown()
@@ -1,18 +1,35 @@
 """Rendering utilities for turning font glyphs into binary masks."""
 from __future__ import annotations
 
+import math
+import threading
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Sequence
 
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
-from skimage import filters
 
-__all__ = ["render_glyph_to_binary"]
+__all__ = ["atlas_capacity", "render_glyph_to_binary", "render_glyphs_to_binary"]
+
+
+_FONT_CACHE = threading.local()
+
+# Pixel budget of one atlas; the uint8 atlas and its boolean mask together
+# take about twice this many bytes.
+_ATLAS_MAX_PIXELS = 32 * 1024 * 1024
 
 
 def _load_font(font_path: str | Path, point_px: int) -> ImageFont.FreeTypeFont:
-    return ImageFont.truetype(str(font_path), size=point_px)
+    # FreeType faces must not be used from several threads at once, so each
+    # thread keeps its own handle; worker processes reuse theirs across glyphs.
+    fonts = getattr(_FONT_CACHE, "fonts", None)
+    if fonts is None:
+        fonts = _FONT_CACHE.fonts = {}
+    key = (str(font_path), point_px)
+    font = fonts.get(key)
+    if font is None:
+        font = fonts[key] = ImageFont.truetype(str(font_path), size=point_px)
+    return font
 
 
 def _glyph_bbox(font: ImageFont.FreeTypeFont, char: str) -> tuple[int, int, int, int]:
@@ -31,21 +48,65 @@ def _center_position(canvas_px: int, bbox: tuple[int, int, int, int]) -> tuple[f
     return x, y
 
 
-def _trim_margin(mask: np.ndarray, margin_px: int) -> np.ndarray:
-    if not mask.any():
+def _trim_margin(
+    mask: np.ndarray, margin_px: int, region: tuple[int, int, int, int] | None = None
+) -> np.ndarray:
+    """Return the view of ``mask`` around its ink plus ``margin_px``.
+
+    ``region`` (``y0, y1, x0, x1``) limits the search for ink when the caller
+    knows that ``mask`` is empty outside of it.
+    """
+
+    y_off = x_off = 0
+    search = mask
+    if region is not None:
+        y_off, _, x_off, _ = region
+        search = mask[region[0] : region[1], region[2] : region[3]]
+    if not search.any():
         return mask
 
-    rows = np.any(mask, axis=1)
-    cols = np.any(mask, axis=0)
-    y_indices = np.where(rows)[0]
-    x_indices = np.where(cols)[0]
-    y0 = max(int(y_indices[0]) - margin_px, 0)
-    y1 = min(int(y_indices[-1]) + margin_px + 1, mask.shape[0])
-    x0 = max(int(x_indices[0]) - margin_px, 0)
-    x1 = min(int(x_indices[-1]) + margin_px + 1, mask.shape[1])
+    rows = np.any(search, axis=1)
+    cols = np.any(search, axis=0)
+    y_indices = np.flatnonzero(rows)
+    x_indices = np.flatnonzero(cols)
+    y0 = max(y_off + int(y_indices[0]) - margin_px, 0)
+    y1 = min(y_off + int(y_indices[-1]) + margin_px + 1, mask.shape[0])
+    x0 = max(x_off + int(x_indices[0]) - margin_px, 0)
+    x1 = min(x_off + int(x_indices[-1]) + margin_px + 1, mask.shape[1])
     return mask[y0:y1, x0:x1]
 
 
+class _RenderScratch:
+    """Per-thread canvas image and mask reused across glyphs of one size.
+
+    Only the region the previous glyph inked is cleared, so steady-state
+    rendering allocates nothing canvas-sized.
+    """
+
+    def __init__(self, canvas_px: int) -> None:
+        self.image = Image.new("L", (canvas_px, canvas_px), 0)
+        self.draw = ImageDraw.Draw(self.image)
+        self.mask = np.zeros((canvas_px, canvas_px), dtype=bool)
+        self.dirty: tuple[int, int, int, int] | None = None
+
+    def clear(self) -> None:
+        if self.dirty is not None:
+            x0, y0, x1, y1 = self.dirty
+            self.image.paste(0, self.dirty)
+            self.mask[y0:y1, x0:x1] = False
+            self.dirty = None
+
+
+def _render_scratch(canvas_px: int) -> _RenderScratch:
+    scratches = getattr(_FONT_CACHE, "scratch", None)
+    if scratches is None:
+        scratches = _FONT_CACHE.scratch = {}
+    scratch = scratches.get(canvas_px)
+    if scratch is None:
+        scratch = scratches[canvas_px] = _RenderScratch(canvas_px)
+    return scratch
+
+
 def render_glyph_to_binary(
     char: str,
     font_path: str | Path,
@@ -54,25 +115,157 @@ def render_glyph_to_binary(
     margin_px: int,
     binarize: Literal["otsu", "fixed"] = "otsu",
     binary_threshold: int = 128,
+    reuse_buffers: bool = False,
 ) -> np.ndarray:
     """Render ``char`` into a binary numpy array using ``font_path``.
 
     The returned array is of dtype ``bool`` with ``True`` indicating the glyph
-    foreground.
+    foreground.  Only the region around the glyph's ink box is read back from
+    the canvas, thresholded and trimmed.  With ``reuse_buffers`` the result
+    is a view into a per-thread scratch mask that the next call on the same
+    thread overwrites; otherwise a private copy is returned.
     """
 
     font = _load_font(font_path, point_px)
-    image = Image.new("L", (canvas_px, canvas_px), 0)
-    draw = ImageDraw.Draw(image)
-    bbox = _glyph_bbox(font, char)
-    x, y = _center_position(canvas_px, bbox)
-    draw.text((x, y), char, fill=255, font=font)
+    scratch = _render_scratch(canvas_px)
+    scratch.clear()
+    x, y = _center_position(canvas_px, _glyph_bbox(font, char))
+    scratch.draw.text((x, y), char, fill=255, font=font)
 
-    arr = np.array(image, dtype=np.uint8)
+    # Ink lies inside the default-anchor bbox moved to (x, y); two pixels of
+    # slack cover the fractional pen position.
+    left, top, right, bottom = font.getbbox(char)
+    box = (
+        min(max(int(x + left) - 2, 0), canvas_px),
+        min(max(int(y + top) - 2, 0), canvas_px),
+        min(max(int(x + right) + 3, 0), canvas_px),
+        min(max(int(y + bottom) + 3, 0), canvas_px),
+    )
+    x0, y0, x1, y1 = box
+    scratch.dirty = box
+    region = scratch.image.crop(box)
     if binarize == "otsu":
-        threshold = filters.threshold_otsu(arr) if arr.any() else 0
+        hist = np.asarray(region.histogram(), dtype=np.int64)
+        # The rest of the canvas is background and counts towards bin 0.
+        hist[0] += canvas_px * canvas_px - (x1 - x0) * (y1 - y0)
+        threshold = int(_otsu_thresholds(hist[None, :])[0]) if hist[1:].any() else 0
     else:
         threshold = int(binary_threshold)
-    mask = arr > threshold
-    mask = _trim_margin(mask, margin_px)
-    return mask.astype(bool)
+    mask = scratch.mask
+    np.greater(np.asarray(region), threshold, out=mask[y0:y1, x0:x1])
+    trimmed = _trim_margin(mask, margin_px, (y0, y1, x0, x1))
+    return trimmed if reuse_buffers else trimmed.copy()
+
+
+def atlas_capacity(canvas_px: int) -> int:
+    """Return how many ``canvas_px`` cells fit into one atlas."""
+
+    return max(_ATLAS_MAX_PIXELS // (canvas_px * canvas_px), 1)
+
+
+def _otsu_thresholds(hist: np.ndarray) -> np.ndarray:
+    """Return the Otsu threshold of every row of a ``(cells, 256)`` histogram.
+
+    Follows :func:`skimage.filters.threshold_otsu` for ``uint8`` images
+    (histogram restricted to the occupied intensity range, ``float32`` counts),
+    so that every cell gets exactly the threshold of a separate render.
+    """
+
+    counts = hist.astype(np.float32)
+    bin_centers = np.arange(hist.shape[1])
+    weight1 = np.cumsum(counts, axis=1)
+    weight2 = np.cumsum(counts[:, ::-1], axis=1)[:, ::-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean1 = np.cumsum(counts * bin_centers, axis=1) / weight1
+        mean2 = (np.cumsum((counts * bin_centers)[:, ::-1], axis=1) / weight2[:, ::-1])[:, ::-1]
+    variance12 = weight1[:, :-1] * weight2[:, 1:] * (mean1[:, :-1] - mean2[:, 1:]) ** 2
+
+    occupied = hist > 0
+    lo = np.argmax(occupied, axis=1)
+    hi = hist.shape[1] - 1 - np.argmax(occupied[:, ::-1], axis=1)
+    candidates = bin_centers[:-1]
+    valid = (candidates >= lo[:, None]) & (candidates < hi[:, None])
+    variance12 = np.where(valid, variance12, -np.inf)
+    # A cell with a single intensity has no split; skimage returns that value.
+    return np.where(lo == hi, lo, np.argmax(variance12, axis=1))
+
+
+def render_glyphs_to_binary(
+    chars: Sequence[str],
+    font_path: str | Path,
+    point_px: int,
+    canvas_px: int,
+    margin_px: int,
+    binarize: Literal["otsu", "fixed"] = "otsu",
+    binary_threshold: int = 128,
+) -> list[np.ndarray]:
+    """Render ``chars`` in batches on shared atlas images.
+
+    Every glyph is centred in its own ``canvas_px`` cell exactly as in
+    :func:`render_glyph_to_binary`, the atlas is drawn and thresholded in one
+    pass and trimming bounds are computed for all cells at once.  The returned
+    masks are views into the atlas mask and equal the single-glyph results.
+    Glyphs whose ink is clipped by the canvas in a single render would bleed
+    into their neighbours and are rendered on their own.
+    """
+
+    font = _load_font(font_path, point_px)
+    masks: list[np.ndarray | None] = [None] * len(chars)
+    batch: list[tuple[int, str, tuple[float, float]]] = []
+    for i, char in enumerate(chars):
+        # ``draw.text`` uses the default anchor, so the ink lands at the
+        # default-anchor bbox shifted by (x, y); it must stay inside the cell
+        # (with a pixel of antialiasing slack) to leave the neighbours alone.
+        # The "lt" bbox used for centring is the same box moved to top 0,
+        # which saves a second FreeType layout per glyph.
+        left, top, right, bottom = font.getbbox(char)
+        x, y = _center_position(canvas_px, (left, 0, right, bottom - top))
+        if x + left < 1 or y + top < 1 or x + right > canvas_px - 1 or y + bottom > canvas_px - 1:
+            masks[i] = render_glyph_to_binary(
+                char, font_path, point_px, canvas_px, margin_px, binarize, binary_threshold
+            )
+        else:
+            batch.append((i, char, (x, y)))
+
+    capacity = atlas_capacity(canvas_px)
+    for start in range(0, len(batch), capacity):
+        cells = batch[start : start + capacity]
+        n_cols = math.ceil(math.sqrt(len(cells)))
+        n_rows = math.ceil(len(cells) / n_cols)
+        image = Image.new("L", (n_cols * canvas_px, n_rows * canvas_px), 0)
+        draw = ImageDraw.Draw(image)
+        for k, (_, char, (x, y)) in enumerate(cells):
+            row, col = divmod(k, n_cols)
+            draw.text((col * canvas_px + x, row * canvas_px + y), char, fill=255, font=font)
+
+        # (rows, y, cols, x) view: cell (r, c) is grid[r, :, c, :].
+        grid = np.asarray(image).reshape(n_rows, canvas_px, n_cols, canvas_px)
+        if binarize == "otsu":
+            # Pillow's C histogram is much faster than ``np.bincount``, which
+            # widens every uint8 pixel to intp first.
+            hist = np.zeros((n_rows * n_cols, 256), dtype=np.int64)
+            for k in range(len(cells)):
+                row, col = divmod(k, n_cols)
+                box = (col * canvas_px, row * canvas_px, (col + 1) * canvas_px, (row + 1) * canvas_px)
+                hist[k] = image.crop(box).histogram()
+            thresholds = np.where(hist[:, 1:].any(axis=1), _otsu_thresholds(hist), 0)
+        else:
+            thresholds = np.full(n_rows * n_cols, int(binary_threshold))
+        mask = grid > thresholds.reshape(n_rows, 1, n_cols, 1)
+
+        rows_any = mask.any(axis=3)  # (rows, y, cols)
+        cols_any = mask.any(axis=1)  # (rows, cols, x)
+        for k, (i, _, _) in enumerate(cells):
+            row, col = divmod(k, n_cols)
+            cell = mask[row, :, col, :]
+            ys = rows_any[row, :, col]
+            xs = cols_any[row, col]
+            if not ys.any():
+                masks[i] = cell
+                continue
+            y0 = max(int(np.argmax(ys)) - margin_px, 0)
+            y1 = min(canvas_px - int(np.argmax(ys[::-1])) + margin_px, canvas_px)
+            x0 = max(int(np.argmax(xs)) - margin_px, 0)
+            x1 = min(canvas_px - int(np.argmax(xs[::-1])) + margin_px, canvas_px)
+            masks[i] = cell[y0:y1, x0:x1]
+    return masks  # type: ignore[return-value]
@@ -0,0 +1,220 @@
+"""Persistent, bit-packed store for rendered glyph masks.
+
+Masks produced by :func:`render_glyph_to_binary` are appended to a single
+``masks.bin`` file with :func:`numpy.packbits`; ``index.json`` maps each
+character to its byte offset and shape.  One store directory exists per
+``(font hash, point_px, canvas_px, margin_px, binarization)`` tuple so that
+later runs (and skeleton/vectorization experiments) can skip FreeType
+entirely and read masks through :class:`numpy.memmap`.
+
+Runs may share a store: :meth:`RasterStore.flush` holds an exclusive lock on
+``store.lock`` (``fcntl``; no locking where it is unavailable) while it appends
+to ``masks.bin`` and merges the index on disk with its own entries.  The data
+is synced before the new index replaces the old one, so an index entry never
+points at bytes that were not written.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterator
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+__all__ = ["RasterStore", "font_hash", "raster_store_dir"]
+
+_DATA_FILE = "masks.bin"
+_INDEX_FILE = "index.json"
+_LOCK_FILE = "store.lock"
+# Pending masks are written once they exceed this many packed bytes, so a run
+# keeps a bounded amount of mask data in memory and a crash loses little.
+_FLUSH_BYTES = 32 << 20
+_INDEX_VERSION = 1
+
+
+@lru_cache(maxsize=None)
+def _font_hash_cached(path: str, size: int, mtime_ns: int) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def font_hash(font_path: str | Path) -> str:
+    """Return the SHA-256 of the font file, cached per path, size and mtime."""
+
+    stat = os.stat(font_path)
+    return _font_hash_cached(str(font_path), stat.st_size, stat.st_mtime_ns)
+
+
+def raster_store_dir(
+    root: str | Path,
+    font_path: str | Path,
+    point_px: int,
+    canvas_px: int,
+    margin_px: int,
+    binarize: str,
+    binary_threshold: int,
+) -> Path:
+    """Return the store directory under ``root`` for one rendering setup."""
+
+    binarization = binarize if binarize == "otsu" else f"{binarize}{binary_threshold}"
+    key = f"{font_hash(font_path)[:16]}-p{point_px}-c{canvas_px}-m{margin_px}-{binarization}"
+    return Path(root) / key
+
+
+@contextmanager
+def _locked(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on ``path`` for the duration of the block."""
+
+    with path.open("a") as fh:
+        if fcntl is not None:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+
+class RasterStore:
+    """Append-only mask store living in ``directory``.
+
+    Reads go through a read-only :class:`numpy.memmap` of the data file that is
+    opened lazily and reused, so looking up a mask never copies the packed
+    bytes.  New masks are buffered by :meth:`add` and written by :meth:`flush`,
+    which runs automatically once ``flush_bytes`` of packed data are pending;
+    readers only see them after reopening the store.
+    """
+
+    def __init__(self, directory: str | Path, flush_bytes: int | None = None) -> None:
+        self.directory = Path(directory)
+        self.flush_bytes = _FLUSH_BYTES if flush_bytes is None else max(int(flush_bytes), 1)
+        self.masks_written = 0
+        self._pending_bytes = 0
+        self.data_path = self.directory / _DATA_FILE
+        self.index_path = self.directory / _INDEX_FILE
+        self._index: dict[str, tuple[int, int, int]] = {}
+        self._pending: list[tuple[str, bytes, tuple[int, int]]] = []
+        self._data: np.ndarray | None = None
+        self._index = self._read_index()
+
+    def _read_index(self) -> dict[str, tuple[int, int, int]]:
+        if not self.index_path.exists():
+            return {}
+        raw = json.loads(self.index_path.read_text(encoding="utf-8"))
+        if raw.get("version") != _INDEX_VERSION:
+            return {}
+        return {ch: (int(o), int(h), int(w)) for ch, (o, h, w) in raw["entries"].items()}
+
+    def __contains__(self, char: object) -> bool:
+        return char in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _mapped(self) -> np.ndarray:
+        if self._data is None:
+            if not self.data_path.exists() or self.data_path.stat().st_size == 0:
+                self._data = np.zeros(0, dtype=np.uint8)
+            else:
+                self._data = np.memmap(self.data_path, dtype=np.uint8, mode="r")
+        return self._data
+
+    def get(self, char: str) -> np.ndarray | None:
+        """Return the stored mask for ``char`` or ``None`` when missing."""
+
+        entry = self._index.get(char)
+        if entry is None:
+            return None
+        offset, height, width = entry
+        count = height * width
+        packed = self._mapped()[offset : offset + (count + 7) // 8]
+        return np.unpackbits(packed, count=count).reshape(height, width).view(bool)
+
+    def add(self, char: str, mask: np.ndarray) -> None:
+        """Queue ``mask`` for ``char``; see :meth:`add_packed`."""
+
+        mask = np.ascontiguousarray(mask, dtype=bool)
+        self.add_packed(char, np.packbits(mask, axis=None).tobytes(), mask.shape)
+
+    def add_packed(self, char: str, packed: bytes, shape: tuple[int, int]) -> None:
+        """Queue already packed mask bytes for ``char``, flushing when enough are pending."""
+
+        if char in self._index:
+            return
+        self._pending.append((char, packed, (int(shape[0]), int(shape[1]))))
+        self._pending_bytes += len(packed)
+        if self._pending_bytes >= self.flush_bytes:
+            self.flush()
+
+    def absorb(self, metrics: dict[str, Any]) -> None:
+        """Move a ``packed_mask`` entry produced by a worker into the store."""
+
+        packed = metrics.pop("packed_mask", None)
+        if packed is not None:
+            data, shape = packed
+            self.add_packed(metrics["char"], data, shape)
+
+    def flush(self) -> int:
+        """Append pending masks to disk and rewrite the index.
+
+        Masks another run stored since this store was opened are kept and not
+        written twice.  Returns the number of masks written by this call;
+        ``masks_written`` counts all flushes.
+        """
+
+        if not self._pending:
+            return 0
+        self.directory.mkdir(parents=True, exist_ok=True)
+        written = 0
+        with _locked(self.directory / _LOCK_FILE):
+            self._index.update(self._read_index())
+            with self.data_path.open("ab") as fh:
+                offset = fh.seek(0, os.SEEK_END)
+                for char, packed, (height, width) in self._pending:
+                    if char in self._index:
+                        continue
+                    fh.write(packed)
+                    self._index[char] = (offset, height, width)
+                    offset += len(packed)
+                    written += 1
+                fh.flush()
+                os.fsync(fh.fileno())
+            payload = {
+                "version": _INDEX_VERSION,
+                "entries": {ch: list(entry) for ch, entry in self._index.items()},
+            }
+            fd, tmp_name = tempfile.mkstemp(prefix=".index-", suffix=".tmp", dir=self.directory)
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(payload, fh, ensure_ascii=False)
+            os.replace(tmp_name, self.index_path)
+        self._pending.clear()
+        self._pending_bytes = 0
+        self._data = None
+        self.masks_written += written
+        return written
+
+
+@lru_cache(maxsize=4)
+def _open_cached(directory: str, index_mtime_ns: int) -> RasterStore:
+    return RasterStore(directory)
+
+
+def _worker_store(directory: str) -> RasterStore:
+    """Return a per-process store handle, reopened whenever the index changes."""
+
+    index_path = Path(directory) / _INDEX_FILE
+    mtime_ns = index_path.stat().st_mtime_ns if index_path.exists() else 0
+    return _open_cached(directory, mtime_ns)
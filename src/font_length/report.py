@@ -0,0 +1,282 @@
+"""Reports built from stored per-glyph results.
+
+Every conversion run writes ``glyph_results.jsonl`` next to its SVGs, one JSON
+object per processed or failed glyph.  The helpers here rebuild the SVGs, the
+CSV report and ``summary.json`` from that file without running the pipeline,
+and compare the lengths of two runs character by character.
+
+The module only needs the standard library (SVG writing loads NumPy on demand),
+so the ``report`` subcommand starts without the imaging stack.
+"""
+from __future__ import annotations
+
+import csv
+import json
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Iterable, TextIO
+
+__all__ = [
+    "CSV_HEADER",
+    "GlyphFailure",
+    "GlyphResult",
+    "LengthDelta",
+    "RESULTS_FILENAME",
+    "Summary",
+    "compare_runs",
+    "load_glyph_results",
+    "regenerate_reports",
+    "write_length_deltas",
+]
+
+RESULTS_FILENAME = "glyph_results.jsonl"
+CSV_HEADER = ["char", "codepoint_hex", "total_length_px", "svg_file", "polyline_count", "skeleton_pixels"]
+
+
+@dataclass
+class GlyphFailure:
+    char: str
+    codepoint: int
+    reason: str
+    message: str | None = None
+
+
+@dataclass
+class GlyphResult:
+    char: str
+    codepoint: int
+    path_d: str
+    svg_filename: str
+    total_length: float
+    bounds: tuple[float, float, float, float]
+    polyline_count: int
+    skeleton_pixels: int
+    warnings: list[str] = field(default_factory=list)
+    timings: dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def from_metrics(cls, metrics: dict[str, Any]) -> GlyphResult:
+        return cls(
+            char=metrics["char"],
+            codepoint=metrics["codepoint"],
+            path_d=metrics["path_d"],
+            # The distance engine measures without path data and gets no SVG.
+            svg_filename=f"U{metrics['codepoint']:04X}.svg" if metrics["path_d"] else "",
+            total_length=metrics["total_length"],
+            bounds=tuple(metrics["bounds"]),
+            polyline_count=metrics.get("polyline_count", 0),
+            skeleton_pixels=metrics.get("skeleton_pixels", 0),
+            warnings=list(metrics.get("warnings", [])),
+            timings=dict(metrics.get("timings", {})),
+        )
+
+    def csv_row(self) -> list[Any]:
+        return [
+            self.char,
+            f"{self.codepoint:04X}",
+            f"{self.total_length:.3f}",
+            self.svg_filename,
+            self.polyline_count,
+            self.skeleton_pixels,
+        ]
+
+
+@dataclass
+class Summary:
+    processed: int
+    failures: list[GlyphFailure]
+    duration_seconds: float
+    top_lengths: list[tuple[str, float, str]]
+    metadata: dict[str, Any]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "processed": self.processed,
+            "failures": [f.__dict__ for f in self.failures],
+            "duration_seconds": self.duration_seconds,
+            "top_lengths": [
+                {"char": char, "total_length": length, "svg": svg} for char, length, svg in self.top_lengths
+            ],
+            "metadata": self.metadata,
+        }
+
+
+def write_result_line(fh: TextIO, item: GlyphResult | GlyphFailure) -> None:
+    """Append one result or failure to an open ``glyph_results.jsonl``."""
+
+    if isinstance(item, GlyphFailure):
+        record: dict[str, Any] = {"failure": item.__dict__}
+    else:
+        record = {"result": item.__dict__}
+    fh.write(json.dumps(record, ensure_ascii=False))
+    fh.write("\n")
+
+
+def load_glyph_results(run_dir: str | Path) -> tuple[list[GlyphResult], list[GlyphFailure]]:
+    """Read the results and failures stored in ``run_dir``."""
+
+    path = Path(run_dir) / RESULTS_FILENAME
+    if not path.exists():
+        raise FileNotFoundError(f"{path} not found; run the converter first")
+    results: list[GlyphResult] = []
+    failures: list[GlyphFailure] = []
+    with path.open(encoding="utf-8") as fh:
+        for line in fh:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if "failure" in record:
+                failures.append(GlyphFailure(**record["failure"]))
+            else:
+                data = record["result"]
+                data["bounds"] = tuple(data["bounds"])
+                results.append(GlyphResult(**data))
+    return results, failures
+
+
+def top_lengths(results: Iterable[GlyphResult], top_k: int) -> list[tuple[str, float, str]]:
+    ranked = sorted(results, key=lambda r: r.total_length, reverse=True)
+    return [(res.char, res.total_length, res.svg_filename) for res in ranked[:top_k]]
+
+
+def build_summary(
+    results: list[GlyphResult],
+    failures: list[GlyphFailure],
+    duration: float,
+    metadata: dict[str, Any],
+    top_k: int = 20,
+) -> Summary:
+    metadata = {
+        **metadata,
+        "top_k": top_k,
+        "failures": len(failures),
+        "failure_reasons": dict(Counter(f.reason for f in failures)),
+    }
+    return Summary(
+        processed=len(results),
+        failures=failures,
+        duration_seconds=duration,
+        top_lengths=top_lengths(results, top_k),
+        metadata=metadata,
+    )
+
+
+def write_summary(summary: Summary, out_dir: str | Path) -> Path:
+    summary_path = Path(out_dir) / "summary.json"
+    summary_path.write_text(json.dumps(summary.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+    return summary_path
+
+
+def regenerate_reports(
+    run_dir: str | Path,
+    out_dir: str | Path | None = None,
+    stroke_width: float | None = None,
+    top_k: int | None = None,
+    write_svgs: bool = True,
+) -> Summary:
+    """Rebuild SVGs, ``stroke_length_report.csv`` and ``summary.json`` from ``run_dir``.
+
+    Metadata of the original ``summary.json`` is kept; ``stroke_width`` and
+    ``top_k`` default to the values recorded there.  Without ``write_svgs`` the
+    CSV and summary leave the SVG file empty for glyphs whose SVG does not
+    exist in ``out_dir``.
+    """
+
+    run_dir = Path(run_dir)
+    out_dir = Path(out_dir) if out_dir is not None else run_dir
+    out_dir.mkdir(parents=True, exist_ok=True)
+    results, failures = load_glyph_results(run_dir)
+
+    previous: dict[str, Any] = {}
+    summary_path = run_dir / "summary.json"
+    if summary_path.exists():
+        previous = json.loads(summary_path.read_text(encoding="utf-8"))
+    metadata = dict(previous.get("metadata", {}))
+    if stroke_width is None:
+        stroke_width = float(metadata.get("stroke_width", 1.0))
+    if top_k is None:
+        top_k = int(metadata.get("top_k", 20))
+    metadata["stroke_width"] = stroke_width
+    metadata["report"] = {"source": str(run_dir), "top_k": top_k}
+
+    listed = results
+    if write_svgs:
+        from .svgout import write_svg
+
+        for res in results:
+            if res.svg_filename:
+                write_svg(res.path_d, out_dir / res.svg_filename, stroke_width=stroke_width, view_box=res.bounds)
+    else:
+        listed = [
+            res if not res.svg_filename or (out_dir / res.svg_filename).exists() else replace(res, svg_filename="")
+            for res in results
+        ]
+    with (out_dir / "stroke_length_report.csv").open("w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(CSV_HEADER)
+        for res in listed:
+            writer.writerow(res.csv_row())
+
+    if out_dir != run_dir:
+        with (out_dir / RESULTS_FILENAME).open("w", encoding="utf-8") as fh:
+            for item in [*results, *failures]:
+                write_result_line(fh, item)
+
+    summary = build_summary(listed, failures, float(previous.get("duration_seconds", 0.0)), metadata, top_k)
+    write_summary(summary, out_dir)
+    return summary
+
+
+@dataclass
+class LengthDelta:
+    char: str
+    codepoint: int
+    baseline_length: float | None
+    length: float | None
+
+    @property
+    def delta(self) -> float | None:
+        if self.baseline_length is None or self.length is None:
+            return None
+        return self.length - self.baseline_length
+
+    @property
+    def ratio(self) -> float | None:
+        if not self.baseline_length or self.length is None:
+            return None
+        return self.length / self.baseline_length
+
+
+def compare_runs(run_dir: str | Path, baseline_dir: str | Path) -> list[LengthDelta]:
+    """Return per-character length deltas of ``run_dir`` against ``baseline_dir``.
+
+    Characters present in both runs come first, ordered by decreasing absolute
+    delta; characters missing from either run follow in codepoint order.
+    """
+
+    run, _ = load_glyph_results(run_dir)
+    baseline, _ = load_glyph_results(baseline_dir)
+    lengths = {res.char: res.total_length for res in run}
+    base_lengths = {res.char: res.total_length for res in baseline}
+    deltas = [
+        LengthDelta(ch, ord(ch), base_lengths.get(ch), lengths.get(ch)) for ch in set(lengths) | set(base_lengths)
+    ]
+    return sorted(deltas, key=lambda d: (d.delta is None, -abs(d.delta or 0.0), d.codepoint))
+
+
+def write_length_deltas(deltas: Iterable[LengthDelta], out_path: str | Path) -> Path:
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def fmt(value: float | None, spec: str = ".3f") -> str:
+        return "" if value is None else format(value, spec)
+
+    with out_path.open("w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["char", "codepoint_hex", "baseline_length_px", "length_px", "delta_px", "ratio"])
+        for d in deltas:
+            writer.writerow(
+                [d.char, f"{d.codepoint:04X}", fmt(d.baseline_length), fmt(d.length), fmt(d.delta), fmt(d.ratio, ".4f")]
+            )
+    return out_path
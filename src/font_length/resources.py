@@ -0,0 +1,189 @@
+"""Memory and CPU discovery used to size the worker pool.
+
+Reads cgroup v1/v2 limits so that containers are sized by their quota rather
+than by the host, and keeps a small history of measured per-worker peak memory
+per canvas size.  Only the standard library is imported here so that the
+module is cheap for both the parent and workers.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+from pathlib import Path
+
+__all__ = [
+    "auto_workers",
+    "available_memory_bytes",
+    "cpu_limit",
+    "estimate_worker_peak_bytes",
+    "load_worker_peaks",
+    "parse_memory_size",
+    "peak_rss_bytes",
+    "process_rss_bytes",
+    "save_worker_peak",
+]
+
+# Fallback model when no measurement exists: interpreter plus numpy/skimage
+# baseline and the canvas-sized arrays of one glyph (PIL canvas, uint8 copy,
+# boolean masks, int64 labels in remove_small_objects and skeleton buffers).
+_BASE_WORKER_BYTES = 160 * 1024 * 1024
+_BYTES_PER_CANVAS_PIXEL = 40
+# Fraction of the available memory the pool may use; the rest is headroom for
+# the parent process, page cache and allocator fragmentation.
+_MEMORY_HEADROOM = 0.8
+
+_SIZE_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([kmgt]?)(i?b)?\s*$", re.IGNORECASE)
+_UNITS = {"": 1, "k": 1024, "m": 1024**2, "g": 1024**3, "t": 1024**4}
+
+
+def parse_memory_size(value: str | int) -> int:
+    """Parse ``"512M"``, ``"4G"``, ``"1.5GiB"`` or a byte count into bytes."""
+
+    if isinstance(value, int):
+        return value
+    match = _SIZE_RE.match(value)
+    if not match:
+        raise ValueError(f"Invalid memory size: {value!r}")
+    number, unit, _ = match.groups()
+    return int(float(number) * _UNITS[unit.lower()])
+
+
+def _read_int(path: str) -> int | None:
+    try:
+        text = Path(path).read_text().strip()
+    except OSError:
+        return None
+    if not text or text == "max":
+        return None
+    try:
+        return int(text.split()[0])
+    except ValueError:
+        return None
+
+
+def _cgroup_available() -> int | None:
+    # cgroup v2
+    limit = _read_int("/sys/fs/cgroup/memory.max")
+    usage = _read_int("/sys/fs/cgroup/memory.current")
+    if limit is None:
+        # cgroup v1 reports "no limit" as a huge page-aligned number.
+        limit = _read_int("/sys/fs/cgroup/memory/memory.limit_in_bytes")
+        usage = _read_int("/sys/fs/cgroup/memory/memory.usage_in_bytes")
+        if limit is not None and limit >= 1 << 60:
+            limit = None
+    if limit is None:
+        return None
+    return max(limit - (usage or 0), 0)
+
+
+def _meminfo_available() -> int | None:
+    try:
+        with open("/proc/meminfo", encoding="ascii") as fh:
+            for line in fh:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+    return None
+
+
+def available_memory_bytes() -> int | None:
+    """Return memory available to this process tree, honouring cgroup limits."""
+
+    candidates = [value for value in (_meminfo_available(), _cgroup_available()) if value is not None]
+    return min(candidates) if candidates else None
+
+
+def cpu_limit() -> int:
+    """Return usable CPUs from the affinity mask and any cgroup CPU quota."""
+
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover - non-Linux
+        cpus = os.cpu_count() or 1
+    try:
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+        if quota != "max":
+            cpus = min(cpus, max(int(int(quota) / int(period)), 1))
+    except (OSError, ValueError):
+        quota_v1 = _read_int("/sys/fs/cgroup/cpu/cpu.cfs_quota_us")
+        period_v1 = _read_int("/sys/fs/cgroup/cpu/cpu.cfs_period_us")
+        if quota_v1 and quota_v1 > 0 and period_v1:
+            cpus = min(cpus, max(quota_v1 // period_v1, 1))
+    return max(cpus, 1)
+
+
+def process_rss_bytes(pid: int) -> int | None:
+    """Return the resident set size of ``pid`` (Linux only)."""
+
+    try:
+        with open(f"/proc/{pid}/statm", encoding="ascii") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def peak_rss_bytes() -> int | None:
+    """Return this process' peak RSS, or ``None`` where unsupported."""
+
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - Windows
+        return None
+    return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss) * 1024
+
+
+def load_worker_peaks(path: str | Path) -> dict[int, int]:
+    """Return measured per-worker peak bytes keyed by ``canvas_px``."""
+
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return {int(canvas): int(peak) for canvas, peak in data.get("peaks", {}).items()}
+
+
+def save_worker_peak(path: str | Path, canvas_px: int, peak_bytes: int) -> None:
+    """Record the measured worker peak for ``canvas_px`` in ``path``."""
+
+    path = Path(path)
+    peaks = load_worker_peaks(path)
+    peaks[int(canvas_px)] = int(peak_bytes)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"peaks": {str(k): v for k, v in sorted(peaks.items())}}), encoding="utf-8")
+
+
+def estimate_worker_peak_bytes(canvas_px: int, measured: dict[int, int] | None = None) -> int:
+    """Estimate the peak memory of one worker for ``canvas_px``.
+
+    An exact measurement is used when available; otherwise the closest
+    measured canvas size is scaled by area, falling back to a static model.
+    """
+
+    if measured:
+        if canvas_px in measured:
+            return measured[canvas_px]
+        nearest = min(measured, key=lambda size: abs(size - canvas_px))
+        variable = max(measured[nearest] - _BASE_WORKER_BYTES, 0)
+        return int(_BASE_WORKER_BYTES + variable * (canvas_px / nearest) ** 2)
+    return _BASE_WORKER_BYTES + _BYTES_PER_CANVAS_PIXEL * canvas_px * canvas_px
+
+
+def auto_workers(
+    canvas_px: int,
+    max_memory: int | None = None,
+    measured: dict[int, int] | None = None,
+) -> int:
+    """Pick a worker count from CPUs, available memory and ``max_memory``."""
+
+    cpus = cpu_limit()
+    budget = available_memory_bytes()
+    if budget is not None:
+        budget = int(budget * _MEMORY_HEADROOM)
+    if max_memory is not None:
+        budget = max_memory if budget is None else min(budget, max_memory)
+    if budget is None:
+        return cpus
+    per_worker = estimate_worker_peak_bytes(canvas_px, measured)
+    return max(1, min(cpus, budget // max(per_worker, 1)))
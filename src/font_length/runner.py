@@ -2,148 +2,209 @@
 from __future__ import annotations
 
 import csv
-import json
 import logging
-from dataclasses import dataclass, field
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Iterable
 
-import numpy as np
-from tqdm import tqdm
-
+from .columnar import ColumnarWriter
 from .config import Config
-from .joyo import get_joyo_chars
-from .measure import polylines_bounds, total_length
-from .morph import skeletonize_clean
-from .raster import render_glyph_to_binary
-from .svgout import polylines_to_svg_path_d, write_svg
-from .vectorize import skeleton_to_polylines
-
-__all__ = ["convert_font_to_singleline_svgs", "Summary"]
-
-
-@dataclass
-class GlyphResult:
-    char: str
-    codepoint: int
-    path_d: str
-    svg_filename: str
-    total_length: float
-    bounds: tuple[float, float, float, float]
-    polyline_count: int
-    skeleton_pixels: int
-    warnings: list[str] = field(default_factory=list)
-
-
-@dataclass
-class GlyphFailure:
-    char: str
-    codepoint: int
-    reason: str
-    message: str | None = None
-
-
-@dataclass
-class Summary:
-    processed: int
-    failures: list[GlyphFailure]
-    duration_seconds: float
-    top_lengths: list[tuple[str, float, str]]
-    metadata: dict[str, Any]
-
-    def to_dict(self) -> dict[str, Any]:
-        return {
-            "processed": self.processed,
-            "failures": [f.__dict__ for f in self.failures],
-            "duration_seconds": self.duration_seconds,
-            "top_lengths": [
-                {"char": char, "total_length": length, "svg": svg} for char, length, svg in self.top_lengths
-            ],
-            "metadata": self.metadata,
-        }
-
-
-@dataclass(frozen=True)
-class _WorkerConfig:
-    font_path: str
-    point_px: int
-    canvas_px: int
-    margin_px: int
-    binarize: str
-    binary_threshold: int
-    min_obj_area: int
-    spur_prune_len: int
-    simplify_eps: float
-
-
-def _compute_metrics(polylines: list[list[tuple[float, float]]]) -> dict[str, Any]:
-    if not polylines:
-        return {"polyline_count": 0, "mean_segment_len": 0.0}
-    total = total_length(polylines)
-    count = len(polylines)
-    return {"polyline_count": count, "mean_segment_len": total / max(count, 1)}
-
-
-def _process_char(char: str, cfg: _WorkerConfig) -> tuple[str, dict[str, Any] | None, GlyphFailure | None]:
-    codepoint = ord(char)
-    try:
-        bw = render_glyph_to_binary(
-            char,
-            cfg.font_path,
-            cfg.point_px,
-            cfg.canvas_px,
-            cfg.margin_px,
-            binarize=cfg.binarize,
-            binary_threshold=cfg.binary_threshold,
-        )
-        if bw.size == 0 or not bw.any():
-            return char, None, GlyphFailure(char, codepoint, "empty")
-
-        skel = skeletonize_clean(bw, cfg.min_obj_area, cfg.spur_prune_len)
-        if skel.size == 0 or not skel.any():
-            return char, None, GlyphFailure(char, codepoint, "noskeleton")
-
-        skeleton_pixels = int(np.count_nonzero(skel))
-        polylines = skeleton_to_polylines(skel)
-        if not polylines:
-            return char, None, GlyphFailure(char, codepoint, "nopolyline")
-
-        length = total_length(polylines)
-        bounds = polylines_bounds(polylines)
-        path_d = polylines_to_svg_path_d(polylines, cfg.simplify_eps, scale=1.0)
-        metrics = _compute_metrics(polylines)
-        metrics.update(
-            {
-                "char": char,
-                "codepoint": codepoint,
-                "path_d": path_d,
-                "bounds": bounds,
-                "total_length": length,
-                "skeleton_pixels": skeleton_pixels,
-            }
-        )
-        return char, metrics, None
-    except Exception as exc:  # pragma: no cover - defensive
-        return char, None, GlyphFailure(char, codepoint, "error", message=str(exc))
-
-
-def _iter_process_chars(chars: Iterable[str], cfg: _WorkerConfig, workers: int):
-    if workers == 1:
-        for ch in chars:
-            yield _process_char(ch, cfg)
+from .incremental import (
+    MANIFEST_FILENAME,
+    GlyphManifest,
+    font_wide_hash,
+    glyph_outline_hashes,
+    load_manifest,
+    save_manifest,
+)
+from .memprofile import MemoryProfile
+from .pipeline import GlyphFailure, _process_chunk, _worker_config, _WorkerConfig
+from .pool import GlyphPool
+from .raster import atlas_capacity
+from .rasterstore import RasterStore, font_hash
+from .report import (
+    CSV_HEADER,
+    RESULTS_FILENAME,
+    GlyphResult,
+    Summary,
+    build_summary,
+    load_glyph_results,
+    write_result_line,
+    write_summary,
+)
+from .resources import estimate_worker_peak_bytes, load_worker_peaks, save_worker_peak
+from .schedule import (
+    estimate_ink_costs,
+    load_glyph_costs,
+    order_longest_first,
+    plan_chunks,
+    save_glyph_costs,
+    simulate_schedule,
+)
+from .svgout import write_svg
+from .telemetry import LiveMetrics
+
+__all__ = ["convert_font_to_singleline_svgs", "GlyphResult", "Summary"]
+
+
+def _iter_process_chars(
+    chars: Iterable[str],
+    cfg: _WorkerConfig,
+    workers: int,
+    chunks: list[list[str]] | None = None,
+    memory_limit: int | None = None,
+    pool_stats: dict[str, int] | None = None,
+    telemetry: LiveMetrics | None = None,
+):
+    chars = list(chars)
+    if chunks is None:
+        # Atlas rendering needs several glyphs per task to amortize the atlas.
+        size = atlas_capacity(cfg.canvas_px) if cfg.render_mode == "atlas" else 1
+        chunks = [chars[i : i + size] for i in range(0, len(chars), size)]
+    if workers == 1 and cfg.glyph_timeout is None:
+        done = 0
+        for chunk in chunks:
+            if telemetry is not None:
+                telemetry.set_load(1, len(chars) - done - 1)
+            results = _process_chunk(chunk, cfg)
+            done += len(results)
+            yield from results
+    elif cfg.executor == "thread":
+        import threading
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        # Glyphs finished inside running chunks, so that the gauges count
+        # glyphs like the process pool does: one in flight per busy thread.
+        lock = threading.Lock()
+        finished = 0
+
+        def count_glyph() -> None:
+            nonlocal finished
+            with lock:
+                finished += 1
+
+        total = sum(map(len, chunks))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="glyph") as executor:
+            not_done = {executor.submit(_process_chunk, chunk, cfg, count_glyph) for chunk in chunks}
+            while not_done:
+                if telemetry is not None:
+                    in_flight = min(workers, len(not_done), total - finished)
+                    telemetry.set_load(in_flight, total - finished - in_flight)
+                    telemetry.tick()
+                done, not_done = wait(
+                    not_done, timeout=telemetry.interval if telemetry else None, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    yield from future.result()
     else:
-        from concurrent.futures import ProcessPoolExecutor, as_completed
-
-        with ProcessPoolExecutor(max_workers=workers) as executor:
-            futures = {executor.submit(_process_char, ch, cfg): ch for ch in chars}
-            for future in as_completed(futures):
-                yield future.result()
+        # Chunks are handed out in order, so ``chunks`` controls which glyphs
+        # start first.  A time budget needs a separate process even for one
+        # worker so that a stuck glyph can be killed.
+        pool = GlyphPool(workers, cfg, memory_limit=memory_limit, telemetry=telemetry)
+        try:
+            yield from pool.run(chunks)
+        finally:
+            if pool_stats is not None:
+                pool_stats.update(pool.stats())
+
+
+def _runs_worker_processes(cfg: _WorkerConfig, workers: int) -> bool:
+    """Return whether :func:`_iter_process_chars` processes glyphs in child processes."""
+
+    return cfg.executor != "thread" and (workers > 1 or cfg.glyph_timeout is not None)
+
+
+def _plan_schedule(
+    chars: list[str], cfg: Config, workers: int, costs_path: Path | None
+) -> tuple[list[list[str]] | None, dict[str, Any]]:
+    """Return longest-first chunks for ``chars`` and a description of the plan."""
+
+    info: dict[str, Any] = {"strategy": cfg.schedule, "cost_source": None, "chunks": len(chars)}
+    if cfg.schedule != "cost" or workers == 1 or not chars:
+        return None, info
+
+    costs = load_glyph_costs(costs_path) if costs_path is not None else {}
+    source = "history"
+    if sum(ch in costs for ch in chars) < len(chars) / 2:
+        costs = estimate_ink_costs(chars, cfg.font_path)
+        source = "ink"
+    chunks = plan_chunks(order_longest_first(chars, costs), costs, workers)
+    info.update({"cost_source": source, "chunks": len(chunks)})
+    return chunks, info
+
+
+def _plan_incremental(
+    chars: list[str], cfg: Config, out_dir: Path
+) -> tuple[list[str], list[GlyphResult], GlyphManifest, dict[str, Any]]:
+    """Split ``chars`` into glyphs to process and results carried forward.
+
+    Results of the previous run in ``out_dir`` are reused for glyphs whose
+    outline hash matches its manifest, provided the settings and font-wide
+    data are unchanged as well.
+    """
+
+    hashes = glyph_outline_hashes(cfg.font_path, chars)
+    manifest = GlyphManifest(
+        cfg.settings_hash(),
+        font_wide_hash(cfg.font_path),
+        {ch: value for ch, value in hashes.items() if value is not None},
+    )
+    previous = load_manifest(out_dir / MANIFEST_FILENAME)
+    unchanged = manifest.unchanged(previous, hashes)
+    stored: dict[str, GlyphResult] = {}
+    if unchanged:
+        try:
+            results, _ = load_glyph_results(out_dir)
+        except FileNotFoundError:
+            results = []
+        stored = {res.char: res for res in results if res.char in unchanged}
+    carried = [stored[ch] for ch in chars if ch in stored]
+    pending = [ch for ch in chars if ch not in stored]
+    info = {
+        "baseline": previous is not None,
+        "settings_changed": previous is not None and previous.settings_hash != manifest.settings_hash,
+        "font_wide_changed": previous is not None and previous.font_hash != manifest.font_hash,
+        "processed": len(pending),
+        "carried_forward": len(carried),
+    }
+    return pending, carried, manifest, info
+
+
+def _schedule_report(
+    chars: list[str],
+    chunks: list[list[str]] | None,
+    glyph_costs: dict[str, float],
+    completion_times: list[float],
+    workers: int,
+) -> dict[str, float]:
+    """Compare the observed tail with simulated input-order and planned dispatch."""
+
+    observed_tail = 0.0
+    if len(completion_times) > workers:
+        observed_tail = completion_times[-1] - completion_times[-workers - 1]
+    input_makespan, input_tail = simulate_schedule([glyph_costs.get(ch, 0.0) for ch in chars], workers)
+    planned = chunks if chunks is not None else [[ch] for ch in chars]
+    plan_makespan, plan_tail = simulate_schedule(
+        [sum(glyph_costs.get(ch, 0.0) for ch in chunk) for chunk in planned], workers
+    )
+    return {
+        "observed_tail_seconds": round(observed_tail, 6),
+        "simulated_input_order_makespan": round(input_makespan, 6),
+        "simulated_input_order_tail": round(input_tail, 6),
+        "simulated_scheduled_makespan": round(plan_makespan, 6),
+        "simulated_scheduled_tail": round(plan_tail, 6),
+        "simulated_tail_reduction_seconds": round(input_tail - plan_tail, 6),
+    }
 
 
 def convert_font_to_singleline_svgs(cfg: Config) -> Summary:
     """Execute the end-to-end conversion returning a :class:`Summary`."""
 
+    from tqdm import tqdm
+
+    from .joyo import get_joyo_chars
+
     logging.basicConfig(level=getattr(logging, cfg.log_level.upper(), logging.INFO))
     logger = logging.getLogger(__name__)
 
@@ -155,98 +216,190 @@ def convert_font_to_singleline_svgs(cfg: Config) -> Summary:
     out_dir.mkdir(parents=True, exist_ok=True)
     (out_dir / "logs").mkdir(parents=True, exist_ok=True)
 
+    all_chars = chars
+    carried: list[GlyphResult] = []
+    manifest = None
+    incremental_info = None
+    if cfg.incremental:
+        chars, carried, manifest, incremental_info = _plan_incremental(all_chars, cfg, out_dir)
+        logger.info("Incremental run: %d changed glyph(s), %d carried forward", len(chars), len(carried))
+    # This run rewrites the stored results, so an old manifest no longer
+    # describes them until the run completes.
+    (out_dir / MANIFEST_FILENAME).unlink(missing_ok=True)
+
     csv_path = out_dir / "stroke_length_report.csv"
     results: list[GlyphResult] = []
     failures: list[GlyphFailure] = []
-
-    worker_cfg = _WorkerConfig(
-        font_path=cfg.font_path,
-        point_px=cfg.point_px,
-        canvas_px=cfg.canvas_px,
-        margin_px=cfg.margin_px,
-        binarize=cfg.binarize,
-        binary_threshold=cfg.binary_threshold,
-        min_obj_area=cfg.min_obj_area,
-        spur_prune_len=cfg.spur_prune_len,
-        simplify_eps=cfg.simplify_eps,
+    stage_seconds: dict[str, float] = {}
+    polyline_counts = {"raw": 0, "merged": 0}
+
+    worker_cfg = _worker_config(cfg)
+    store = RasterStore(worker_cfg.raster_store) if worker_cfg.raster_store else None
+    if store is not None:
+        logger.info("Raster store %s holds %d mask(s)", store.directory, len(store))
+
+    memory_path = out_dir / "worker_memory.json"
+    measured_peaks = load_worker_peaks(memory_path)
+    workers = cfg.resolved_workers(measured_peaks)
+    per_worker = estimate_worker_peak_bytes(cfg.canvas_px, measured_peaks)
+    logger.info(
+        "Using %d %s worker(s) (~%.0f MiB each)", workers, worker_cfg.executor, per_worker / 2**20
     )
+    if worker_cfg.executor == "thread" and cfg.glyph_timeout is not None:
+        logger.warning("--glyph-timeout is not enforced by the thread executor")
+    if cfg.render_mode == "atlas" and cfg.schedule == "cost" and workers > 1:
+        logger.warning("Cost-based chunks are small; --render-mode atlas only batches glyphs with --schedule input")
+    pool_stats: dict[str, int] = {}
+    worker_peak = 0
+
+    costs_path = out_dir / "glyph_costs.json"
+    chunks, schedule_info = _plan_schedule(chars, cfg, workers, costs_path)
+    glyph_costs: dict[str, float] = {}
+    completion_times: list[float] = []
+
+    columnar = None
+    if cfg.columnar != "none":
+        columnar = ColumnarWriter(
+            out_dir / "stroke_lengths",
+            cfg.columnar,
+            cfg.config_hash(),
+            font=str(cfg.font_path),
+            font_sha256=font_hash(cfg.font_path),
+        )
+        logger.info("Writing columnar results to %s", columnar.path)
 
-    workers = cfg.resolved_workers()
-    logger.info("Using %d worker(s)", workers)
+    memory_profile = MemoryProfile() if cfg.memory_profile else None
+    telemetry = None
+    if cfg.metrics_file:
+        telemetry = LiveMetrics(cfg.metrics_file, total=len(chars), interval=cfg.metrics_interval)
+        logger.info("Writing live %s metrics to %s", telemetry.format, telemetry.path)
 
     progress = tqdm(total=len(chars), desc="Processing", unit="char")
 
-    with csv_path.open("w", newline="", encoding="utf-8") as csvfile:
+    with csv_path.open("w", newline="", encoding="utf-8") as csvfile, (out_dir / RESULTS_FILENAME).open(
+        "w", encoding="utf-8"
+    ) as results_file:
         writer = csv.writer(csvfile)
-        writer.writerow(["char", "codepoint_hex", "total_length_px", "svg_file", "polyline_count", "skeleton_pixels"])
-
-        for _, metrics, failure in _iter_process_chars(chars, worker_cfg, workers):
+        writer.writerow(CSV_HEADER)
+
+        for result in carried:
+            if result.svg_filename:
+                write_svg(
+                    result.path_d,
+                    out_dir / result.svg_filename,
+                    stroke_width=cfg.stroke_width,
+                    view_box=result.bounds,
+                )
+            writer.writerow(result.csv_row())
+            write_result_line(results_file, result)
+            if columnar is not None:
+                columnar.append(result.__dict__)
+            results.append(result)
+
+        for _, metrics, failure in _iter_process_chars(
+            chars,
+            worker_cfg,
+            workers,
+            chunks,
+            memory_limit=cfg.max_memory,
+            pool_stats=pool_stats,
+            telemetry=telemetry,
+        ):
             progress.update(1)
+            if telemetry is not None:
+                telemetry.record(metrics, failure)
+            completion_times.append(time.perf_counter())
             if failure:
                 failures.append(failure)
+                write_result_line(results_file, failure)
+                if columnar is not None:
+                    columnar.append_failure(failure)
                 logger.warning("Skipping %s (%s)", failure.char, failure.reason)
                 continue
             assert metrics is not None
-            svg_filename = f"U{metrics['codepoint']:04X}.svg"
-            path = out_dir / svg_filename
-            bounds = metrics["bounds"]
-            write_svg(
-                metrics["path_d"],
-                path,
-                stroke_width=cfg.stroke_width,
-                view_box=bounds,
-            )
-            writer.writerow(
-                [
-                    metrics["char"],
-                    f"{metrics['codepoint']:04X}",
-                    f"{metrics['total_length']:.3f}",
-                    svg_filename,
-                    metrics.get("polyline_count", 0),
-                    metrics.get("skeleton_pixels", 0),
-                ]
-            )
-            results.append(
-                GlyphResult(
-                    char=metrics["char"],
-                    codepoint=metrics["codepoint"],
-                    path_d=metrics["path_d"],
-                    svg_filename=svg_filename,
-                    total_length=metrics["total_length"],
-                    bounds=bounds,
-                    polyline_count=metrics.get("polyline_count", 0),
-                    skeleton_pixels=metrics.get("skeleton_pixels", 0),
+            if store is not None:
+                store.absorb(metrics)
+            for warning in metrics.get("warnings", []):
+                logger.warning("%s: %s", metrics["char"], warning)
+            timings = metrics.get("timings", {})
+            for stage, seconds in timings.items():
+                stage_seconds[stage] = stage_seconds.get(stage, 0.0) + seconds
+            glyph_costs[metrics["char"]] = sum(timings.values())
+            polyline_counts["raw"] += metrics.get("raw_polyline_count", metrics["polyline_count"])
+            polyline_counts["merged"] += metrics["polyline_count"]
+            worker_peak = max(worker_peak, metrics.get("peak_rss") or 0)
+            if memory_profile is not None and "memory" in metrics:
+                memory_profile.add(metrics["char"], metrics["memory"])
+            result = GlyphResult.from_metrics(metrics)
+            if result.svg_filename:
+                write_svg(
+                    result.path_d,
+                    out_dir / result.svg_filename,
+                    stroke_width=cfg.stroke_width,
+                    view_box=result.bounds,
                 )
-            )
+            writer.writerow(result.csv_row())
+            write_result_line(results_file, result)
+            if columnar is not None:
+                columnar.append(metrics)
+            results.append(result)
 
     progress.close()
+    if telemetry is not None:
+        telemetry.close()
+    if columnar is not None:
+        columnar.close()
+    save_glyph_costs(costs_path, glyph_costs)
+    # Serial and thread runs report the peak of this whole process, which is
+    # not the footprint of one worker process.
+    if worker_peak and _runs_worker_processes(worker_cfg, workers):
+        save_worker_peak(memory_path, cfg.canvas_px, worker_peak)
+    schedule_info.update(_schedule_report(chars, chunks, glyph_costs, completion_times, workers))
+    if store is not None:
+        store.flush()
+        logger.info("Stored %d new mask(s) in %s", store.masks_written, store.directory)
+    if manifest is not None:
+        save_manifest(out_dir / MANIFEST_FILENAME, manifest)
 
     duration = (datetime.utcnow() - start_ts).total_seconds()
-    results.sort(key=lambda r: r.total_length, reverse=True)
-    top_lengths = [(res.char, res.total_length, res.svg_filename) for res in results[:20]]
-
-    summary = Summary(
-        processed=len(results),
-        failures=failures,
-        duration_seconds=duration,
-        top_lengths=top_lengths,
-        metadata={
+    summary = build_summary(
+        results,
+        failures,
+        duration,
+        {
             "font_path": cfg.font_path,
             "point_px": cfg.point_px,
             "canvas_px": cfg.canvas_px,
             "margin_px": cfg.margin_px,
             "simplify_eps": cfg.simplify_eps,
+            "stroke_width": cfg.stroke_width,
+            "engine": cfg.engine,
+            "skeleton_backend": cfg.skeleton_backend,
+            "merge_polylines": cfg.merge_polylines,
+            "polyline_counts": polyline_counts,
+            "config_hash": cfg.config_hash(),
+            "columnar": str(columnar.path) if columnar is not None else None,
+            "stage_seconds": {stage: round(sec, 6) for stage, sec in stage_seconds.items()},
             "workers": workers,
-            "total_characters": len(chars),
-            "failures": len(failures),
+            "executor": worker_cfg.executor,
+            "schedule": schedule_info,
+            "memory": {
+                "max_memory": cfg.max_memory,
+                "estimated_worker_peak_bytes": per_worker,
+                "measured_worker_peak_bytes": worker_peak,
+                **pool_stats,
+            },
+            "memory_profile": memory_profile.to_dict() if memory_profile is not None else None,
+            "incremental": incremental_info,
+            "total_characters": len(all_chars),
         },
+        top_k=cfg.top_k,
     )
-
-    summary_path = out_dir / "summary.json"
-    summary_path.write_text(json.dumps(summary.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+    write_summary(summary, out_dir)
 
     logger.info("Processed %d glyphs (failures=%d) in %.2fs", len(results), len(failures), duration)
-    if top_lengths:
-        logger.info("Top character by stroke length: %s %.3f", top_lengths[0][0], top_lengths[0][1])
+    if summary.top_lengths:
+        top_char, top_length, _ = summary.top_lengths[0]
+        logger.info("Top character by stroke length: %s %.3f", top_char, top_length)
 
     return summary
@@ -0,0 +1,130 @@
+"""Cost-aware ordering and chunking of glyph work.
+
+Complex kanji cost many times more than simple ones, so submitting glyphs in
+list order tends to leave a few workers busy on heavy glyphs at the end of a
+run.  The helpers here order glyphs longest-first using either per-glyph
+timings persisted from an earlier run or a cheap ink-coverage proxy rendered
+at low resolution, and group them into chunks of roughly equal cost.
+"""
+from __future__ import annotations
+
+import heapq
+import json
+import os
+import statistics
+from pathlib import Path
+from typing import Iterable, Sequence
+
+__all__ = [
+    "estimate_ink_costs",
+    "load_glyph_costs",
+    "order_longest_first",
+    "plan_chunks",
+    "save_glyph_costs",
+    "simulate_schedule",
+]
+
+
+def load_glyph_costs(path: str | Path) -> dict[str, float]:
+    """Return per-glyph costs saved by :func:`save_glyph_costs` (or ``{}``)."""
+
+    path = Path(path)
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    costs = data.get("costs", {}) if isinstance(data, dict) else {}
+    return {str(ch): float(value) for ch, value in costs.items() if float(value) > 0}
+
+
+def save_glyph_costs(path: str | Path, costs: dict[str, float]) -> None:
+    """Merge ``costs`` (seconds per glyph) into the cost file at ``path``."""
+
+    path = Path(path)
+    merged = load_glyph_costs(path)
+    merged.update({ch: round(value, 6) for ch, value in costs.items()})
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps({"unit": "seconds", "costs": merged}, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def estimate_ink_costs(chars: Iterable[str], font_path: str | Path, size_px: int = 64) -> dict[str, float]:
+    """Estimate relative glyph cost from ink coverage at ``size_px``.
+
+    Rendering a glyph mask this small takes a fraction of a millisecond and
+    ink coverage correlates well with skeleton and tracing work.
+    """
+
+    from PIL import ImageFont
+
+    font = ImageFont.truetype(str(font_path), size=size_px)
+    costs: dict[str, float] = {}
+    for ch in chars:
+        mask = font.getmask(ch)
+        width, height = mask.size
+        ink = sum(mask.histogram()[128:]) if width and height else 0
+        costs[ch] = float(max(ink, 1))
+    return costs
+
+
+def order_longest_first(chars: Sequence[str], costs: dict[str, float]) -> list[str]:
+    """Return ``chars`` sorted by descending cost; unknown glyphs get the median."""
+
+    known = [costs[ch] for ch in chars if ch in costs]
+    default = statistics.median(known) if known else 1.0
+    return sorted(chars, key=lambda ch: costs.get(ch, default), reverse=True)
+
+
+def plan_chunks(
+    ordered: Sequence[str],
+    costs: dict[str, float],
+    workers: int,
+    chunks_per_worker: int = 4,
+    max_chunk: int = 32,
+) -> list[list[str]]:
+    """Group ``ordered`` glyphs into chunks of roughly equal estimated cost.
+
+    The cost budget per chunk is ``total / (workers * chunks_per_worker)``, so
+    heavy glyphs at the front travel alone while the cheap tail is batched,
+    which keeps IPC overhead low without reintroducing stragglers.
+    """
+
+    if not ordered:
+        return []
+    known = [costs[ch] for ch in ordered if ch in costs]
+    default = statistics.median(known) if known else 1.0
+    weights = [costs.get(ch, default) for ch in ordered]
+    budget = sum(weights) / max(workers * chunks_per_worker, 1)
+
+    chunks: list[list[str]] = []
+    current: list[str] = []
+    current_cost = 0.0
+    for ch, weight in zip(ordered, weights):
+        if current and (current_cost + weight > budget or len(current) >= max_chunk):
+            chunks.append(current)
+            current, current_cost = [], 0.0
+        current.append(ch)
+        current_cost += weight
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def simulate_schedule(task_costs: Sequence[float], workers: int) -> tuple[float, float]:
+    """Simulate greedy dispatch of ``task_costs`` in order onto ``workers``.
+
+    Returns ``(makespan, tail)`` where ``tail`` is the time between the first
+    worker running out of work and the end of the run.
+    """
+
+    if not task_costs:
+        return 0.0, 0.0
+    finish = [0.0] * max(min(workers, len(task_costs)), 1)
+    heapq.heapify(finish)
+    for cost in task_costs:
+        heapq.heappush(finish, heapq.heappop(finish) + cost)
+    makespan = max(finish)
+    return makespan, makespan - min(finish)
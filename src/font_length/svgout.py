@@ -1,22 +1,51 @@
 """SVG path helpers."""
 from __future__ import annotations
 
+import io
+from itertools import chain
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, TextIO
+
+import numpy as np
 
 from .vectorize import rdp
 
-__all__ = ["polylines_to_svg_path_d", "write_svg"]
+__all__ = ["polylines_to_svg_path_d", "write_svg", "write_svg_path_d"]
 
 
-def polylines_to_svg_path_d(
+def _format_numbers(values: np.ndarray, precision: int) -> list[str]:
+    """Format ``values`` in bulk with at most ``precision`` decimals.
+
+    Integral values are written without a decimal point and trailing zeros are
+    dropped, so pixel-aligned coordinates serialize as plain integers.
+    """
+
+    rounded = np.round(values, precision) + 0.0  # ``+ 0.0`` turns -0.0 into 0.0
+    if precision <= 0 or not np.any(rounded % 1.0):
+        return list(map(str, rounded.astype(np.int64).tolist()))
+    text = np.char.mod(f"%.{precision}f", rounded)
+    text = np.char.rstrip(np.char.rstrip(text, "0"), ".")
+    return np.where(text == "-0", "0", text).tolist()
+
+
+def write_svg_path_d(
     polylines: Iterable[Iterable[tuple[float, float]]],
+    out: TextIO,
     simplify_eps: float = 2.0,
     scale: float = 1.0,
-) -> str:
-    """Convert polylines to a SVG path string."""
+    precision: int = 3,
+    relative: bool = False,
+    implicit_lineto: bool = False,
+) -> None:
+    """Serialize polylines as SVG path data directly into ``out``.
 
-    commands: list[str] = []
+    All coordinates are scaled, rounded and formatted in one vectorized pass.
+    ``relative`` emits ``m``/``l`` commands holding deltas to the previous
+    point, and ``implicit_lineto`` omits the lineto command letters that SVG
+    allows to be implied after a moveto.
+    """
+
+    runs: list[list[tuple[float, float]]] = []
     for polyline in polylines:
         pts = list(polyline)
         if len(pts) < 2:
@@ -25,13 +54,55 @@ def polylines_to_svg_path_d(
             pts = rdp(pts, simplify_eps)
         if len(pts) < 2:
             continue
-        move = pts[0]
-        segments = [
-            f"L {pt[0] * scale:.3f} {pt[1] * scale:.3f}" for pt in pts[1:]
-        ]
-        command = " ".join([f"M {move[0] * scale:.3f} {move[1] * scale:.3f}"] + segments)
-        commands.append(command)
-    return " ".join(commands)
+        runs.append(pts)
+    if not runs:
+        return
+
+    flat = np.fromiter(chain.from_iterable(chain.from_iterable(runs)), dtype=np.float64)
+    coords = np.round(flat.reshape(-1, 2) * scale, precision)
+    if relative:
+        # The first ``m`` of a path is absolute, which equals a delta from the
+        # origin; every later subpath starts relative to the previous end point.
+        coords = np.round(np.diff(coords, axis=0, prepend=np.zeros((1, 2))), precision)
+    tokens = _format_numbers(coords.ravel(), precision)
+
+    move, line = ("m", "l") if relative else ("M", "L")
+    start = 0
+    for i, run in enumerate(runs):
+        stop = start + 2 * len(run)
+        if i:
+            out.write(" ")
+        if implicit_lineto:
+            out.write(move)
+            out.write(" ".join(tokens[start:stop]))
+        else:
+            out.write(f"{move} {tokens[start]} {tokens[start + 1]}")
+            for j in range(start + 2, stop, 2):
+                out.write(f" {line} {tokens[j]} {tokens[j + 1]}")
+        start = stop
+
+
+def polylines_to_svg_path_d(
+    polylines: Iterable[Iterable[tuple[float, float]]],
+    simplify_eps: float = 2.0,
+    scale: float = 1.0,
+    precision: int = 3,
+    relative: bool = False,
+    implicit_lineto: bool = False,
+) -> str:
+    """Convert polylines to a SVG path string; see :func:`write_svg_path_d`."""
+
+    buffer = io.StringIO()
+    write_svg_path_d(
+        polylines,
+        buffer,
+        simplify_eps,
+        scale=scale,
+        precision=precision,
+        relative=relative,
+        implicit_lineto=implicit_lineto,
+    )
+    return buffer.getvalue()
 
 
 def write_svg(
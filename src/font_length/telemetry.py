@@ -0,0 +1,170 @@
+"""Live progress metrics for long conversion runs.
+
+:class:`LiveMetrics` is fed from the parent loop and periodically writes a
+snapshot either as a Prometheus text exposition file (for node_exporter's
+textfile collector, chosen by a ``.prom`` suffix) or by appending one JSON
+object per snapshot to a JSON-lines file.  Only the standard library is used.
+"""
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import time
+from collections import Counter, deque
+from pathlib import Path
+from typing import Any
+
+__all__ = ["LATENCY_BUCKETS", "LiveMetrics"]
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Completions inside this window define the current throughput.
+_RATE_WINDOW = 30.0
+# Number of most recent glyphs per stage behind the rolling latency histograms.
+_LATENCY_WINDOW = 512
+
+
+def _quantile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(int(q * len(sorted_values)), len(sorted_values) - 1)]
+
+
+class LiveMetrics:
+    """Collect throughput, load, failures and stage latencies during a run.
+
+    ``record`` is called for every finished glyph and ``set_load`` whenever the
+    executor knows how many glyphs are running and waiting; both write a new
+    snapshot once ``interval`` seconds have passed since the previous one, and
+    the pool calls ``tick`` while it waits so that stalls remain visible.
+    """
+
+    def __init__(self, path: str | Path, total: int, interval: float = 5.0) -> None:
+        self.path = Path(path)
+        self.format = "prometheus" if self.path.suffix == ".prom" else "jsonl"
+        self.total = total
+        self.interval = interval
+        self.completed = 0
+        self.in_flight = 0
+        self.queued = total
+        self.failures: Counter[str] = Counter()
+        self._started = time.monotonic()
+        self._last_result = self._started
+        self._last_emit = float("-inf")
+        self._completions: deque[float] = deque()
+        self._recent: dict[str, deque[float]] = {}
+        self._buckets: dict[str, list[int]] = {}
+        self._sums: dict[str, float] = {}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.format == "jsonl":
+            self.path.write_text("", encoding="utf-8")
+
+    # -- updates -----------------------------------------------------------
+    def record(self, metrics: dict[str, Any] | None, failure: Any = None) -> None:
+        now = time.monotonic()
+        self.completed += 1
+        self._last_result = now
+        self._completions.append(now)
+        if failure is not None:
+            self.failures[failure.reason] += 1
+        if metrics is not None:
+            for stage, seconds in metrics.get("timings", {}).items():
+                self._recent.setdefault(stage, deque(maxlen=_LATENCY_WINDOW)).append(seconds)
+                buckets = self._buckets.setdefault(stage, [0] * (len(LATENCY_BUCKETS) + 1))
+                buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+                self._sums[stage] = self._sums.get(stage, 0.0) + seconds
+        self.tick(now)
+
+    def set_load(self, in_flight: int, queued: int) -> None:
+        self.in_flight = in_flight
+        self.queued = queued
+
+    def tick(self, now: float | None = None) -> None:
+        now = time.monotonic() if now is None else now
+        if now - self._last_emit >= self.interval:
+            self.emit(now)
+
+    # -- snapshots ---------------------------------------------------------
+    def snapshot(self, now: float | None = None) -> dict[str, Any]:
+        now = time.monotonic() if now is None else now
+        while self._completions and now - self._completions[0] > _RATE_WINDOW:
+            self._completions.popleft()
+        elapsed = now - self._started
+        window = min(elapsed, _RATE_WINDOW)
+        stages = {}
+        for stage, recent in self._recent.items():
+            values = sorted(recent)
+            counts = [0] * (len(LATENCY_BUCKETS) + 1)
+            for value in values:
+                counts[bisect.bisect_left(LATENCY_BUCKETS, value)] += 1
+            stages[stage] = {
+                "p50": round(_quantile(values, 0.5), 6),
+                "p90": round(_quantile(values, 0.9), 6),
+                "p99": round(_quantile(values, 0.99), 6),
+                "buckets": dict(zip([*map(str, LATENCY_BUCKETS), "+Inf"], counts)),
+            }
+        return {
+            "timestamp": time.time(),
+            "elapsed_seconds": round(elapsed, 3),
+            "completed": self.completed,
+            "total": self.total,
+            "glyphs_per_second": round(len(self._completions) / window, 3) if window > 0 else 0.0,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queued,
+            "seconds_since_last_result": round(now - self._last_result, 3),
+            "failures": dict(self.failures),
+            "stage_latency": stages,
+        }
+
+    def emit(self, now: float | None = None) -> None:
+        now = time.monotonic() if now is None else now
+        self._last_emit = now
+        snapshot = self.snapshot(now)
+        if self.format == "jsonl":
+            with self.path.open("a", encoding="utf-8") as fh:
+                fh.write(json.dumps(snapshot))
+                fh.write("\n")
+            return
+        # Write-and-rename so that the textfile collector never reads a
+        # partially written file.
+        tmp_path = self.path.with_suffix(".prom.tmp")
+        tmp_path.write_text(self._prometheus_text(snapshot), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+    def close(self) -> None:
+        self.set_load(0, 0)
+        self.emit()
+
+    def _prometheus_text(self, snapshot: dict[str, Any]) -> str:
+        lines = [
+            "# HELP font_length_glyphs_completed_total Glyphs finished, including failures.",
+            "# TYPE font_length_glyphs_completed_total counter",
+            f"font_length_glyphs_completed_total {self.completed}",
+            "# HELP font_length_glyphs_total Glyphs scheduled for this run.",
+            "# TYPE font_length_glyphs_total gauge",
+            f"font_length_glyphs_total {self.total}",
+            f"# HELP font_length_glyphs_per_second Completions per second over the last {_RATE_WINDOW:g}s.",
+            "# TYPE font_length_glyphs_per_second gauge",
+            f"font_length_glyphs_per_second {snapshot['glyphs_per_second']}",
+            "# TYPE font_length_in_flight gauge",
+            f"font_length_in_flight {self.in_flight}",
+            "# TYPE font_length_queue_depth gauge",
+            f"font_length_queue_depth {self.queued}",
+            "# TYPE font_length_seconds_since_last_result gauge",
+            f"font_length_seconds_since_last_result {snapshot['seconds_since_last_result']}",
+            "# TYPE font_length_failures_total counter",
+        ]
+        lines += [f'font_length_failures_total{{reason="{reason}"}} {n}' for reason, n in sorted(self.failures.items())]
+        lines += [
+            "# HELP font_length_stage_seconds Per-glyph latency of each pipeline stage.",
+            "# TYPE font_length_stage_seconds histogram",
+        ]
+        for stage, buckets in sorted(self._buckets.items()):
+            cumulative = 0
+            for bound, count in zip([*map(str, LATENCY_BUCKETS), "+Inf"], buckets):
+                cumulative += count
+                lines.append(f'font_length_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+            lines.append(f'font_length_stage_seconds_sum{{stage="{stage}"}} {self._sums[stage]:.6f}')
+            lines.append(f'font_length_stage_seconds_count{{stage="{stage}"}} {cumulative}')
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,180 @@
+"""Zhang-Suen and Guo-Hall thinning compiled with Numba.
+
+Numba is an optional dependency.  The kernels are plain Python loops that are
+compiled on first use; :func:`thin_mask` raises :class:`ImportError` when Numba
+is not installed because the interpreted kernel is far too slow for glyph
+sized masks.  Each connected component is thinned inside its own bounding box
+and every sub-iteration only visits the current contour pixels.
+"""
+from __future__ import annotations
+
+from typing import Callable
+
+import numpy as np
+
+__all__ = ["thin_mask", "numba_available"]
+
+_COMPILED: dict[str, Callable[[np.ndarray, bool], int]] = {}
+
+
+def numba_available() -> bool:
+    try:
+        import numba  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _thin_kernel(img: np.ndarray, guo_hall: bool) -> int:
+    """Thin ``img`` (uint8, zero border of one pixel) in place.
+
+    Only contour pixels can ever be deleted, so the kernel keeps a work list of
+    foreground pixels touching the background and extends it with the
+    neighbours of every deleted pixel.  Pixels scheduled for deletion are
+    tagged with ``2`` so that the rest of the sub-iteration still sees them as
+    foreground.  Returns the number of full iterations performed.
+    """
+
+    h, w = img.shape
+    total = 0
+    for y in range(1, h - 1):
+        for x in range(1, w - 1):
+            if img[y, x]:
+                total += 1
+    queued = np.zeros((h, w), dtype=np.uint8)
+    cand_y = np.empty(total, dtype=np.int32)
+    cand_x = np.empty(total, dtype=np.int32)
+    del_y = np.empty(total, dtype=np.int32)
+    del_x = np.empty(total, dtype=np.int32)
+    n_cand = 0
+    for y in range(1, h - 1):
+        for x in range(1, w - 1):
+            if img[y, x] == 0:
+                continue
+            if (
+                img[y - 1, x - 1] == 0 or img[y - 1, x] == 0 or img[y - 1, x + 1] == 0 or img[y, x - 1] == 0
+                or img[y, x + 1] == 0 or img[y + 1, x - 1] == 0 or img[y + 1, x] == 0 or img[y + 1, x + 1] == 0
+            ):
+                cand_y[n_cand] = y
+                cand_x[n_cand] = x
+                queued[y, x] = 1
+                n_cand += 1
+
+    iterations = 0
+    idle = 0
+    sub = 0
+    while idle < 2 and n_cand:
+        n_del = 0
+        for i in range(n_cand):
+            y = cand_y[i]
+            x = cand_x[i]
+            p2 = int(img[y - 1, x] != 0)
+            p3 = int(img[y - 1, x + 1] != 0)
+            p4 = int(img[y, x + 1] != 0)
+            p5 = int(img[y + 1, x + 1] != 0)
+            p6 = int(img[y + 1, x] != 0)
+            p7 = int(img[y + 1, x - 1] != 0)
+            p8 = int(img[y, x - 1] != 0)
+            p9 = int(img[y - 1, x - 1] != 0)
+            delete = False
+            if guo_hall:
+                c = ((1 - p2) & (p3 | p4)) + ((1 - p4) & (p5 | p6))
+                c += ((1 - p6) & (p7 | p8)) + ((1 - p8) & (p9 | p2))
+                n1 = (p9 | p2) + (p3 | p4) + (p5 | p6) + (p7 | p8)
+                n2 = (p2 | p3) + (p4 | p5) + (p6 | p7) + (p8 | p9)
+                n = min(n1, n2)
+                if sub == 0:
+                    m = (p6 | p7 | (1 - p9)) & p8
+                else:
+                    m = (p2 | p3 | (1 - p5)) & p4
+                delete = c == 1 and 2 <= n <= 3 and m == 0
+            else:
+                b = p2 + p3 + p4 + p5 + p6 + p7 + p8 + p9
+                if 2 <= b <= 6:
+                    a = ((1 - p2) & p3) + ((1 - p3) & p4) + ((1 - p4) & p5) + ((1 - p5) & p6)
+                    a += ((1 - p6) & p7) + ((1 - p7) & p8) + ((1 - p8) & p9) + ((1 - p9) & p2)
+                    if a == 1:
+                        if sub == 0:
+                            delete = p2 * p4 * p6 == 0 and p4 * p6 * p8 == 0
+                        else:
+                            delete = p2 * p4 * p8 == 0 and p2 * p6 * p8 == 0
+            if delete:
+                img[y, x] = 2
+                del_y[n_del] = y
+                del_x[n_del] = x
+                n_del += 1
+
+        if n_del:
+            idle = 0
+            for i in range(n_del):
+                img[del_y[i], del_x[i]] = 0
+                queued[del_y[i], del_x[i]] = 0
+            kept = 0
+            for i in range(n_cand):
+                if img[cand_y[i], cand_x[i]]:
+                    cand_y[kept] = cand_y[i]
+                    cand_x[kept] = cand_x[i]
+                    kept += 1
+            n_cand = kept
+            # Neighbours of deleted pixels are the new contour.
+            for i in range(n_del):
+                for dy in range(-1, 2):
+                    for dx in range(-1, 2):
+                        ny = del_y[i] + dy
+                        nx = del_x[i] + dx
+                        if img[ny, nx] and not queued[ny, nx]:
+                            queued[ny, nx] = 1
+                            cand_y[n_cand] = ny
+                            cand_x[n_cand] = nx
+                            n_cand += 1
+        else:
+            idle += 1
+        if sub == 1:
+            iterations += 1
+        sub = 1 - sub
+    return iterations
+
+
+def _compiled_kernel() -> Callable[[np.ndarray, bool], int]:
+    kernel = _COMPILED.get("thin")
+    if kernel is None:
+        try:
+            import numba
+        except ImportError as exc:
+            raise ImportError(
+                "Zhang-Suen/Guo-Hall thinning requires the optional 'numba' package (pip install 'font-length[numba]')"
+            ) from exc
+        kernel = numba.njit(cache=True, nogil=True)(_thin_kernel)
+        _COMPILED["thin"] = kernel
+    return kernel
+
+
+def thin_mask(
+    bw: np.ndarray,
+    method: str = "zhang-suen",
+    kernel: Callable[[np.ndarray, bool], int] | None = None,
+) -> np.ndarray:
+    """Thin ``bw`` to a one pixel wide skeleton with ``method``.
+
+    ``method`` is ``"zhang-suen"`` or ``"guo-hall"``.  ``kernel`` overrides the
+    compiled kernel and exists mainly for tests.
+    """
+
+    if method not in {"zhang-suen", "guo-hall"}:
+        raise ValueError(f"Unknown thinning method: {method}")
+    if kernel is None:
+        kernel = _compiled_kernel()
+
+    from scipy import ndimage
+
+    out = np.zeros(bw.shape, dtype=bool)
+    labels, _ = ndimage.label(bw, structure=np.ones((3, 3), dtype=bool))
+    for index, slc in enumerate(ndimage.find_objects(labels), start=1):
+        if slc is None:
+            continue
+        component = labels[slc] == index
+        padded = np.zeros((component.shape[0] + 2, component.shape[1] + 2), dtype=np.uint8)
+        padded[1:-1, 1:-1] = component
+        kernel(padded, method == "guo-hall")
+        out[slc] |= padded[1:-1, 1:-1].astype(bool)
+    return out
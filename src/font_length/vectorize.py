@@ -5,7 +5,9 @@ from typing import Iterable, Sequence, Tuple
 
 import numpy as np
 
-__all__ = ["skeleton_to_polylines", "rdp"]
+from .measure import polyline_total_length
+
+__all__ = ["skeleton_to_polylines", "merge_polylines", "rdp"]
 
 _NEIGHBORS = [
     (-1, -1),
@@ -119,39 +121,169 @@ def skeleton_to_polylines(skel: np.ndarray) -> list[list[Point]]:
     return polylines
 
 
-def _perpendicular_distance(point: Point, start: Point, end: Point) -> float:
-    if start == end:
-        return float(np.hypot(point[0] - start[0], point[1] - start[1]))
-
-    x0, y0 = point
-    x1, y1 = start
-    x2, y2 = end
-
-    num = abs((y2 - y1) * x0 - (x2 - x1) * y0 + x2 * y1 - y2 * x1)
-    den = float(np.hypot(x2 - x1, y2 - y1))
-    return num / den
+def _direction_into_end(line: Sequence[Point], window: float) -> Point:
+    """Return the direction in which ``line`` arrives at its last point.
+
+    The direction is measured over the last ``window`` pixels of arc length so
+    that single-pixel steps do not dominate it.
+    """
+
+    end_x, end_y = line[-1]
+    travelled = 0.0
+    x, y = end_x, end_y
+    for px, py in reversed(line[:-1]):
+        travelled += float(np.hypot(x - px, y - py))
+        x, y = px, py
+        if travelled >= window:
+            break
+    return end_x - x, end_y - y
+
+
+def merge_polylines(
+    polylines: Sequence[Sequence[Point]],
+    max_turn_deg: float = 30.0,
+    micro_len: float = 3.0,
+    direction_len: float = 10.0,
+) -> list[list[Point]]:
+    """Join polylines that continue smoothly through shared junctions.
+
+    :func:`skeleton_to_polylines` ends a polyline at every junction pixel, and
+    junctions often consist of a few neighbouring pixels linked by tiny
+    segments.  Segments of at most ``micro_len`` pixels between two junctions
+    are collapsed: their junctions become one node, and every polyline ending
+    there is extended to the pixel at the node's centroid.  At
+    each node, pairs of polyline ends whose directions (measured over
+    ``direction_len`` pixels) differ by at most ``max_turn_deg`` are then
+    joined, straightest pairs first, and the joined chains are returned as
+    single polylines.  Closed chains end on their first point.
+
+    Both lengths should scale with the stroke width: junction artefacts of a
+    skeleton are about as long as the strokes are wide.
+    """
+
+    lines = [list(line) for line in polylines if len(line) >= 2]
+    ends_at: dict[Point, int] = {}
+    for line in lines:
+        for point in (line[0], line[-1]):
+            ends_at[point] = ends_at.get(point, 0) + 1
+
+    parent = {point: point for point in ends_at}
+
+    def find(point: Point) -> Point:
+        while parent[point] != point:
+            parent[point] = parent[parent[point]]
+            point = parent[point]
+        return point
+
+    keep: list[int] = []
+    for i, line in enumerate(lines):
+        a, b = line[0], line[-1]
+        if a != b and ends_at[a] >= 3 and ends_at[b] >= 3 and polyline_total_length(line) <= micro_len:
+            parent[find(a)] = find(b)
+        else:
+            keep.append(i)
+    if not keep:
+        return lines
+
+    members: dict[Point, list[Point]] = {}
+    for point in ends_at:
+        members.setdefault(find(point), []).append(point)
+    anchor: dict[Point, Point] = {}
+    for root, points in members.items():
+        cx = sum(x for x, _ in points) / len(points)
+        cy = sum(y for _, y in points) / len(points)
+        anchor[root] = (float(round(cx)), float(round(cy)))
+
+    # Each end is (line index, 0 for the first point or 1 for the last one).
+    node_ends: dict[Point, list[tuple[int, int]]] = {}
+    incoming: dict[tuple[int, int], Point] = {}
+    for i in keep:
+        line = lines[i]
+        for side, oriented in ((0, line[::-1]), (1, line)):
+            node_ends.setdefault(find(oriented[-1]), []).append((i, side))
+            incoming[(i, side)] = _direction_into_end(oriented, direction_len)
+        first, last = anchor[find(line[0])], anchor[find(line[-1])]
+        if first != line[0]:
+            line.insert(0, first)
+        if last != line[-1]:
+            line.append(last)
+
+    min_cos = float(np.cos(np.radians(max_turn_deg)))
+    link: dict[tuple[int, int], tuple[int, int]] = {}
+    for ends in node_ends.values():
+        candidates = []
+        for a in range(len(ends)):
+            ux, uy = incoming[ends[a]]
+            for b in range(a + 1, len(ends)):
+                # Leaving through end ``b`` goes against its incoming direction.
+                vx, vy = incoming[ends[b]]
+                norm = float(np.hypot(ux, uy) * np.hypot(vx, vy))
+                if norm == 0.0:
+                    continue
+                cos = -(ux * vx + uy * vy) / norm
+                if cos >= min_cos:
+                    candidates.append((-cos, a, b))
+        for _, a, b in sorted(candidates):
+            if ends[a] not in link and ends[b] not in link:
+                link[ends[a]] = ends[b]
+                link[ends[b]] = ends[a]
+
+    merged: list[list[Point]] = []
+    used: set[int] = set()
+
+    def walk(i: int, side_in: int) -> list[Point]:
+        path: list[Point] = []
+        while True:
+            used.add(i)
+            oriented = lines[i] if side_in == 0 else lines[i][::-1]
+            path.extend(oriented[1:] if path else oriented)
+            nxt = link.get((i, 1 - side_in))
+            if nxt is None or nxt[0] in used:
+                return path
+            i, side_in = nxt
+
+    for i in keep:
+        for side in (0, 1):
+            if i not in used and (i, side) not in link:
+                merged.append(walk(i, side))
+    for i in keep:
+        if i not in used:
+            merged.append(walk(i, 0))
+    return merged
 
 
 def rdp(points: Sequence[Point], epsilon: float) -> list[Point]:
-    """Ramer–Douglas–Peucker simplification."""
+    """Ramer–Douglas–Peucker simplification.
+
+    Spans are processed from an explicit stack and the distances of all
+    points of a span are computed in one NumPy pass, which keeps long merged
+    polylines cheap; the kept points are those of the recursive formulation.
+    """
 
     if len(points) < 2 or epsilon <= 0:
         return list(points)
 
-    start = points[0]
-    end = points[-1]
-    max_dist = 0.0
-    index = -1
-
-    for i in range(1, len(points) - 1):
-        dist = _perpendicular_distance(points[i], start, end)
-        if dist > max_dist:
-            max_dist = dist
-            index = i
-
-    if max_dist > epsilon and index != -1:
-        left = rdp(points[: index + 1], epsilon)
-        right = rdp(points[index:], epsilon)
-        return left[:-1] + right
-
-    return [start, end]
+    pts = np.asarray(points, dtype=np.float64)
+    keep = np.zeros(len(pts), dtype=bool)
+    keep[0] = keep[-1] = True
+    spans = [(0, len(pts) - 1)]
+    while spans:
+        first, last = spans.pop()
+        if last - first < 2:
+            continue
+        x1, y1 = pts[first]
+        x2, y2 = pts[last]
+        xs = pts[first + 1 : last, 0]
+        ys = pts[first + 1 : last, 1]
+        if x1 == x2 and y1 == y2:
+            dist = np.hypot(xs - x1, ys - y1)
+        else:
+            dist = np.abs((y2 - y1) * xs - (x2 - x1) * ys + x2 * y1 - y2 * x1) / np.hypot(x2 - x1, y2 - y1)
+        index = int(np.argmax(dist))
+        if dist[index] > epsilon:
+            split = first + 1 + index
+            keep[split] = True
+            spans.append((first, split))
+            spans.append((split, last))
+
+    return [points[i] for i in np.flatnonzero(keep)]
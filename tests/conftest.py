@@ -0,0 +1,35 @@
+import pytest
+
+
+def build_box_font(path, heights=(100, 200, 300), ascent=800):
+    """Write a TrueType font mapping 一, 二 and 三 to boxes of ``heights``."""
+
+    from fontTools.fontBuilder import FontBuilder
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+    def box(width, height):
+        pen = TTGlyphPen(None)
+        pen.moveTo((100, 0))
+        pen.lineTo((100, height))
+        pen.lineTo((100 + width, height))
+        pen.lineTo((100 + width, 0))
+        pen.closePath()
+        return pen.glyph()
+
+    names = [".notdef", "one", "two", "three"]
+    fb = FontBuilder(1000, isTTF=True)
+    fb.setupGlyphOrder(names)
+    fb.setupCharacterMap({ord("一"): "one", ord("二"): "two", ord("三"): "three"})
+    fb.setupGlyf({".notdef": box(10, 10), **{name: box(300, h) for name, h in zip(names[1:], heights)}})
+    fb.setupHorizontalMetrics({name: (500, 100) for name in names})
+    fb.setupHorizontalHeader(ascent=ascent, descent=-200)
+    fb.setupOS2(sTypoAscender=ascent, usWinAscent=ascent, usWinDescent=200)
+    fb.setupPost()
+    fb.save(str(path))
+    return str(path)
+
+
+@pytest.fixture
+def box_font(tmp_path):
+    pytest.importorskip("fontTools")
+    return build_box_font(tmp_path / "box.ttf")
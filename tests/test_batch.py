@@ -0,0 +1,53 @@
+import pytest
+
+from font_length.batch import MEASUREMENT_DTYPE, _records_to_array
+
+
+def test_records_to_array_structured():
+    rows = [
+        {
+            "char": "一",
+            "codepoint": 0x4E00,
+            "total_length": 12.5,
+            "bounds": (1.0, 2.0, 12.5, 0.0),
+            "polyline_count": 1,
+            "skeleton_pixels": 14,
+        }
+    ]
+    records = _records_to_array(rows)
+    assert records.dtype == MEASUREMENT_DTYPE
+    assert records["char"][0] == "一"
+    assert records["codepoint"][0] == 0x4E00
+    assert records["bounds"][0].tolist() == [1.0, 2.0, 12.5, 0.0]
+    assert records["skeleton_pixels"][0] == 14
+
+
+def test_measure_chars_with_default_font(monkeypatch):
+    from PIL import ImageFont
+
+    from font_length import pipeline, raster
+    from font_length.batch import measure_chars
+    from font_length.config import Config
+
+    try:
+        ImageFont.load_default(size=10)
+    except TypeError:  # pragma: no cover - Pillow < 10.1 has no scalable default font
+        pytest.skip("scalable default font unavailable")
+    monkeypatch.setattr(raster, "_load_font", lambda font_path, point_px: ImageFont.load_default(size=point_px))
+    calls: list[str] = []
+    process_char = pipeline._process_char
+
+    def counting(ch, cfg, rendered=None):
+        calls.append(ch)
+        return process_char(ch, cfg, rendered)
+
+    monkeypatch.setattr(pipeline, "_process_char", counting)
+    cfg = Config(font_path="default", point_px=60, canvas_px=80, margin_px=4, min_obj_area=4, spur_prune_len=0)
+    batch = measure_chars("LT LI", cfg, workers=1, include_polylines=True)
+
+    assert batch.records["char"].tolist() == ["L", "T", "L", "I"]
+    assert (batch.records["total_length"] > 0).all()
+    assert batch.records["total_length"][0] == batch.records["total_length"][2]
+    assert [(f.char, f.reason) for f in batch.failures] == [(" ", "empty")]
+    assert batch.polylines is not None and len(batch.polylines) == 4
+    assert sorted(calls) == [" ", "I", "L", "T"]
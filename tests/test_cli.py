@@ -0,0 +1,53 @@
+import subprocess
+import sys
+
+import pytest
+
+from font_length.cli import main
+
+_HEAVY = ("numpy", "skimage", "PIL", "tqdm", "requests")
+
+
+def _loaded_after(code: str) -> set[str]:
+    probe = f"{code}\nimport sys\nprint(' '.join(sorted({{m.split('.')[0] for m in sys.modules}})))"
+    out = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True).stdout
+    return set(out.split())
+
+
+def test_cli_import_is_light():
+    loaded = _loaded_after("import font_length.cli")
+    assert not loaded.intersection(_HEAVY + ("pydantic",))
+
+
+def test_help_does_not_load_pipeline():
+    code = "from font_length.cli import main\ntry:\n    main(['--help'])\nexcept SystemExit:\n    pass"
+    assert not _loaded_after(code).intersection(_HEAVY)
+
+
+def test_invalid_config_fails_before_heavy_imports(tmp_path):
+    config = tmp_path / "ok.json"
+    config.write_text('{"font_path": "font.otf", "skeleton_backend": "thin"}', encoding="utf-8")
+    code = (
+        "from font_length.cli import main\n"
+        "try:\n"
+        f"    main(['--config', {str(config)!r}, '--point-px', '0'])\n"
+        "except ValueError:\n"
+        "    pass\n"
+        "else:\n"
+        "    raise SystemExit('accepted')"
+    )
+    assert not _loaded_after(code).intersection(_HEAVY + ("scipy",))
+
+
+def test_report_module_is_light():
+    assert not _loaded_after("import font_length.report").intersection(_HEAVY + ("pydantic",))
+
+
+def test_worker_module_skips_parent_dependencies():
+    loaded = _loaded_after("import font_length.pipeline")
+    assert not loaded.intersection({"tqdm", "requests", "pydantic"})
+
+
+def test_missing_font_exits():
+    with pytest.raises(SystemExit):
+        main([])
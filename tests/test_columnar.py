@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from font_length.columnar import ColumnarWriter, pyarrow_available, read_columnar
+from font_length.config import Config
+from font_length.pipeline import GlyphFailure
+
+
+def _metrics(i):
+    return {
+        "char": chr(0x4E00 + i),
+        "codepoint": 0x4E00 + i,
+        "total_length": 10.0 * i,
+        "bounds": (1.0, 2.0, 3.0 + i, 4.0),
+        "polyline_count": i,
+        "skeleton_pixels": 100 + i,
+        "timings": {"render": 0.5, "skeleton": 0.25},
+    }
+
+
+@pytest.mark.parametrize(
+    "fmt",
+    [
+        "npz",
+        pytest.param("arrow", marks=pytest.mark.skipif(not pyarrow_available(), reason="pyarrow missing")),
+        pytest.param("parquet", marks=pytest.mark.skipif(not pyarrow_available(), reason="pyarrow missing")),
+    ],
+)
+def test_roundtrip_in_batches(tmp_path, fmt):
+    with ColumnarWriter(
+        tmp_path / "results", fmt, "abc123", font="/fonts/a.otf", font_sha256="f00d", batch_size=2
+    ) as writer:
+        for i in range(5):
+            writer.append(_metrics(i))
+        writer.append_failure(GlyphFailure("x", 0x78, "noskeleton"))
+    assert writer.rows_written == 6
+
+    columns = read_columnar(writer.path)
+    assert writer.path.suffix == f".{fmt}"
+    assert columns["codepoint"].dtype == np.uint32
+    assert columns["codepoint"].tolist() == [0x4E00 + i for i in range(5)] + [0x78]
+    assert list(columns["status"]) == ["ok"] * 5 + ["noskeleton"]
+    assert columns["total_length"][:5].tolist() == [0.0, 10.0, 20.0, 30.0, 40.0]
+    assert np.isnan(columns["total_length"][5]) and np.isnan(columns["bounds_w"][5])
+    assert columns["bounds_w"][:5].tolist() == [3.0, 4.0, 5.0, 6.0, 7.0]
+    assert columns["time_render"][:5].tolist() == [0.5] * 5
+    assert np.isnan(columns["time_prune"]).all()
+    assert list(columns["config_hash"]) == ["abc123"] * 6
+    assert list(columns["font"]) == ["/fonts/a.otf"] * 6
+    assert list(columns["font_sha256"]) == ["f00d"] * 6
+
+
+def test_config_hash_ignores_output_settings():
+    base = Config(font_path="/fonts/a.otf")
+    assert base.config_hash() == Config(font_path="/fonts/a.otf", out_dir="elsewhere", workers=3).config_hash()
+    assert base.config_hash() != Config(font_path="/fonts/a.otf", point_px=900).config_hash()
+
+
+def test_config_hash_uses_font_contents(tmp_path):
+    (tmp_path / "v1").mkdir()
+    (tmp_path / "v2").mkdir()
+    (tmp_path / "v1" / "font.otf").write_bytes(b"one")
+    (tmp_path / "v2" / "font.otf").write_bytes(b"two")
+    (tmp_path / "copy.otf").write_bytes(b"one")
+    v1, v2, copy = (Config(font_path=str(tmp_path / name)) for name in ("v1/font.otf", "v2/font.otf", "copy.otf"))
+    assert v1.config_hash() != v2.config_hash()
+    assert v1.config_hash() == copy.config_hash()
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from font_length.config import Config
+from font_length.estimate import estimate_stroke_length
+from font_length.pipeline import _process_char, _worker_config
+
+
+def _cross(length, width):
+    bw = np.zeros((length + 20, length + 20), dtype=bool)
+    bw[10 : 10 + length, 10 + (length - width) // 2 : 10 + (length + width) // 2] = True
+    bw[10 + (length - width) // 2 : 10 + (length + width) // 2, 10 : 10 + length] = True
+    return bw
+
+
+def test_bar_length_and_width():
+    bw = np.zeros((40, 120), dtype=bool)
+    bw[15:24, 10:110] = True
+    timings: dict[str, float] = {}
+    estimate = estimate_stroke_length(bw, 4, timings=timings)
+    assert estimate.stroke_width == pytest.approx(9.0)
+    assert estimate.length == pytest.approx(100.0, rel=0.02)
+    assert estimate.bounds == (10.0, 15.0, 99.0, 8.0)
+    assert set(timings) == {"cleanup", "estimate"}
+
+
+def test_estimate_ranks_more_ink_higher():
+    short, long = (estimate_stroke_length(_cross(n, 9), 4).length for n in (50, 150))
+    assert long > 2.5 * short
+
+
+def test_distance_engine_in_pipeline():
+    cfg = _worker_config(Config(font_path="unused.otf", engine="distance", memory_profile=True))
+    _, metrics, failure = _process_char("一", cfg, rendered=(_cross(101, 11), 0.0))
+    assert failure is None
+    assert metrics["path_d"] == "" and metrics["polyline_count"] == 0
+    assert metrics["total_length"] == pytest.approx(2 * 101 - 11, rel=0.05)
+    assert set(metrics["memory"]["traced_peak"]) == {"render", "cleanup", "estimate"}
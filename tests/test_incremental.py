@@ -0,0 +1,53 @@
+import pytest
+
+pytest.importorskip("fontTools")
+
+from conftest import build_box_font  # noqa: E402
+from font_length.config import Config  # noqa: E402
+from font_length.incremental import (  # noqa: E402
+    MANIFEST_FILENAME,
+    font_wide_hash,
+    glyph_outline_hashes,
+    save_manifest,
+)
+from font_length.report import RESULTS_FILENAME, GlyphResult, write_result_line  # noqa: E402
+from font_length.runner import _plan_incremental  # noqa: E402
+
+
+def test_only_edited_glyphs_change_hash(tmp_path):
+    old = build_box_font(tmp_path / "old.ttf", [100, 200, 300])
+    new = build_box_font(tmp_path / "new.ttf", [100, 250, 300])
+    before = glyph_outline_hashes(old, "一二三四")
+    after = glyph_outline_hashes(new, "一二三四")
+    assert before["四"] is None
+    assert [ch for ch in "一二三" if before[ch] != after[ch]] == ["二"]
+    assert font_wide_hash(old) == font_wide_hash(new)
+    assert font_wide_hash(build_box_font(tmp_path / "tall.ttf", [100, 200, 300], ascent=900)) != font_wide_hash(old)
+
+
+def _store_run(out_dir, cfg, chars):
+    out_dir.mkdir(exist_ok=True)
+    with (out_dir / RESULTS_FILENAME).open("w", encoding="utf-8") as fh:
+        for ch in chars:
+            write_result_line(
+                fh, GlyphResult(ch, ord(ch), "m0 0 5 0", f"U{ord(ch):04X}.svg", 5.0, (0.0, 0.0, 5.0, 1.0), 1, 6)
+            )
+    _, _, manifest, _ = _plan_incremental(list(chars), cfg, out_dir)
+    save_manifest(out_dir / MANIFEST_FILENAME, manifest)
+
+
+def test_plan_incremental_carries_unchanged_results(tmp_path):
+    out_dir = tmp_path / "out"
+    cfg = Config(font_path=build_box_font(tmp_path / "v1.ttf", [100, 200, 300]), out_dir=str(out_dir))
+    # "三" failed in the previous run, so it has no stored result to reuse.
+    _store_run(out_dir, cfg, "一二")
+
+    revised = cfg.model_copy(update={"font_path": build_box_font(tmp_path / "v2.ttf", [100, 250, 300])})
+    pending, carried, _, info = _plan_incremental(list("一二三"), revised, out_dir)
+    assert pending == ["二", "三"]
+    assert [res.char for res in carried] == ["一"]
+    assert info["carried_forward"] == 1 and not info["settings_changed"]
+
+    changed = revised.model_copy(update={"spur_prune_len": 3})
+    pending, carried, _, info = _plan_incremental(list("一二三"), changed, out_dir)
+    assert pending == ["一", "二", "三"] and not carried and info["settings_changed"]
@@ -0,0 +1,58 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from font_length.config import Config
+
+from font_length.memprofile import MemoryProfile, StageMemory
+from font_length.morph import skeletonize_clean
+
+
+def test_stage_memory_attributes_allocations():
+    memory = StageMemory()
+    memory.begin()
+    small = np.ones(1_000, dtype=np.uint8)
+    memory.end("small")
+    big = np.ones(4_000_000, dtype=np.uint8)
+    memory.end("big")
+    assert memory.traced_peak["big"] >= big.nbytes
+    assert memory.traced_peak["small"] < big.nbytes
+    memory.close()
+    del small, big
+
+
+def test_skeletonize_clean_records_stages():
+    bw = np.zeros((40, 40), dtype=bool)
+    bw[10:30, 18:22] = True
+    memory = StageMemory()
+    memory.begin()
+    skeletonize_clean(bw, 4, 2, memory=memory)
+    memory.close()
+    assert set(memory.to_dict()["traced_peak"]) == {"cleanup", "skeleton", "prune"}
+
+
+def test_memory_profile_keeps_worst_glyphs():
+    profile = MemoryProfile(worst=2)
+    for char, peak in [("a", 10), ("b", 50), ("c", 30)]:
+        profile.add(char, {"traced_peak": {"render": 5, "skeleton": peak}, "rss_growth": {"render": 1}})
+    summary = profile.to_dict()
+    assert summary["glyphs"] == 3
+    assert summary["stages"]["skeleton"]["max_char"] == "b"
+    assert summary["stages"]["skeleton"]["mean_traced_peak_bytes"] == 30
+    assert summary["stages"]["render"]["rss_growth_bytes"] == 3
+    assert [g["char"] for g in summary["worst_glyphs"]] == ["b", "c"]
+
+
+def test_stage_memory_stops_tracing_it_started():
+    assert not tracemalloc.is_tracing()
+    with StageMemory() as memory:
+        memory.begin()
+        memory.end("noop")
+        assert tracemalloc.is_tracing()
+    assert not tracemalloc.is_tracing()
+
+
+def test_memory_profile_rejects_thread_executor():
+    with pytest.raises(ValueError, match="process executor"):
+        Config(font_path="font.otf", memory_profile=True, executor="thread")
@@ -1,6 +1,8 @@
 import numpy as np
+import pytest
 
 from font_length.morph import _prune_spurs, skeletonize_clean
+from font_length.thinning import _thin_kernel, thin_mask
 
 
 def test_skeletonize_clean_removes_small_objects():
@@ -19,3 +21,73 @@ def test_prune_spurs_removes_short_branch():
     pruned = _prune_spurs(skel, max_len=1)
     assert not bool(pruned[1, 3])
     assert bool(pruned[2, 2])
+
+
+def test_skeletonize_clean_backend_and_timings():
+    bw = np.zeros((12, 20), dtype=bool)
+    bw[4:8, 2:18] = True
+    timings: dict[str, float] = {}
+    skel = skeletonize_clean(bw, min_obj_area=2, spur_prune_len=0, backend="thin", timings=timings)
+    assert skel.any()
+    assert set(timings) == {"cleanup", "skeleton", "prune"}
+
+
+def test_skeletonize_clean_unknown_backend():
+    with pytest.raises(ValueError):
+        skeletonize_clean(np.ones((3, 3), dtype=bool), 1, 0, backend="nope")
+
+
+@pytest.mark.parametrize("method", ["zhang-suen", "guo-hall"])
+def test_thin_mask_reduces_bar_to_line(method):
+    bw = np.zeros((11, 30), dtype=bool)
+    bw[3:8, 2:28] = True
+    thinned = thin_mask(bw, method, kernel=_thin_kernel)
+    assert thinned.any()
+    assert np.count_nonzero(thinned, axis=0).max() == 1
+    assert not (thinned & ~bw).any()
+
+
+def test_in_place_cleanup_matches_copying_cleanup():
+    bw = np.zeros((16, 16), dtype=bool)
+    bw[2:14, 6:9] = True
+    bw[7, 9:13] = True
+    bw[0, 0] = True
+    expected = skeletonize_clean(bw.copy(), min_obj_area=2, spur_prune_len=2)
+    work = bw.copy()
+    skel = skeletonize_clean(work, min_obj_area=2, spur_prune_len=2, in_place=True)
+    assert np.array_equal(skel, expected)
+    assert not bool(work[0, 0])
+
+    untouched = bw.copy()
+    skeletonize_clean(untouched, min_obj_area=2, spur_prune_len=2)
+    assert np.array_equal(untouched, bw)
+
+
+def test_registered_backend_passes_config_validation(monkeypatch):
+    from pydantic import ValidationError
+
+    from font_length import morph
+    from font_length.config import Config
+
+    monkeypatch.setitem(morph.SKELETON_BACKENDS, "identity", lambda bw: bw.copy())
+    cfg = Config(font_path="unused.otf", skeleton_backend="identity")
+    bw = np.zeros((6, 6), dtype=bool)
+    bw[1:5, 2:4] = True
+    assert (skeletonize_clean(bw, 1, 0, backend=cfg.skeleton_backend) == bw).all()
+    with pytest.raises(ValidationError, match="identity"):
+        Config(font_path="unused.otf", skeleton_backend="missing")
+
+
+def test_clean_mask_keeps_objects_of_min_area_without_warnings():
+    import warnings
+
+    from font_length.morph import clean_mask
+
+    bw = np.zeros((8, 8), dtype=bool)
+    bw[1, 1:4] = True  # 3 pixels, removed
+    bw[5, 1:5] = True  # 4 pixels, kept
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        cleaned = clean_mask(bw, 4, in_place=True)
+    assert cleaned is bw
+    assert not bw[1].any() and bw[5, 1:5].all()
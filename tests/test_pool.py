@@ -0,0 +1,84 @@
+import multiprocessing
+import os
+import time
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from font_length import pool
+from font_length.pipeline import _process_char, _WorkerConfig
+
+pytestmark = pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork", reason="workers must inherit the patched compute function"
+)
+
+
+def _fake_process_char(char, cfg, rendered=None):
+    if char == "s" and cfg.point_px == 100:
+        time.sleep(30)
+    if char == "c":
+        os._exit(1)
+    return char, {"char": char, "point_px": cfg.point_px}, None
+
+
+def _cfg(**kwargs):
+    base = dict(
+        font_path="unused",
+        point_px=100,
+        canvas_px=120,
+        margin_px=8,
+        binarize="otsu",
+        binary_threshold=128,
+        min_obj_area=4,
+        spur_prune_len=2,
+        simplify_eps=1.0,
+    )
+    base.update(kwargs)
+    return _WorkerConfig(**base)
+
+
+def _run(cfg, chunks):
+    results = {}
+    for char, metrics, failure in pool.GlyphPool(2, cfg).run(chunks):
+        results[char] = metrics if metrics is not None else failure
+    return results
+
+
+def test_timeout_and_crash_are_isolated(monkeypatch):
+    monkeypatch.setattr(pool, "_process_char", _fake_process_char)
+    results = _run(_cfg(glyph_timeout=0.5), [["a", "s", "b"], ["c", "d"], ["e"]])
+    assert results["s"].reason == "timeout"
+    assert results["c"].reason == "crash"
+    assert {"a", "b", "d", "e"} <= {ch for ch, r in results.items() if isinstance(r, dict)}
+
+
+def test_retry_at_lower_point_px(monkeypatch):
+    monkeypatch.setattr(pool, "_process_char", _fake_process_char)
+    results = _run(_cfg(glyph_timeout=0.5, retry_point_scale=0.5), [["s", "a"]])
+    assert results["s"]["point_px"] == 50
+    assert results["s"]["warnings"] == ["timeout; retried at point_px=50"]
+    assert results["a"]["point_px"] == 100
+
+
+def _fake_render_chunk(chars, cfg):
+    if "r" in chars and len(chars) > 1:
+        os._exit(1)
+    return {}
+
+
+def test_chunk_render_crash_blames_no_glyph(monkeypatch):
+    monkeypatch.setattr(pool, "_process_char", _fake_process_char)
+    monkeypatch.setattr(pool, "_render_chunk", _fake_render_chunk)
+    results = _run(_cfg(glyph_timeout=5.0), [["a", "r", "b"]])
+    assert {ch: isinstance(r, dict) for ch, r in results.items()} == {"a": True, "r": True, "b": True}
+
+
+def test_retry_rescales_skeleton_pixels():
+    bw = np.zeros((60, 120), dtype=bool)
+    bw[25:34, 10:110] = True
+    cfg = _cfg(min_obj_area=4, spur_prune_len=0, simplify_eps=0.5)
+    _, full, _ = _process_char("一", cfg, rendered=(bw.copy(), 0.0))
+    _, half, _ = _process_char("一", replace(cfg, output_scale=2.0), rendered=(bw[::2, ::2].copy(), 0.0))
+    assert half["skeleton_pixels"] == pytest.approx(full["skeleton_pixels"], rel=0.05)
+    assert half["total_length"] == pytest.approx(full["total_length"], rel=0.05)
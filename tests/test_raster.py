@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+from PIL import ImageFont
+
+from font_length import raster
+
+CHARS = "AgW.jQ% 7"
+
+
+@pytest.fixture
+def default_font(monkeypatch):
+    try:
+        ImageFont.load_default(size=10)
+    except TypeError:  # pragma: no cover - Pillow < 10.1 has no scalable default font
+        pytest.skip("scalable default font unavailable")
+    monkeypatch.setattr(raster, "_load_font", lambda font_path, point_px: ImageFont.load_default(size=point_px))
+
+
+@pytest.mark.parametrize("binarize", ["otsu", "fixed"])
+@pytest.mark.parametrize(("point_px", "canvas_px"), [(40, 64), (60, 64)])
+def test_atlas_matches_single_renders(default_font, monkeypatch, binarize, point_px, canvas_px):
+    # A tiny pixel budget forces several atlases for the batch.
+    monkeypatch.setattr(raster, "_ATLAS_MAX_PIXELS", 4 * canvas_px * canvas_px)
+    batch = raster.render_glyphs_to_binary(CHARS, "default", point_px, canvas_px, 3, binarize, 100)
+    for char, mask in zip(CHARS, batch):
+        single = raster.render_glyph_to_binary(char, "default", point_px, canvas_px, 3, binarize, 100)
+        assert mask.shape == single.shape and np.array_equal(mask, single), char
+
+
+def test_otsu_thresholds_match_skimage():
+    from skimage.filters import threshold_otsu
+
+    rng = np.random.default_rng(0)
+    cells = [rng.integers(lo, hi, size=(32, 32), dtype=np.uint8) for lo, hi in [(0, 256), (10, 90), (200, 203)]]
+    cells.append(np.where(rng.random((32, 32)) < 0.2, 255, 0).astype(np.uint8))
+    hist = np.stack([np.bincount(cell.ravel(), minlength=256) for cell in cells])
+    assert raster._otsu_thresholds(hist).tolist() == [threshold_otsu(cell) for cell in cells]
+
+
+def test_reused_buffers_match_fresh_renders(default_font):
+    # Alternate sizes of ink so a stale region of the previous glyph would show.
+    for char in "W.gA.":
+        fresh = raster.render_glyph_to_binary(char, "default", 40, 64, 3)
+        reused = raster.render_glyph_to_binary(char, "default", 40, 64, 3, reuse_buffers=True)
+        assert reused.shape == fresh.shape and np.array_equal(reused, fresh), char
+        assert not np.shares_memory(fresh, raster._render_scratch(64).mask)
@@ -0,0 +1,125 @@
+import numpy as np
+import pytest
+
+from font_length import joyo, pipeline, rasterstore
+from font_length.config import Config
+from font_length.rasterstore import RasterStore, raster_store_dir
+from font_length.runner import convert_font_to_singleline_svgs
+
+
+def test_roundtrip_across_flushes(tmp_path):
+    store = RasterStore(tmp_path / "store")
+    a = np.zeros((3, 5), dtype=bool)
+    a[1, 1:4] = True
+    b = np.eye(4, dtype=bool)
+    store.add("a", a)
+    assert store.flush() == 1
+    store.add("b", b)
+    store.add("a", ~a)  # already stored, ignored
+    assert store.flush() == 1
+
+    reopened = RasterStore(tmp_path / "store")
+    assert len(reopened) == 2
+    assert np.array_equal(reopened.get("a"), a)
+    assert np.array_equal(reopened.get("b"), b)
+    assert reopened.get("c") is None
+
+
+def test_absorb_moves_packed_mask(tmp_path):
+    store = RasterStore(tmp_path)
+    mask = np.ones((2, 9), dtype=bool)
+    metrics = {"char": "x", "packed_mask": (np.packbits(mask, axis=None).tobytes(), mask.shape)}
+    store.absorb(metrics)
+    store.flush()
+    assert "packed_mask" not in metrics
+    assert np.array_equal(RasterStore(tmp_path).get("x"), mask)
+
+
+def test_store_dir_depends_on_render_settings(tmp_path):
+    font = tmp_path / "font.otf"
+    font.write_bytes(b"fake font")
+    otsu = raster_store_dir(tmp_path, font, 100, 120, 8, "otsu", 128)
+    fixed = raster_store_dir(tmp_path, font, 100, 120, 8, "fixed", 128)
+    assert otsu != fixed
+    assert otsu == raster_store_dir(tmp_path, font, 100, 120, 8, "otsu", 64)
+
+
+def test_concurrent_stores_merge_their_masks(tmp_path):
+    first, second = RasterStore(tmp_path), RasterStore(tmp_path)
+    a, b = np.eye(3, dtype=bool), np.ones((2, 7), dtype=bool)
+    first.add("a", a)
+    second.add("b", b)
+    second.add("a", ~a)  # stored by the other run in the meantime
+    assert first.flush() == 1
+    assert second.flush() == 1
+
+    reopened = RasterStore(tmp_path)
+    assert len(reopened) == 2
+    assert np.array_equal(reopened.get("a"), a)
+    assert np.array_equal(reopened.get("b"), b)
+
+
+def test_second_run_reads_masks_from_store(box_font, tmp_path, monkeypatch):
+    monkeypatch.setattr(joyo, "get_joyo_chars", lambda url, cache: "一二三")
+    cfg = Config(
+        font_path=box_font,
+        out_dir=str(tmp_path / "out"),
+        raster_store=str(tmp_path / "store"),
+        point_px=100,
+        canvas_px=160,
+        margin_px=4,
+        min_obj_area=4,
+        spur_prune_len=0,
+        workers=1,
+        log_level="WARNING",
+    )
+    first = convert_font_to_singleline_svgs(cfg)
+
+    def render(*args, **kwargs):
+        raise AssertionError("glyph rendered despite the raster store")
+
+    monkeypatch.setattr(pipeline, "render_glyph_to_binary", render)
+    second = convert_font_to_singleline_svgs(cfg.model_copy(update={"out_dir": str(tmp_path / "again")}))
+    assert second.processed == first.processed == 3
+    assert [length for _, length, _ in second.top_lengths] == pytest.approx(
+        [length for _, length, _ in first.top_lengths]
+    )
+
+
+def test_run_flushes_masks_as_results_arrive(box_font, tmp_path, monkeypatch):
+    monkeypatch.setattr(joyo, "get_joyo_chars", lambda url, cache: "一二三")
+    monkeypatch.setattr(rasterstore, "_FLUSH_BYTES", 1)  # every mask exceeds the threshold
+    pending: list[int] = []
+    absorb = rasterstore.RasterStore.absorb
+
+    def recording_absorb(self, metrics):
+        absorb(self, metrics)
+        pending.append(len(self._pending))
+
+    monkeypatch.setattr(rasterstore.RasterStore, "absorb", recording_absorb)
+    cfg = Config(
+        font_path=box_font,
+        out_dir=str(tmp_path / "out"),
+        raster_store=str(tmp_path / "store"),
+        point_px=100,
+        canvas_px=160,
+        margin_px=4,
+        min_obj_area=4,
+        spur_prune_len=0,
+        workers=1,
+        log_level="WARNING",
+    )
+    convert_font_to_singleline_svgs(cfg)
+    assert pending == [0, 0, 0]
+    (store_dir,) = (tmp_path / "store").iterdir()
+    assert len(RasterStore(store_dir)) == 3
+
+
+def test_pending_masks_stay_below_flush_threshold(tmp_path):
+    mask = np.ones((16, 16), dtype=bool)  # 32 packed bytes
+    store = RasterStore(tmp_path, flush_bytes=100)
+    for i in range(20):
+        store.add(chr(0x4E00 + i), mask)
+        assert len(store._pending) < 4
+    store.flush()
+    assert store.masks_written == 20 and len(RasterStore(tmp_path)) == 20
@@ -0,0 +1,97 @@
+import csv
+import json
+
+import pytest
+
+from font_length.cli import main
+from font_length.pipeline import GlyphFailure
+from font_length.report import (
+    RESULTS_FILENAME,
+    GlyphResult,
+    compare_runs,
+    load_glyph_results,
+    regenerate_reports,
+    write_result_line,
+)
+
+
+def _write_run(run_dir, lengths, failures=()):
+    run_dir.mkdir(parents=True, exist_ok=True)
+    with (run_dir / RESULTS_FILENAME).open("w", encoding="utf-8") as fh:
+        for ch, length in lengths.items():
+            result = GlyphResult(
+                char=ch,
+                codepoint=ord(ch),
+                path_d="m0 0 10 0",
+                svg_filename=f"U{ord(ch):04X}.svg",
+                total_length=length,
+                bounds=(0.0, 0.0, 10.0, 10.0),
+                polyline_count=1,
+                skeleton_pixels=11,
+            )
+            write_result_line(fh, result)
+        for ch in failures:
+            write_result_line(fh, GlyphFailure(ch, ord(ch), "timeout", "slow"))
+    (run_dir / "summary.json").write_text(
+        json.dumps({"duration_seconds": 3.0, "metadata": {"stroke_width": 2.0, "point_px": 100}}), encoding="utf-8"
+    )
+
+
+def test_regenerate_reports_from_stored_results(tmp_path):
+    run = tmp_path / "run"
+    _write_run(run, {"一": 10.0, "二": 30.0, "三": 20.0}, failures=["四"])
+    results, failures = load_glyph_results(run)
+    assert [r.char for r in results] == ["一", "二", "三"] and failures[0].reason == "timeout"
+
+    summary = regenerate_reports(run, out_dir=tmp_path / "new", top_k=2)
+    assert [char for char, _, _ in summary.top_lengths] == ["二", "三"]
+    assert summary.metadata["point_px"] == 100
+    assert summary.metadata["failure_reasons"] == {"timeout": 1}
+    assert 'stroke-width="2.0"' in (tmp_path / "new" / "U4E00.svg").read_text(encoding="utf-8")
+    with (tmp_path / "new" / "stroke_length_report.csv").open(encoding="utf-8") as fh:
+        assert len(list(csv.reader(fh))) == 4
+    assert load_glyph_results(tmp_path / "new")[0] == results
+
+
+def test_compare_runs_orders_by_delta(tmp_path):
+    _write_run(tmp_path / "a", {"一": 10.0, "二": 30.0, "五": 5.0})
+    _write_run(tmp_path / "b", {"一": 12.0, "二": 20.0, "六": 6.0})
+    deltas = compare_runs(tmp_path / "b", tmp_path / "a")
+    assert [(d.char, d.delta) for d in deltas] == [("二", -10.0), ("一", 2.0), ("五", None), ("六", None)]
+
+
+def test_report_subcommand(tmp_path):
+    _write_run(tmp_path / "a", {"一": 10.0})
+    _write_run(tmp_path / "b", {"一": 15.0})
+    main(["report", str(tmp_path / "b"), "--compare", str(tmp_path / "a")])
+    rows = list(csv.reader((tmp_path / "b" / "length_deltas.csv").open(encoding="utf-8")))
+    assert rows[1] == ["一", "4E00", "10.000", "15.000", "5.000", "1.5000"]
+
+    main(["report", str(tmp_path / "a"), "--stroke-width", "3", "--no-svg"])
+    summary = json.loads((tmp_path / "a" / "summary.json").read_text(encoding="utf-8"))
+    assert summary["metadata"]["stroke_width"] == 3.0
+    assert not (tmp_path / "a" / "U4E00.svg").exists()
+
+
+def test_regenerate_reports_defaults_and_missing_svgs(tmp_path):
+    run = tmp_path / "run"
+    _write_run(run, {"一": 10.0, "二": 30.0, "三": 20.0})
+    summary_path = run / "summary.json"
+    summary = json.loads(summary_path.read_text(encoding="utf-8"))
+    summary["metadata"]["top_k"] = 1
+    summary_path.write_text(json.dumps(summary), encoding="utf-8")
+
+    summary = regenerate_reports(run, out_dir=tmp_path / "new", write_svgs=False)
+    assert summary.top_lengths == [("二", 30.0, "")]
+    assert summary.metadata["top_k"] == 1
+    with (tmp_path / "new" / "stroke_length_report.csv").open(encoding="utf-8") as fh:
+        assert {row[3] for row in list(csv.reader(fh))[1:]} == {""}
+    assert load_glyph_results(tmp_path / "new")[0][0].svg_filename == "U4E00.svg"
+
+
+def test_report_cli_reports_missing_results(tmp_path):
+    _write_run(tmp_path / "new", {"一": 10.0})
+    (tmp_path / "old").mkdir()
+    with pytest.raises(SystemExit) as excinfo:
+        main(["report", str(tmp_path / "new"), "--compare", str(tmp_path / "old")])
+    assert RESULTS_FILENAME in str(excinfo.value.code) and str(tmp_path / "old") in str(excinfo.value.code)
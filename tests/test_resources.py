@@ -0,0 +1,36 @@
+import pytest
+
+from font_length import resources
+from font_length.config import Config
+
+
+def test_parse_memory_size():
+    assert resources.parse_memory_size("512M") == 512 * 1024**2
+    assert resources.parse_memory_size("1.5GiB") == int(1.5 * 1024**3)
+    assert resources.parse_memory_size("2048") == 2048
+    with pytest.raises(ValueError):
+        resources.parse_memory_size("lots")
+
+
+def test_estimate_scales_measurement_by_canvas_area():
+    base = resources._BASE_WORKER_BYTES
+    measured = {1000: base + 100}
+    assert resources.estimate_worker_peak_bytes(1000, measured) == base + 100
+    assert resources.estimate_worker_peak_bytes(2000, measured) == base + 400
+    assert resources.estimate_worker_peak_bytes(100) > base
+
+
+def test_auto_workers_respects_memory_budget(monkeypatch):
+    monkeypatch.setattr(resources, "cpu_limit", lambda: 64)
+    monkeypatch.setattr(resources, "available_memory_bytes", lambda: 16 * 1024**3)
+    per_worker = resources.estimate_worker_peak_bytes(4000)
+    assert resources.auto_workers(4000) == int(16 * 1024**3 * resources._MEMORY_HEADROOM) // per_worker
+    assert resources.auto_workers(4000, max_memory=per_worker * 3) == 3
+    assert resources.auto_workers(4000, max_memory=1) == 1
+    assert resources.auto_workers(200) == 64
+
+
+def test_config_parses_max_memory():
+    cfg = Config(font_path="font.otf", max_memory="4G", workers=3)
+    assert cfg.max_memory == 4 * 1024**3
+    assert cfg.resolved_workers() == 3
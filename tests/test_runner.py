@@ -0,0 +1,75 @@
+import json
+import time
+
+import pytest
+
+from font_length import joyo, pipeline, runner
+from font_length.config import Config
+from font_length.runner import convert_font_to_singleline_svgs
+
+
+@pytest.fixture
+def run(box_font, tmp_path, monkeypatch):
+    monkeypatch.setattr(joyo, "get_joyo_chars", lambda url, cache: "一二三")
+
+    def convert(**overrides):
+        cfg = Config(
+            font_path=box_font,
+            out_dir=str(tmp_path / "out"),
+            point_px=100,
+            canvas_px=160,
+            margin_px=4,
+            min_obj_area=4,
+            spur_prune_len=0,
+            schedule="input",
+            log_level="WARNING",
+            **overrides,
+        )
+        return convert_font_to_singleline_svgs(cfg)
+
+    return convert
+
+
+@pytest.mark.parametrize(("executor", "workers"), [("thread", 2), ("process", 1)])
+def test_in_process_runs_keep_per_worker_peak(run, tmp_path, executor, workers):
+    memory_path = tmp_path / "out" / "worker_memory.json"
+    memory_path.parent.mkdir()
+    memory_path.write_text(json.dumps({"peaks": {"160": 123}}), encoding="utf-8")
+    summary = run(executor=executor, workers=workers)
+    assert summary.processed == 3
+    assert json.loads(memory_path.read_text(encoding="utf-8")) == {"peaks": {"160": 123}}
+
+
+def test_thread_executor_runs_all_chunks(monkeypatch):
+    monkeypatch.setattr(pipeline, "_process_char", lambda ch, cfg, rendered=None: (ch, {"char": ch}, None))
+    cfg = pipeline._worker_config(Config(font_path="font.otf", executor="thread"))
+    assert cfg.executor == "thread"
+    results = list(runner._iter_process_chars("abcde", cfg, 3, chunks=[["a", "b"], ["c"], ["d", "e"]]))
+    assert sorted(ch for ch, _, _ in results) == ["a", "b", "c", "d", "e"]
+
+
+def test_thread_executor_load_counts_glyphs(monkeypatch):
+    def slow(ch, cfg, rendered=None):
+        time.sleep(0.02)
+        return ch, {"char": ch}, None
+
+    class Load:
+        interval = 0.005
+
+        def __init__(self):
+            self.samples = []
+
+        def set_load(self, in_flight, queued):
+            self.samples.append((in_flight, queued))
+
+        def tick(self):
+            pass
+
+    monkeypatch.setattr(pipeline, "_process_char", slow)
+    cfg = pipeline._worker_config(Config(font_path="font.otf", executor="thread"))
+    load = Load()
+    chunks = [list("abcd"), list("efgh")]
+    assert len(list(runner._iter_process_chars("abcdefgh", cfg, 2, chunks=chunks, telemetry=load))) == 8
+    assert load.samples[0] == (2, 6)
+    assert all(in_flight <= 2 and in_flight + queued <= 8 for in_flight, queued in load.samples)
+    assert min(in_flight + queued for in_flight, queued in load.samples) < 8
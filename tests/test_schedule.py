@@ -0,0 +1,33 @@
+from font_length.schedule import (
+    load_glyph_costs,
+    order_longest_first,
+    plan_chunks,
+    save_glyph_costs,
+    simulate_schedule,
+)
+
+
+def test_order_longest_first_uses_median_for_unknown():
+    costs = {"a": 1.0, "b": 5.0, "c": 3.0}
+    assert order_longest_first(["a", "x", "b", "c"], costs) == ["b", "x", "c", "a"]
+
+
+def test_plan_chunks_isolates_heavy_glyphs():
+    costs = {"H": 10.0, "a": 1.0, "b": 1.0, "c": 1.0, "d": 1.0}
+    chunks = plan_chunks(["H", "a", "b", "c", "d"], costs, workers=2, chunks_per_worker=1)
+    assert chunks[0] == ["H"]
+    assert [ch for chunk in chunks for ch in chunk] == ["H", "a", "b", "c", "d"]
+
+
+def test_simulate_schedule_longest_first_shrinks_tail():
+    _, input_tail = simulate_schedule([1, 1, 1, 1, 6], workers=2)
+    _, sorted_tail = simulate_schedule([6, 1, 1, 1, 1], workers=2)
+    assert sorted_tail < input_tail
+
+
+def test_costs_roundtrip_merges(tmp_path):
+    path = tmp_path / "glyph_costs.json"
+    save_glyph_costs(path, {"a": 0.5})
+    save_glyph_costs(path, {"b": 0.25})
+    assert load_glyph_costs(path) == {"a": 0.5, "b": 0.25}
+    assert load_glyph_costs(tmp_path / "missing.json") == {}
@@ -0,0 +1,58 @@
+import io
+
+from font_length.svgout import polylines_to_svg_path_d, write_svg_path_d
+
+POLYLINES = [[(0.0, 0.0), (3.0, 4.0), (3.0, 10.0)], [(5.0, 5.0), (6.5, 5.25)]]
+
+
+def _decode(path_d: str) -> list[list[tuple[float, float]]]:
+    runs: list[list[tuple[float, float]]] = []
+    pen = (0.0, 0.0)
+    relative = False
+    tokens = path_d.replace("M", " M ").replace("m", " m ").replace("L", " ").replace("l", " ").split()
+    i = 0
+    while i < len(tokens):
+        if tokens[i] in {"M", "m"}:
+            relative = tokens[i] == "m"
+            runs.append([])
+            i += 1
+            continue
+        x, y = float(tokens[i]), float(tokens[i + 1])
+        pen = (pen[0] + x, pen[1] + y) if relative else (x, y)
+        runs[-1].append(pen)
+        i += 2
+    return runs
+
+
+def test_absolute_explicit_layout():
+    assert polylines_to_svg_path_d(POLYLINES, 0) == "M 0 0 L 3 4 L 3 10 M 5 5 L 6.5 5.25"
+
+
+def test_relative_implicit_roundtrip():
+    path_d = polylines_to_svg_path_d(POLYLINES, 0, precision=2, relative=True, implicit_lineto=True)
+    assert path_d.startswith("m0 0 3 4 0 6 m2 -5")
+    assert _decode(path_d) == POLYLINES
+
+
+def test_integer_precision_and_buffer():
+    buffer = io.StringIO()
+    buffer.write("<")
+    write_svg_path_d([[(1.4, 2.6), (-0.2, 8.0)]], buffer, simplify_eps=0, precision=0, implicit_lineto=True)
+    assert buffer.getvalue() == "<M1 3 0 8"
+
+
+def test_empty_polylines():
+    assert polylines_to_svg_path_d([[(1.0, 1.0)]]) == ""
+
+
+def test_worker_config_defaults_match_config():
+    from dataclasses import MISSING, fields
+
+    from font_length.config import Config
+    from font_length.pipeline import _WorkerConfig
+
+    for f in fields(_WorkerConfig):
+        # ``executor`` is resolved from ``"auto"`` by the parent.
+        if f.default is MISSING or f.name not in Config.model_fields or f.name == "executor":
+            continue
+        assert f.default == Config.model_fields[f.name].default, f.name
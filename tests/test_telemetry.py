@@ -0,0 +1,41 @@
+import json
+
+from font_length.pipeline import GlyphFailure
+from font_length.telemetry import LiveMetrics
+
+
+def _feed(metrics):
+    metrics.set_load(2, 5)
+    metrics.record({"timings": {"render": 0.003, "skeleton": 0.2}})
+    metrics.record({"timings": {"render": 0.004, "skeleton": 0.3}})
+    metrics.record(None, GlyphFailure("x", ord("x"), "timeout"))
+
+
+def test_jsonl_snapshots(tmp_path):
+    path = tmp_path / "metrics.jsonl"
+    metrics = LiveMetrics(path, total=10, interval=3600)
+    _feed(metrics)
+    metrics.close()
+    snapshots = [json.loads(line) for line in path.read_text().splitlines()]
+    # One snapshot when the first result arrives, one on close.
+    assert len(snapshots) == 2
+    last = snapshots[-1]
+    assert last["completed"] == 3 and last["total"] == 10
+    assert last["failures"] == {"timeout": 1}
+    assert last["in_flight"] == 0 and last["queue_depth"] == 0
+    assert last["glyphs_per_second"] > 0
+    assert last["stage_latency"]["skeleton"]["buckets"]["0.25"] == 1
+    assert last["stage_latency"]["skeleton"]["buckets"]["0.5"] == 1
+
+
+def test_prometheus_textfile(tmp_path):
+    path = tmp_path / "font_length.prom"
+    metrics = LiveMetrics(path, total=10, interval=0)
+    _feed(metrics)
+    text = path.read_text()
+    assert "font_length_glyphs_completed_total 3" in text
+    assert "font_length_in_flight 2" in text and "font_length_queue_depth 5" in text
+    assert 'font_length_failures_total{reason="timeout"} 1' in text
+    assert 'font_length_stage_seconds_bucket{stage="render",le="0.005"} 2' in text
+    assert 'font_length_stage_seconds_bucket{stage="skeleton",le="+Inf"} 2' in text
+    assert not path.with_suffix(".prom.tmp").exists()
@@ -1,6 +1,8 @@
 import numpy as np
+import pytest
 
-from font_length.vectorize import rdp, skeleton_to_polylines
+from font_length.measure import total_length
+from font_length.vectorize import merge_polylines, rdp, skeleton_to_polylines
 
 
 def test_skeleton_to_polylines_line():
@@ -24,3 +26,54 @@ def test_rdp_reduces_points():
     points = [(0.0, 0.0), (1.0, 0.1), (2.0, 0.0)]
     simplified = rdp(points, 0.2)
     assert simplified == [(0.0, 0.0), (2.0, 0.0)]
+
+
+def _line(a, b):
+    (x0, y0), (x1, y1) = a, b
+    steps = int(max(abs(x1 - x0), abs(y1 - y0)))
+    return [(x0 + (x1 - x0) * i / steps, y0 + (y1 - y0) * i / steps) for i in range(steps + 1)]
+
+
+def test_merge_polylines_joins_straight_continuations():
+    # Four arms of a plus sign meeting at (10, 10).
+    arms = [_line((0.0, 10.0), (10.0, 10.0)), _line((20.0, 10.0), (10.0, 10.0))]
+    arms += [_line((10.0, 0.0), (10.0, 10.0)), _line((10.0, 10.0), (10.0, 20.0))]
+    merged = merge_polylines(arms)
+    assert len(merged) == 2
+    assert sorted((line[0], line[-1]) for line in merged) == [
+        ((0.0, 10.0), (20.0, 10.0)),
+        ((10.0, 0.0), (10.0, 20.0)),
+    ]
+    assert total_length(merged) == pytest.approx(total_length(arms))
+
+
+def test_merge_polylines_keeps_sharp_turns_apart():
+    arms = [_line((0.0, 0.0), (10.0, 0.0)), _line((10.0, 0.0), (10.0, 10.0)), _line((10.0, 0.0), (20.0, 1.0))]
+    merged = merge_polylines(arms, max_turn_deg=30.0)
+    assert len(merged) == 2
+    assert any(line[0] == (0.0, 0.0) and line[-1] == (20.0, 1.0) for line in merged)
+
+
+def test_merge_polylines_collapses_junction_bridge():
+    # Skeleton of an X: the crossing is split into two junctions by a short bridge.
+    bridge = _line((9.0, 10.0), (11.0, 10.0))
+    arms = [_line((0.0, 0.0), (9.0, 10.0)), _line((0.0, 20.0), (9.0, 10.0))]
+    arms += [_line((20.0, 0.0), (11.0, 10.0)), _line((20.0, 20.0), (11.0, 10.0))]
+    merged = merge_polylines(arms + [bridge], micro_len=3.0)
+    assert len(merged) == 2
+    assert all((10.0, 10.0) in line for line in merged)
+    assert sorted((line[0], line[-1]) for line in merged) == [
+        ((0.0, 0.0), (20.0, 20.0)),
+        ((0.0, 20.0), (20.0, 0.0)),
+    ]
+
+
+def test_merge_polylines_closes_loops():
+    # A circle traced as two half circles that meet at both ends.
+    angles = np.linspace(0.0, np.pi, 65)
+    upper = [(round(40 * float(np.cos(t)), 6), round(40 * float(np.sin(t)), 6)) for t in angles]
+    lower = [(x, -y) for x, y in upper]
+    merged = merge_polylines([upper, lower])
+    assert len(merged) == 1
+    assert merged[0][0] == merged[0][-1]
+    assert len(merged[0]) == len(upper) + len(lower) - 1